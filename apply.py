@@ -5,27 +5,31 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 
+import charts
+
 # 自定义CSS样式
-st.markdown("""
-<style>
-    .metric-card {
-        background-color: white;
-        padding: 20px;
-        border-radius: 10px;
-        box-shadow: 2px 2px 10px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    .metric-value {
-        font-size: 24px;
-        font-weight: bold;
-        color: #1f77b4;
-    }
-    .metric-label {
-        font-size: 14px;
-        color: #666;
-    }
-</style>
-""", unsafe_allow_html=True)
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .metric-card {
+            background-color: white;
+            padding: 20px;
+            border-radius: 10px;
+            box-shadow: 2px 2px 10px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .metric-value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #1f77b4;
+        }
+        .metric-label {
+            font-size: 14px;
+            color: #666;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
 # 生成模拟数据
 def generate_data():
@@ -97,6 +101,7 @@ def load_market_share_data():
     return payment_data, retail_data, travel_data, service_data
 
 def main():
+    load_css()
     # 主标题
     st.title("AI在电商与内容平台的应用分析")
 
@@ -125,7 +130,7 @@ def main():
         fig1.update_layout(title='AI应用效果趋势',
                           xaxis_title='日期',
                           yaxis_title='百分比(%)')
-        st.plotly_chart(fig1, use_container_width=True)
+        charts.plotly_chart(fig1, use_container_width=True)
         
         # 抖音指标
         st.subheader("AI广告创意引擎效果")
@@ -159,7 +164,7 @@ def main():
         fig2.update_layout(title='内容审核效果趋势',
                           xaxis_title='日期',
                           yaxis_title='百分比(%)')
-        st.plotly_chart(fig2, use_container_width=True)
+        charts.plotly_chart(fig2, use_container_width=True)
         
         # 小红书指标
         st.subheader("AI图文助手效果")
@@ -186,7 +191,7 @@ def main():
             color_discrete_sequence=['rgb(33, 150, 243)', 'rgb(76, 175, 80)', 'rgb(244, 67, 54)', 'rgb(158, 158, 158)']
         )
         fig_payment.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_payment, use_container_width=True)
+        charts.plotly_chart(fig_payment, use_container_width=True)
         
         # 智慧零售市场
         st.subheader("智慧零售市场份额分布")
@@ -198,7 +203,7 @@ def main():
             color_discrete_sequence=['rgb(255, 87, 34)', 'rgb(233, 30, 99)', 'rgb(244, 67, 54)', 'rgb(255, 193, 7)', 'rgb(158, 158, 158)']
         )
         fig_retail.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_retail, use_container_width=True)
+        charts.plotly_chart(fig_retail, use_container_width=True)
         
         # 智慧出行市场
         st.subheader("智慧出行市场份额分布")
@@ -210,7 +215,7 @@ def main():
             color_discrete_sequence=['rgb(255, 87, 34)', 'rgb(33, 150, 243)', 'rgb(255, 193, 7)', 'rgb(63, 81, 181)', 'rgb(158, 158, 158)']
         )
         fig_travel.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_travel, use_container_width=True)
+        charts.plotly_chart(fig_travel, use_container_width=True)
         
         # 智能客服市场
         st.subheader("智能客服市场份额分布")
@@ -222,7 +227,7 @@ def main():
             color_discrete_sequence=['rgb(33, 150, 243)', 'rgb(255, 87, 34)', 'rgb(76, 175, 80)', 'rgb(244, 67, 54)', 'rgb(158, 158, 158)']
         )
         fig_service.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_service, use_container_width=True)
+        charts.plotly_chart(fig_service, use_container_width=True)
         
         # 市场分析总结
         st.markdown("### 市场格局分析要点")
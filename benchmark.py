@@ -0,0 +1,194 @@
+"""页面性能基准测试
+
+不启动浏览器，用 Streamlit 的 AppTest 在当前进程中逐个执行 main.py 菜单中各页面的 main()，
+报告每个页面的：
+- 冷启动耗时：清空数据、增量读取、预测、相关性与图表缓存后的第一次运行；
+- 热运行耗时：缓存就绪后重复运行 N 次的中位数与最大值；
+- 峰值内存：运行期间 Python 分配（含 numpy）的峰值（tracemalloc）。tracemalloc 会使运行慢数倍，
+  因此计时的运行不开启，峰值内存在计时之后单独运行一遍（冷启动一次、热运行一次）测量；
+- 图表数据量：页面输出的全部 plotly 图表序列化后的总字节数；
+- 缓存内存：运行后进程内缓存（memory_budget）的估算总大小。
+
+命令行用法::
+
+    python benchmark.py                         # 全部页面，热运行 5 次
+    python benchmark.py gpu pdd --runs 10       # 只测指定页面
+    python benchmark.py --tabs                  # 每个选项卡分别计时
+    python benchmark.py --data /tmp/scaled      # 使用另一个数据目录（如合成的放大数据）
+                                                # 放大数据由 python -m datasets synth /tmp/scaled --factor 100 生成
+    python benchmark.py --json result.json      # 结果另存为 JSON
+    python benchmark.py --max-warm-ms 500       # 有页面热运行中位数超过 500ms 时以状态码 1 退出
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# 与 datasets.paths.DATA_DIR_ENV 相同；须在导入 datasets 之前设置，因此这里不导入 datasets
+DATA_DIR_ENV = "AI_PLATFORM_DATA_DIR"
+# 单次运行的超时时间（秒）
+RUN_TIMEOUT = 600
+
+
+def _script(module_name):
+    return f"import sys\nsys.path.insert(0, {ROOT!r})\nimport {module_name}\n{module_name}.main()\n"
+
+
+def clear_caches():
+    """清空进程内的各级缓存，使下一次运行为冷启动（磁盘上的二进制/预测缓存保留）"""
+    import charts
+    import correlation
+    import datasets
+    import forecasting
+
+    datasets.clear_cache()
+    datasets.reset_incremental()
+    charts.clear_figure_cache()
+    correlation.clear_correlation_cache()
+    forecasting.clear_forecast_cache()
+
+
+def _payload_bytes(app):
+    """页面输出的全部 plotly 图表的 JSON 字节数"""
+    total = 0
+    for element in app.get("plotly_chart"):
+        proto = element.proto
+        spec = getattr(proto, "spec", "") or getattr(getattr(proto, "figure", None), "spec", "")
+        total += len(spec.encode("utf-8"))
+    return total
+
+
+def _timed_run(app):
+    """运行一次，返回秒数（不开启 tracemalloc）"""
+    start = time.perf_counter()
+    app.run(timeout=RUN_TIMEOUT)
+    return time.perf_counter() - start
+
+
+def _traced_run(app):
+    """在 tracemalloc 下运行一次，返回峰值内存字节数"""
+    tracemalloc.start()
+    try:
+        app.run(timeout=RUN_TIMEOUT)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _peak(app):
+    """单独测量峰值内存：清空缓存后冷启动一次、热运行一次，取两者的最大值"""
+    clear_caches()
+    return max(_traced_run(app), _traced_run(app))
+
+
+def _errors(app):
+    return [str(getattr(e, "message", e)) for e in app.exception]
+
+
+def _lazy_tab_keys(app):
+    """页面中 lazy_tabs 选项卡栏的 key 与选项卡数"""
+    return [(radio.key, len(radio.options)) for radio in app.radio if radio.label == "lazy-tabs"]
+
+
+def _result(name, cold, warm, peak, payload, errors):
+    import memory_budget
+
+    return {
+        "page": name,
+        "cold_ms": cold * 1000,
+        "warm_ms": statistics.median(warm) * 1000 if warm else None,
+        "warm_max_ms": max(warm) * 1000 if warm else None,
+        "peak_mb": peak / 2 ** 20,
+        "payload_kb": payload / 1024,
+        "cache_mb": memory_budget.info()["bytes"] / 2 ** 20,
+        "errors": errors,
+    }
+
+
+def bench_page(module_name, runs=5, tabs=False):
+    """测试一个页面，返回结果字典的列表（tabs=True 时每个选项卡另有一条）"""
+    from streamlit.testing.v1 import AppTest
+
+    clear_caches()
+    app = AppTest.from_string(_script(module_name), default_timeout=RUN_TIMEOUT)
+    cold = _timed_run(app)
+    warm = [_timed_run(app) for _ in range(runs)]
+    results = [_result(module_name, cold, warm, _peak(app), _payload_bytes(app), _errors(app))]
+
+    if tabs:
+        for key, count in _lazy_tab_keys(app):
+            for index in range(1, count):
+                app.radio(key=key).set_value(index)
+                # 冷启动为首次切换到该选项卡（页面其余部分的缓存已就绪）
+                cold = _timed_run(app)
+                warm = [_timed_run(app) for _ in range(runs)]
+                results.append(_result(f"{module_name}[{key}={index}]", cold, warm, _peak(app),
+                                       _payload_bytes(app), _errors(app)))
+            app.radio(key=key).set_value(0)
+    return results
+
+
+def menu_modules():
+    """main.py 菜单中的全部页面模块"""
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        from lazy_imports import _menu_modules
+        return _menu_modules()
+    finally:
+        os.chdir(cwd)
+
+
+def format_report(results):
+    lines = [f"{'页面':<32}{'冷启动':>10}{'热运行':>10}{'热最大':>10}{'峰值内存':>10}{'图表数据':>10}{'缓存内存':>10}"]
+    for r in results:
+        warm = f"{r['warm_ms']:>8.0f}ms" if r["warm_ms"] is not None else f"{'-':>10}"
+        warm_max = f"{r['warm_max_ms']:>8.0f}ms" if r["warm_max_ms"] is not None else f"{'-':>10}"
+        lines.append(f"{r['page']:<32}{r['cold_ms']:>8.0f}ms{warm}{warm_max}"
+                     f"{r['peak_mb']:>8.1f}MB{r['payload_kb']:>8.0f}KB{r['cache_mb']:>8.1f}MB")
+        for error in r["errors"]:
+            lines.append(f"    错误: {error}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="页面性能基准测试")
+    parser.add_argument("pages", nargs="*", help="页面模块名，默认为菜单中的全部页面")
+    parser.add_argument("--runs", type=int, default=5, help="热运行次数")
+    parser.add_argument("--tabs", action="store_true", help="每个选项卡分别计时")
+    parser.add_argument("--data", help="数据目录，默认为仓库内的 data/")
+    parser.add_argument("--json", help="把结果另存为 JSON 文件")
+    parser.add_argument("--max-warm-ms", type=float, help="热运行中位数的上限，超过时以状态码 1 退出")
+    args = parser.parse_args(argv)
+
+    if args.data:
+        os.environ[DATA_DIR_ENV] = os.path.abspath(args.data)
+    sys.path.insert(0, ROOT)
+
+    results = []
+    for page in args.pages or menu_modules():
+        page_results = bench_page(page, runs=args.runs, tabs=args.tabs)
+        # 逐页输出进度（不含表头），最后再输出完整报告
+        print(format_report(page_results).split("\n", 1)[1], flush=True)
+        results.extend(page_results)
+
+    print()
+    print(format_report(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failed = [r for r in results if r["errors"]]
+    slow = [r for r in results if args.max_warm_ms is not None and r["warm_ms"] is not None
+            and r["warm_ms"] > args.max_warm_ms]
+    for r in slow:
+        print(f"超出上限: {r['page']} 热运行 {r['warm_ms']:.0f}ms > {args.max_warm_ms:.0f}ms")
+    return 1 if failed or slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
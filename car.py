@@ -4,6 +4,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 
+import charts
+
 def load_sales_data():
     # 各地区年度销量数据
     sales_data = pd.DataFrame({
@@ -43,41 +45,44 @@ def load_region_data():
     return region_data
 
 # 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #2196F3;
-        text-align: center;
-        margin-bottom: 1.5rem;
-        font-weight: bold;
-        text-shadow: 1px 1px 2px #ccc;
-    }
-    .metric-card {
-        background-color: white;
-        border-radius: 8px;
-        padding: 1.2rem;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        text-align: center;
-        border-left: 5px solid #2196F3;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        color: #1976D2;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    .insight-card {
-        background-color: #f8f9fa;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-left: 4px solid #2196F3;
-    }
-</style>
-""", unsafe_allow_html=True)
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 2.5rem;
+            color: #2196F3;
+            text-align: center;
+            margin-bottom: 1.5rem;
+            font-weight: bold;
+            text-shadow: 1px 1px 2px #ccc;
+        }
+        .metric-card {
+            background-color: white;
+            border-radius: 8px;
+            padding: 1.2rem;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+            text-align: center;
+            border-left: 5px solid #2196F3;
+        }
+        .sub-header {
+            font-size: 1.8rem;
+            color: #1976D2;
+            margin-top: 2rem;
+            margin-bottom: 1rem;
+        }
+        .insight-card {
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            padding: 1rem;
+            margin: 1rem 0;
+            border-left: 4px solid #2196F3;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
 def main():
+    load_css()
     # 页面标题
     st.markdown("<h1 class='main-header'>新能源汽车市场分析</h1>", unsafe_allow_html=True)
 
@@ -120,7 +125,7 @@ def main():
             showlegend=True
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
         
         # 计算年度增长率
         total_sales = sales_data[regions].sum(axis=1)
@@ -157,7 +162,7 @@ def main():
             height=500
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
         
         st.markdown("<div class='insight-card'>", unsafe_allow_html=True)
         st.markdown("**市场格局分析：**")
@@ -197,7 +202,7 @@ def main():
             yaxis_range=[0, 100]
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
         
         st.markdown("<div class='insight-card'>", unsafe_allow_html=True)
         st.markdown("**功能渗透分析：**")
@@ -257,7 +262,7 @@ def main():
             height=500
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        charts.plotly_chart(fig, use_container_width=True)
         
         st.markdown("<div class='insight-card'>", unsafe_allow_html=True)
         st.markdown("**数据采集能力分析：**")
@@ -0,0 +1,271 @@
+"""图表输出
+
+页面统一通过 plotly_chart() 输出 plotly 图表，参数与 st.plotly_chart 相同。
+序列化之前，点数超过 MAX_POINTS 的折线轨迹用 LTTB（Largest-Triangle-Three-Buckets）
+降采样到 MAX_POINTS 个点：保留首尾点，每个桶中选取与前一选中点、下一桶均值构成三角形面积最大的点，
+峰值和拐点都会保留，图表的形状基本不变，而传给浏览器的数据量不再随历史长度增长。
+
+需要查看细节时，勾选侧边栏的“完整精度”（full_resolution_toggle()）即按原始数据输出，
+放大后可以看到每一个点。
+
+降采样之后点数仍超过 WEBGL_MIN_POINTS 的散点/折线轨迹（散点图、完整精度下的长折线）
+改用 WebGL 渲染（Scattergl），SVG 在几万个点以上时基本无法交互。
+
+cached_chart() 在此基础上缓存处理好的图表，键为 (图表 id, 数据指纹, 控件状态)，
+数据和筛选条件不变时重跑页面直接复用，不再重新构建。缓存的是图表序列化后的 JSON（fig.to_json()），
+命中时用 pio.from_json() 重建，各会话拿到的是各自的图表，修改它不会影响缓存。缓存在进程内、各会话共享，
+按最近最少使用淘汰，总大小（估算）不超过 FIGURE_CACHE_MAX_BYTES，并计入 memory_budget 的全局预算。
+一次构建多个图表的函数用 cached_figures() 装饰，共用同一缓存。
+"""
+import functools
+import hashlib
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+import memory_budget
+import profiling
+
+# 每条折线轨迹最多输出的点数，约为常见图表宽度（像素）的两倍
+MAX_POINTS = 2000
+# 点数达到该值的 scatter 轨迹改用 WebGL（Scattergl）渲染
+WEBGL_MIN_POINTS = 10000
+# 图表缓存的总大小上限（字节，按 JSON 长度计）
+FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# 侧边栏“完整精度”开关在 session_state 中的键
+FULL_RESOLUTION_KEY = "charts_full_resolution"
+# 与数据点一一对应、降采样时需要一并筛选的轨迹属性
+_POINT_ATTRIBUTES = ("x", "y", "customdata", "text", "hovertext", "ids")
+_MARKER_ATTRIBUTES = ("color", "size", "symbol", "opacity")
+
+
+def lttb_indices(x, y, n_out):
+    """LTTB 降采样，返回保留的点的下标（升序）；x 须为升序数值"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # 除首尾两点外的 n-2 个点分成 n_out-2 个桶
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def _as_number(values):
+    """把 x 轴数据转换为 float 数组（日期按纳秒计），无法转换（如类别轴）时返回 None"""
+    values = np.asarray(values)
+    if values.dtype.kind in "iuf":
+        return values.astype(float)
+    if values.dtype.kind == "O":
+        try:
+            values = pd.to_datetime(values).to_numpy()
+        except (TypeError, ValueError):
+            return None
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return None
+
+
+def _is_line(trace):
+    return trace.type in ("scatter", "scattergl") and "lines" in (trace.mode or "lines")
+
+
+def _take(trace, attributes, n, indices):
+    for name in attributes:
+        values = trace[name]
+        if values is not None and not isinstance(values, str) and np.ndim(values) == 1 and len(values) == n:
+            trace[name] = np.asarray(values)[indices]
+
+
+def downsample_trace(trace, max_points=MAX_POINTS):
+    """对一条折线轨迹做 LTTB 降采样（原地修改），点数未超过 max_points 或无法降采样时不变"""
+    if not _is_line(trace) or trace.x is None or trace.y is None:
+        return trace
+    n = len(trace.y)
+    if n <= max_points or len(trace.x) != n:
+        return trace
+    x = _as_number(trace.x)
+    try:
+        y = np.asarray(trace.y, dtype=float)
+    except (TypeError, ValueError):
+        return trace
+    # 类别轴、乱序或含缺失值（折线断开处）时不降采样，避免改变图形
+    if x is None or np.isnan(y).any() or np.isnan(x).any() or (np.diff(x) < 0).any():
+        return trace
+    indices = lttb_indices(x, y, max_points)
+    _take(trace, _POINT_ATTRIBUTES, n, indices)
+    _take(trace.marker, _MARKER_ATTRIBUTES, n, indices)
+    return trace
+
+
+def _can_use_webgl(trace):
+    # 堆叠面积图和平滑曲线在 Scattergl 中不受支持，转换后图形会变
+    return trace.type == "scatter" and trace.stackgroup is None and trace.line.shape in (None, "linear")
+
+
+def to_webgl(trace, min_points=WEBGL_MIN_POINTS):
+    """点数达到 min_points 的 scatter 轨迹转换为 Scattergl，返回新轨迹；其余轨迹原样返回"""
+    if not _can_use_webgl(trace) or trace.y is None or len(trace.y) < min_points:
+        return trace
+    props = trace.to_plotly_json()
+    props.pop("type", None)
+    return go.Scattergl(props, skip_invalid=True)
+
+
+def full_resolution():
+    """是否按原始数据输出（侧边栏“完整精度”开关）"""
+    return bool(st.session_state.get(FULL_RESOLUTION_KEY, False))
+
+
+def full_resolution_toggle():
+    """在侧边栏显示“完整精度”开关"""
+    st.sidebar.checkbox("完整精度（放大查看全部数据点）", key=FULL_RESOLUTION_KEY,
+                        help=f"关闭时，超过 {MAX_POINTS} 个点的折线会降采样后再显示")
+
+
+def prepare_figure(fig, max_points=MAX_POINTS, webgl_min_points=WEBGL_MIN_POINTS):
+    """长折线降采样、点数仍很多的轨迹改用 WebGL，返回处理后的图表
+
+    需要降采样时在副本上进行，传入的图表不变。
+    """
+    if not full_resolution():
+        # 只有折线轨迹会降采样；饼图等轨迹没有 y 属性
+        if any(_is_line(trace) and trace.y is not None and len(trace.y) > max_points for trace in fig.data):
+            fig = go.Figure(fig)
+        for trace in fig.data:
+            downsample_trace(trace, max_points)
+    traces = [to_webgl(trace, webgl_min_points) for trace in fig.data]
+    if any(new is not old for new, old in zip(traces, fig.data)):
+        fig = go.Figure(data=traces, layout=fig.layout)
+    return fig
+
+
+def plotly_chart(fig, max_points=MAX_POINTS, webgl_min_points=WEBGL_MIN_POINTS, **kwargs):
+    """输出 plotly 图表（先经 prepare_figure() 处理），其余参数原样传给 st.plotly_chart"""
+    with profiling.timed(f"chart:{kwargs.get('key', 'plotly_chart')}", "chart"):
+        return st.plotly_chart(prepare_figure(fig, max_points, webgl_min_points), **kwargs)
+
+
+# ---- 图表缓存 ----
+
+# memory_budget 中的池，条目为 key -> 图表的 JSON（见 _to_cache()）
+FIGURE_POOL = "figure"
+
+
+def fingerprint(data):
+    """数据内容的指纹：DataFrame / Series / 数组 / 它们组成的元组，None 返回 None"""
+    if data is None:
+        return None
+    sha1 = hashlib.sha1()
+    for item in data if isinstance(data, (tuple, list)) else (data,):
+        if isinstance(item, pd.DataFrame):
+            sha1.update(repr((list(item.columns), list(item.dtypes.astype(str)))).encode())
+            sha1.update(pd.util.hash_pandas_object(item, index=True).to_numpy().tobytes())
+        elif isinstance(item, pd.Series):
+            sha1.update(repr((item.name, str(item.dtype))).encode())
+            sha1.update(pd.util.hash_pandas_object(item, index=True).to_numpy().tobytes())
+        elif isinstance(item, np.ndarray):
+            sha1.update(repr((item.dtype.str, item.shape)).encode())
+            sha1.update(np.ascontiguousarray(item).tobytes())
+        else:
+            sha1.update(repr(item).encode())
+    return sha1.hexdigest()
+
+
+class _FigureJSON(str):
+    """缓存中的图表：fig.to_json() 的结果"""
+
+
+def _to_cache(value):
+    """缓存的形式：图表换成 JSON 字符串，字典、元组、列表逐项转换，其余原样保留"""
+    if isinstance(value, go.Figure):
+        return _FigureJSON(value.to_json())
+    if isinstance(value, dict):
+        return {k: _to_cache(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_cache(v) for v in value)
+    return value
+
+
+def _from_cache(value):
+    """_to_cache() 的逆过程：每次从 JSON 重建新的图表，调用方修改它不会影响缓存"""
+    if isinstance(value, _FigureJSON):
+        return pio.from_json(value)
+    if isinstance(value, dict):
+        return {k: _from_cache(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_from_cache(v) for v in value)
+    return value
+
+
+def _get_figures(key):
+    value = memory_budget.get(FIGURE_POOL, key)
+    return None if value is None else _from_cache(value)
+
+
+def _put_figures(key, value):
+    cached = _to_cache(value)
+    memory_budget.put(FIGURE_POOL, key, cached, nbytes=memory_budget.sizeof(cached),
+                      pool_max_bytes=FIGURE_CACHE_MAX_BYTES)
+
+
+def cached_figures(func):
+    """按参数（DataFrame 按内容指纹）缓存 func 构建的图表，代替 st.cache_data
+
+    与 cached_chart() 共用图表缓存与内存预算。图表以 JSON 形式缓存，每次访问重建一份新的图表，
+    调用方可以修改返回的图表。
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        key = (name, fingerprint(args))
+        result = _get_figures(key)
+        if result is None:
+            with profiling.timed(f"chart-build:{name}", "chart"):
+                result = func(*args)
+            _put_figures(key, result)
+        return result
+    return wrapper
+
+
+def cached_chart(chart_id, build, data=None, state=(), max_points=MAX_POINTS,
+                 webgl_min_points=WEBGL_MIN_POINTS, **kwargs):
+    """输出缓存的图表
+
+    build: 无参数、返回 plotly 图表的函数，只在缓存未命中时调用
+    data: 图表所依赖的数据（DataFrame 等，见 fingerprint()）
+    state: 影响图表的其他控件状态（可 repr 的值）
+    其余参数原样传给 st.plotly_chart，key 默认为 chart_id
+    """
+    with profiling.timed(f"chart:{chart_id}", "chart"):
+        key = (chart_id, fingerprint(data), repr(state), full_resolution(), max_points, webgl_min_points)
+        fig = _get_figures(key)
+        if fig is None:
+            with profiling.timed(f"chart-build:{chart_id}", "chart"):
+                fig = prepare_figure(build(), max_points, webgl_min_points)
+            _put_figures(key, fig)
+        kwargs.setdefault("key", chart_id)
+        return st.plotly_chart(fig, **kwargs)
+
+
+def figure_cache_info():
+    """返回缓存的图表数与估算总大小（字节）"""
+    pool = memory_budget.info()["pools"].get(FIGURE_POOL, {"entries": 0, "bytes": 0})
+    return {"figures": pool["entries"], "bytes": pool["bytes"]}
+
+
+def clear_figure_cache():
+    """清空图表缓存"""
+    memory_budget.clear(FIGURE_POOL)
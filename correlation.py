@@ -0,0 +1,97 @@
+"""斯皮尔曼相关性分析
+
+每列只排名一次，对排名矩阵一次性计算全部两两相关系数，并由 t 分布一次性得到全部 p 值，
+结果与 scipy.stats.spearmanr 逐对计算一致。结果按 (所选列, 数据内容) 缓存在内存中，
+同一份筛选结果下，热力图与逐对的详细结果共用一次计算。
+
+返回的结果为字典::
+
+    {'corr': 相关系数矩阵, 'pvalue': p值矩阵, 'n': 参与计算的样本数}
+
+两个矩阵均为以列名为行列索引的 DataFrame。含缺失值的行整行剔除后再计算。
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import profiling
+from lazy_imports import lazy_import
+
+stats = lazy_import("scipy.stats")
+
+# 内存中最多保留的结果数，超出时淘汰最久未使用的
+MAX_ENTRIES = 128
+
+_lock = threading.Lock()
+# key -> 相关性结果
+_memory = OrderedDict()
+
+
+def data_key(df, columns):
+    """所选列的列名 + 数据内容的哈希，作为缓存键"""
+    sha1 = hashlib.sha1(repr(list(columns)).encode())
+    sha1.update(pd.util.hash_pandas_object(df[list(columns)], index=False).to_numpy().tobytes())
+    return sha1.hexdigest()
+
+
+def compute_spearman(df, columns):
+    """计算所选列两两之间的斯皮尔曼相关系数及双侧 p 值（不使用缓存）"""
+    columns = list(columns)
+    data = df[columns].apply(pd.to_numeric, errors='coerce').dropna()
+    n = len(data)
+    ranks = data.rank(method='average').to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if n > 1:
+            corr = np.corrcoef(ranks, rowvar=False).reshape(len(columns), len(columns))
+        else:
+            corr = np.full((len(columns), len(columns)), np.nan)
+        corr = np.clip(corr, -1.0, 1.0)
+        dof = n - 2
+        t = corr * np.sqrt(dof / ((1.0 - corr) * (1.0 + corr)))
+        pvalue = 2 * stats.t.sf(np.abs(t), dof) if dof > 0 else np.full_like(corr, np.nan)
+    np.fill_diagonal(pvalue, 0.0 if dof > 0 else np.nan)
+    return {
+        "corr": pd.DataFrame(corr, index=columns, columns=columns),
+        "pvalue": pd.DataFrame(pvalue, index=columns, columns=columns),
+        "n": n,
+    }
+
+
+@profiling.profiled("groupby")
+def spearman(df, columns):
+    """斯皮尔曼相关性分析，结果按 (所选列, 数据内容) 缓存"""
+    key = data_key(df, columns)
+    with _lock:
+        result = _memory.get(key)
+        if result is not None:
+            _memory.move_to_end(key)
+            return result
+    result = compute_spearman(df, columns)
+    with _lock:
+        _memory[key] = result
+        while len(_memory) > MAX_ENTRIES:
+            _memory.popitem(last=False)
+    return result
+
+
+def pair(result, var1, var2):
+    """从结果中取出一对变量的 (相关系数, p值)"""
+    return result["corr"].at[var1, var2], result["pvalue"].at[var1, var2]
+
+
+def pairs(result):
+    """依次返回每对不同变量的 (变量1, 变量2, 相关系数, p值)"""
+    columns = result["corr"].columns
+    for var1 in columns:
+        for var2 in columns:
+            if var1 != var2:
+                yield (var1, var2) + pair(result, var1, var2)
+
+
+def clear_correlation_cache():
+    """清空内存中的相关性缓存"""
+    with _lock:
+        _memory.clear()
@@ -0,0 +1,41 @@
+"""共享数据访问层
+
+各页面和离线分析脚本统一通过这里读取数据文件，每个文件在进程内只解析、清洗一次；
+各 CSV 的列类型在 datasets.schemas 中声明，解析时一次完成类型转换；
+解析结果以二进制格式缓存在 data/.cache/ 下，跨进程复用；
+常用的分组汇总由 datasets.rollups 增量维护；持续追加写入的文件由 datasets.tail 增量读取；
+压测用的放大数据由 datasets.synthetic 生成。
+"""
+from .binary_cache import read_csv
+from .cache import cache_info, clear_cache, writable
+from .loaders import (
+    by_region,
+    load_ai_adoption,
+    load_ai_capabilities,
+    load_ai_models,
+    load_ai_patents,
+    load_drone,
+    load_education_funding,
+    load_food_ai,
+    load_gpu_filter,
+    load_gpu_ranking,
+    load_manufacturing_trends,
+    load_market_share,
+    load_nsf_rd,
+    load_pdd_gmv,
+    load_pdd_rollups,
+    load_smart_living,
+    load_traffic,
+    load_traffic_store,
+    load_unicorns,
+    read_dataset,
+    reset_incremental,
+)
+from .partitions import aggregate_partitions, partition_files
+from .paths import DATA_DIR, data_path
+from .range_filter import RangeFilter
+from .rollups import Rollup
+from .schemas import PATENT_SHARE_COLUMN, SCHEMAS, CsvSchema, schema_for
+from .synthetic import scale_frame, synthesize
+from .tail import TailReader
+from .timeseries import TimeSeriesStore
@@ -0,0 +1,49 @@
+"""数据缓存与合成数据命令行，用法见 datasets.binary_cache 和 datasets.synthetic"""
+import argparse
+import os
+import sys
+
+from . import binary_cache
+from .binary_cache import build_all, clean, is_available, status
+from .paths import DATA_DIR
+from .synthetic import synthesize
+
+
+def synth(argv):
+    parser = argparse.ArgumentParser(prog="python -m datasets synth", description="生成放大的合成数据")
+    parser.add_argument("target", help="输出目录，之后可用 AI_PLATFORM_DATA_DIR 或 benchmark.py --data 指向它")
+    parser.add_argument("--factor", type=int, default=10, help="放大倍数")
+    parser.add_argument("--partitions", type=int, default=0, help="为分区目录（如 traffic/）生成的分区数")
+    parser.add_argument("--max-rows", type=int, help="每个文件的行数上限")
+    parser.add_argument("--seed", type=int, default=0, help="随机数种子")
+    args = parser.parse_args(argv)
+    for key, result in synthesize(args.target, args.factor, partitions=args.partitions,
+                                  seed=args.seed, max_rows=args.max_rows):
+        print(f"{key}: {result}")
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "build"
+    if command in ("build", "status") and not is_available():
+        print("未安装 pyarrow，无法生成二进制缓存")
+        return 1
+    if command == "build":
+        for path, result in build_all():
+            print(f"{os.path.relpath(path, DATA_DIR)}: {result}")
+    elif command == "status":
+        for path, state in status():
+            print(f"{os.path.relpath(path, DATA_DIR)}: {state}")
+    elif command == "synth":
+        return synth(argv[1:])
+    elif command == "clean":
+        print(f"已删除 {clean()} 个缓存文件")
+    else:
+        print(binary_cache.__doc__)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
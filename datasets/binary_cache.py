@@ -0,0 +1,216 @@
+"""CSV 的列式二进制缓存
+
+首次读取某个 CSV 时用 pandas 解析，并把结果写成未压缩的 Feather(Arrow IPC) 文件，
+保存在 data/.cache/ 下；之后的读取直接以内存映射方式打开该文件，不再解析文本。
+缓存旁边的 .json 记录了源文件的修改时间、大小和 SHA-1，源文件变化后自动重建：
+修改时间变了但内容没变（例如重新检出）时只更新记录，不重建。
+
+同一文件用不同的 read_csv 参数读取会生成不同的缓存文件。
+未安装 pyarrow 时直接回退到 pd.read_csv，行为不变。
+
+命令行用法::
+
+    python -m datasets build    # 为 data/ 下全部 CSV 生成缓存
+    python -m datasets status   # 查看各 CSV 的缓存状态
+    python -m datasets clean    # 删除全部缓存
+"""
+import hashlib
+import importlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+from .paths import DATA_DIR
+
+CACHE_DIR = DATA_DIR / ".cache"
+
+# 缓存格式版本，修改写入方式时递增，使旧缓存失效
+FORMAT_VERSION = 1
+
+# 只保护 _path_locks 本身
+_lock = threading.Lock()
+_arrow = None
+# 缓存文件 -> 该缓存的锁：同一缓存同时只有一个线程解析、写入，不同文件互不阻塞
+_path_locks = {}
+
+
+def _load_arrow():
+    """按需导入 pyarrow；未安装时返回 None"""
+    global _arrow
+    if _arrow is None:
+        try:
+            _arrow = (importlib.import_module("pyarrow"), importlib.import_module("pyarrow.feather"))
+        except ImportError:
+            _arrow = False
+    return _arrow or None
+
+
+def is_available():
+    """是否可以使用二进制缓存（需要 pyarrow）"""
+    return _load_arrow() is not None
+
+
+def _file_digest(path):
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def _cache_paths(path, options):
+    """返回 (缓存文件, 记录文件) 路径，文件名由源路径和读取参数决定"""
+    try:
+        source = os.path.relpath(path, DATA_DIR)
+    except ValueError:
+        source = os.path.abspath(path)
+    key = json.dumps({"source": source, "options": options, "version": FORMAT_VERSION},
+                     sort_keys=True, default=str, ensure_ascii=False)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    base = os.path.join(CACHE_DIR, f"{stem}.{digest}")
+    return base + ".feather", base + ".json"
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, write):
+    """先写临时文件再替换，避免其他进程读到写了一半的缓存"""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _write_meta(meta_path, meta):
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+    _write_atomic(meta_path, write)
+
+
+def _is_fresh(path, cache_path, meta_path):
+    """缓存是否仍对应源文件当前内容"""
+    meta = _read_meta(meta_path)
+    if meta is None or meta.get("version") != FORMAT_VERSION or not os.path.exists(cache_path):
+        return False
+    st = os.stat(path)
+    if meta.get("mtime_ns") == st.st_mtime_ns and meta.get("size") == st.st_size:
+        return True
+    if meta.get("size") != st.st_size or meta.get("sha1") != _file_digest(path):
+        return False
+    # 内容未变，只是修改时间变了：更新记录，下次不必再计算哈希
+    meta["mtime_ns"] = st.st_mtime_ns
+    _write_meta(meta_path, meta)
+    return True
+
+
+def _write_cache(df, path, cache_path, meta_path):
+    pa, feather = _load_arrow()
+    st = os.stat(path)
+    digest = _file_digest(path)
+    table = pa.Table.from_pandas(df)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # 不压缩，读取时才能直接内存映射
+    _write_atomic(cache_path, lambda tmp: feather.write_feather(table, tmp, compression="uncompressed"))
+    _write_meta(meta_path, {
+        "version": FORMAT_VERSION,
+        "source": os.fspath(path),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha1": digest,
+        "rows": len(df),
+    })
+
+
+def _path_lock(cache_path):
+    with _lock:
+        return _path_locks.setdefault(cache_path, threading.Lock())
+
+
+def read_csv(path, **options):
+    """读取 CSV，优先使用二进制缓存；参数与 pd.read_csv 相同"""
+    path = os.fspath(path)
+    arrow = _load_arrow()
+    if arrow is None:
+        return pd.read_csv(path, **options)
+    pa, feather = arrow
+
+    cache_path, meta_path = _cache_paths(path, options)
+    with _path_lock(cache_path):
+        if _is_fresh(path, cache_path, meta_path):
+            try:
+                return feather.read_table(cache_path, memory_map=True).to_pandas()
+            except (OSError, pa.ArrowException):
+                pass  # 缓存损坏，重新解析
+
+        df = pd.read_csv(path, **options)
+        try:
+            _write_cache(df, path, cache_path, meta_path)
+        except (OSError, TypeError, ValueError, pa.ArrowException):
+            # 无法转换为 Arrow 的列（如混合类型）或目录不可写时只是不缓存
+            pass
+        return df
+
+
+def source_files(data_dir=DATA_DIR):
+    """data/ 下的全部 CSV 文件（不含缓存目录）"""
+    files = []
+    for root, dirs, names in os.walk(data_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        files.extend(os.path.join(root, name) for name in sorted(names) if name.lower().endswith(".csv"))
+    return files
+
+
+def build_all(options_for=None):
+    """为 data/ 下全部 CSV 生成缓存，返回 [(文件, 行数或错误信息), ...]
+
+    options_for(path) 返回该文件的 read_csv 参数，默认使用各加载函数登记的参数。
+    """
+    if options_for is None:
+        from .loaders import read_options
+        options_for = read_options
+    results = []
+    for path in source_files():
+        try:
+            results.append((path, len(read_csv(path, **options_for(path)))))
+        except (OSError, ValueError, pd.errors.ParserError) as e:
+            results.append((path, f"失败: {e}"))
+    return results
+
+
+def clean():
+    """删除全部缓存文件，返回删除的文件数"""
+    removed = 0
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            os.remove(os.path.join(CACHE_DIR, name))
+            removed += 1
+    return removed
+
+
+def status(options_for=None):
+    """返回 [(文件, 状态), ...]，状态为 '最新' / '过期' / '无缓存'"""
+    if options_for is None:
+        from .loaders import read_options
+        options_for = read_options
+    results = []
+    for path in source_files():
+        cache_path, meta_path = _cache_paths(path, options_for(path))
+        if not os.path.exists(cache_path):
+            state = "无缓存"
+        else:
+            state = "最新" if _is_fresh(path, cache_path, meta_path) else "过期"
+        results.append((path, state))
+    return results
@@ -0,0 +1,133 @@
+"""进程级数据缓存
+
+每个数据集在一个进程内只解析、清洗一次，所有页面和会话共享同一份结果。
+缓存键为 (数据集名称, 文件路径)，并记录文件的修改时间；文件被修改后下次访问会自动重新加载。
+路径为目录（分区数据）时，目录中任一文件被修改、增加或删除都会重新加载。
+基于数据集构建的索引等对象同样按文件修改时间缓存，见 cached_resource()。
+
+两者都存放在 memory_budget 中（池 "dataset" / "resource"），按估算大小计入全局内存预算，
+超出预算时淘汰最久未使用的，下次访问时重新加载；pinned=True 的（GPU 排行、NSF 表、GMV 与
+交通历史等各会话都要用的大数据集）常驻内存，不参与淘汰。
+
+缓存的数据集是只读的，每次访问返回共享底层数组的浅拷贝，不复制数据：新增列、筛选照常可用，
+原地修改已有列前须先用 writable() 取得这些列的私有副本（写时复制），其余列仍与缓存共享。
+
+同一文件在 MTIME_CHECK_SECONDS 内只检查一次修改时间，一次重跑中多次访问不再重复 stat。
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+import memory_budget
+import profiling
+
+# 加载过程加锁，同一数据集不会被多个会话同时解析
+_lock = threading.RLock()
+# memory_budget 中的池，条目为 (name, path) -> (mtime_ns, 对象)
+DATASET_POOL = "dataset"
+RESOURCE_POOL = "resource"
+# 两次检查同一文件修改时间的最小间隔（秒）
+MTIME_CHECK_SECONDS = 1.0
+
+# path -> (检查时刻, mtime_ns)
+_mtimes = {}
+
+
+def _freeze(df):
+    """将 DataFrame 底层的 numpy 数组设为只读，防止调用方原地修改缓存内容"""
+    for block in getattr(df._mgr, "blocks", ()):
+        values = getattr(block, "values", None)
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    index_values = getattr(df.index, "_data", None)
+    if isinstance(index_values, np.ndarray):
+        index_values.flags.writeable = False
+    return df
+
+
+def _view(df):
+    """返回共享底层数据的浅拷贝：调用方可以新增列、筛选，但不会影响缓存"""
+    return df.copy(deep=False)
+
+
+def writable(df, *columns):
+    """返回 df 的浅拷贝，其中 columns（不给出时为全部列）换成可原地修改的私有副本，其余列仍与缓存共享"""
+    df = df.copy(deep=False)
+    for col in columns or list(df.columns):
+        df[col] = df[col].copy(deep=True)
+    return df
+
+
+def _mtime(path):
+    """文件的修改时间；目录（如分区数据）取其自身及其中文件的最新修改时间"""
+    mtime = os.stat(path).st_mtime_ns
+    if os.path.isdir(path):
+        for entry in os.scandir(path):
+            if entry.is_file():
+                mtime = max(mtime, entry.stat().st_mtime_ns)
+    return mtime
+
+
+def _checked_mtime(path):
+    """_mtime()，但同一路径在 MTIME_CHECK_SECONDS 内复用上次的结果"""
+    now = time.monotonic()
+    checked = _mtimes.get(path)
+    if checked is not None and now - checked[0] < MTIME_CHECK_SECONDS:
+        return checked[1]
+    mtime = _mtime(path)
+    _mtimes[path] = (now, mtime)
+    return mtime
+
+
+def _cached(pool, name, path, build, pinned, finish=None):
+    """按 (name, path, mtime) 在 pool 中缓存 build(path)，返回缓存的对象
+
+    缓存命中时不加锁；未命中时加锁后再检查一次，同一数据集只构建一次。
+    finish: 放入缓存前对结果的处理（如 _freeze），在估算大小之后进行
+    """
+    path = os.fspath(path)
+    mtime = _checked_mtime(path)
+    key = (name, path)
+    with profiling.timed(f"load:{name}", "loader"):
+        entry = memory_budget.get(pool, key)
+        if entry is None or entry[0] != mtime:
+            with _lock:
+                entry = memory_budget.get(pool, key)
+                if entry is None or entry[0] != mtime:
+                    value = build(path)
+                    nbytes = memory_budget.sizeof(value)
+                    if finish is not None:
+                        value = finish(value)
+                    entry = memory_budget.put(pool, key, (mtime, value), nbytes=nbytes, pinned=pinned)
+    return entry[1]
+
+
+def cached_dataset(name, path, build, pinned=False):
+    """按 (name, path, mtime) 缓存 build(path) 的结果，返回只读视图
+
+    pinned: 常驻内存，不参与内存预算的淘汰
+    """
+    # 大小在冻结之前估算：pandas 3 之前无法对只读的 object 列做 deep 统计
+    return _view(_cached(DATASET_POOL, name, path, build, pinned, finish=_freeze))
+
+
+def cached_resource(name, path, build, pinned=False):
+    """按 (name, path, mtime) 缓存 build(path) 构建的对象（如索引），原样返回、不做拷贝
+
+    返回的对象在会话间共享，调用方不应修改。
+    """
+    return _cached(RESOURCE_POOL, name, path, build, pinned)
+
+
+def clear_cache():
+    """清空进程级数据缓存"""
+    memory_budget.clear(DATASET_POOL)
+    memory_budget.clear(RESOURCE_POOL)
+    _mtimes.clear()
+
+
+def cache_info():
+    """返回当前缓存的数据集及其行数"""
+    return {name: len(frame) for (name, _), (_, frame), _ in memory_budget.items(DATASET_POOL)}
@@ -0,0 +1,275 @@
+"""各数据集的加载与清洗
+
+每个函数对应一个数据文件，返回已清洗、类型确定的 DataFrame（只读视图）。
+解析和清洗在进程内只做一次，见 datasets.cache；CSV 文本的解析结果另外保存为
+二进制缓存，跨进程复用，见 datasets.binary_cache。
+GPU 排行、NSF 表、GMV 与交通历史及其索引各会话都要用，以 pinned=True 常驻内存，不参与预算淘汰。
+"""
+import numpy as np
+import pandas as pd
+
+from .binary_cache import read_csv
+from .cache import cached_dataset, cached_resource
+from .partitions import aggregate_partitions, partition_files
+from .paths import data_path
+from .range_filter import RangeFilter
+from .rollups import Rollup
+from .schemas import schema_for
+from .tail import TailReader
+from .timeseries import TimeSeriesStore
+
+NSF_RD_CSV = data_path("nsf25326-tab001.csv")
+AI_MODELS_CSV = data_path("专利教育", "历年知名AI模型数量_地区对比.csv")
+AI_PATENTS_CSV = data_path("专利教育", "全球AI专利占比_按地区.csv")
+EDUCATION_FUNDING_CSV = data_path("专利教育", "china_education_funding.csv")
+GPU_RANKING_CSV = data_path("gpu排行.csv")
+PDD_GMV_CSV = data_path("pdd_data.csv")
+TRAFFIC_CSV = data_path("traffic_data.csv")
+# 按区划分的交通数据，每个区一个与 traffic_data.csv 结构相同的 CSV
+TRAFFIC_PARTITION_DIR = data_path("traffic")
+SMART_LIVING_CSV = data_path("smart_living_data.csv")
+MANUFACTURING_TRENDS_CSV = data_path("manufacturing_trends.csv")
+DRONE_CSV = data_path("drone_data.csv")
+FOOD_AI_CSV = data_path("food_ai_data.csv")
+AI_CAPABILITIES_CSV = data_path("ai_capabilities.csv")
+MARKET_SHARE_CSV = data_path("market_share.csv")
+AI_ADOPTION_CSV = data_path("ai_adoption.csv")
+UNICORNS_CSV = data_path("主要国家独角兽公司数量.csv")
+
+
+def read_options(path):
+    """返回某个文件按 schema 生成的 read_csv 参数，未登记的文件返回空字典"""
+    schema = schema_for(path)
+    return schema.read_options() if schema is not None else {}
+
+
+def read_dataset(path):
+    """按登记的 schema 读取 data/ 下的 CSV（经由二进制缓存）"""
+    schema = schema_for(path)
+    if schema is None:
+        return read_csv(path)
+    return schema.check(read_csv(path, **schema.read_options()))
+
+
+def _build_nsf_rd(path):
+    # 标题行、千位分隔符和列类型由 schema 在解析时处理
+    df = read_dataset(path)
+    # 去除年份后的字母（如e, f）
+    df['Year'] = df['Year'].str[:4].astype(int)
+    return df
+
+
+def load_nsf_rd():
+    """美国GDP与研发投入（NSF 表1）
+
+    列: Year(int) 以及 NSF_RD_COLUMNS 中其余各列(float)，单位为十亿美元或占GDP百分比。
+    """
+    return cached_dataset("nsf_rd", NSF_RD_CSV, _build_nsf_rd, pinned=True)
+
+
+def load_ai_models():
+    """历年知名AI模型数量（按地区）
+
+    列: 年份(int), 地区(category), 知名AI模型数量(int)
+    """
+    return cached_dataset("ai_models", AI_MODELS_CSV, read_dataset)
+
+
+def load_ai_patents():
+    """全球AI专利占比（按地区）
+
+    列: 年份(int), 地区(category), AI专利占比(占全球总数百分比)(float)
+    """
+    return cached_dataset("ai_patents", AI_PATENTS_CSV, read_dataset)
+
+
+def _build_education_funding(path):
+    df = read_dataset(path)
+    df = pd.melt(df, id_vars=['指标'], var_name='年份', value_name='经费')
+    df['年份'] = df['年份'].str.replace('年', '').astype(int)
+    return df
+
+
+def load_education_funding():
+    """中国教育经费（长表）
+
+    列: 指标(str), 年份(int), 经费(float, 万元)
+    """
+    return cached_dataset("education_funding", EDUCATION_FUNDING_CSV, _build_education_funding)
+
+
+# 显卡名称第二个词 -> NVIDIA 系列
+GPU_SERIES_BY_TOKEN = {
+    'GeForce': 'GeForce',
+    'Tesla': 'Tesla',
+    'Quadro': 'Quadro',
+    'TITAN': 'TITAN',
+    'A': 'A Series',
+    'H': 'H Series',
+}
+
+# GeForce 代数，按顺序匹配显卡名称中的子串
+GPU_GENERATIONS = [
+    ('RTX 5', 'RTX 5000'),
+    ('RTX 4', 'RTX 4000'),
+    ('RTX 3', 'RTX 3000'),
+    ('RTX 2', 'RTX 2000'),
+    ('GTX 16', 'GTX 1600'),
+    ('GTX 10', 'GTX 1000'),
+]
+
+
+def _gpu_series(names, second):
+    series = second.map(GPU_SERIES_BY_TOKEN)
+    # 第二个词为 RTX 的非 Quadro 卡归为专业卡；其余含 Jetson 的归为 Jetson
+    rtx = series.isna() & (second == 'RTX') & ~names.str.contains('Quadro', regex=False)
+    series = series.mask(rtx, 'RTX Professional')
+    jetson = series.isna() & second.notna() & names.str.contains('Jetson', regex=False)
+    series = series.mask(jetson, 'Jetson')
+    return series.fillna('Other')
+
+
+def _gpu_generation(names):
+    conditions = [names.str.contains(pattern, regex=False).to_numpy() for pattern, _ in GPU_GENERATIONS]
+    labels = [label for _, label in GPU_GENERATIONS]
+    return pd.Series(np.select(conditions, labels, default='Other'), index=names.index)
+
+
+def _build_gpu_ranking(path):
+    df = read_dataset(path)
+    names = df['显卡名称']
+    words = names.str.extract(r'^\s*(\S+)(?:\s+(\S+))?')
+    # 制造商为名称的第一个词
+    df['制造商'] = words[0].astype('category')
+    df['系列'] = _gpu_series(names, words[1]).astype('category')
+    df['代数'] = _gpu_generation(names).astype('category')
+    return df
+
+
+def load_gpu_ranking():
+    """GPU 推理性能排行
+
+    列: 显卡名称(str), 显卡数量(int), 每秒总token(float), 显卡平均token(float), 排名(int)，
+    以及加载时从显卡名称解析出的 制造商、系列(NVIDIA 系列)、代数(GeForce 代数)，均为 category。
+    """
+    return cached_dataset("gpu_ranking", GPU_RANKING_CSV, _build_gpu_ranking, pinned=True)
+
+
+# GPU 排行侧边栏的筛选条件
+GPU_RANGE_COLUMNS = ['显卡平均token', '显卡数量', '排名']
+GPU_CATEGORY_COLUMNS = ['制造商']
+
+
+def load_gpu_filter():
+    """GPU 排行的筛选索引（RangeFilter），与 load_gpu_ranking() 的数据同步更新"""
+    return cached_resource(
+        "gpu_filter", GPU_RANKING_CSV,
+        lambda path: RangeFilter(load_gpu_ranking(), GPU_RANGE_COLUMNS, GPU_CATEGORY_COLUMNS),
+        pinned=True,
+    )
+
+
+# pdd_data.csv 持续追加写入：文件变化后只解析新追加的行；进程内首次读取经由二进制缓存
+_pdd_tail = TailReader(PDD_GMV_CSV, seed=lambda: read_csv(PDD_GMV_CSV, **read_options(PDD_GMV_CSV)),
+                       **read_options(PDD_GMV_CSV))
+
+
+def load_pdd_gmv():
+    """拼多多月度转化率与 GMV
+
+    列: date(datetime) 以及转化率、GMV、AI 贡献等数值列
+    """
+    return cached_dataset("pdd_gmv", PDD_GMV_CSV, lambda path: schema_for(path).check(_pdd_tail.read()),
+                          pinned=True)
+
+
+# 拼多多数据的汇总粒度与汇总列
+PDD_ROLLUP_LEVELS = {"year": "year", "month": "month", "day": lambda df: df["date"].dt.normalize()}
+PDD_ROLLUP_COLUMNS = ["total_gmv", "ai_contributed_gmv", "pdd_conversion", "industry_avg_conversion"]
+# 在进程内持续存在，文件追加新行后只汇总新增部分
+_pdd_rollup = Rollup(PDD_ROLLUP_LEVELS, PDD_ROLLUP_COLUMNS)
+
+
+def load_pdd_rollups():
+    """拼多多数据按 year/month/day 的增量汇总（Rollup），与 load_pdd_gmv() 的数据同步更新"""
+    return cached_resource("pdd_rollups", PDD_GMV_CSV, lambda path: _pdd_rollup.sync(load_pdd_gmv()),
+                           pinned=True)
+
+
+def reset_incremental():
+    """丢弃拼多多数据的增量读取与增量汇总，下次加载时从头解析、汇总（如基准测试的冷启动）"""
+    _pdd_tail.reset()
+    _pdd_rollup.reset()
+
+
+def load_traffic():
+    """城市交通月度指标
+
+    列: date(datetime), congestion_index, response_time, accident_rate, wait_time, reaction_time, year, month
+    """
+    return cached_dataset("traffic", TRAFFIC_CSV, read_dataset, pinned=True)
+
+
+TRAFFIC_COLUMNS = ["congestion_index", "response_time", "accident_rate", "wait_time", "reaction_time"]
+
+
+def load_traffic_store():
+    """城市交通指标的时间索引存储（TimeSeriesStore），与数据文件同步更新
+
+    data/traffic/ 下有分区文件时，各区在进程池中并行汇总后合并为全市数据
+    （store.frame 为各日全市均值）；否则读取 traffic_data.csv。
+    """
+    if partition_files(TRAFFIC_PARTITION_DIR):
+        return cached_resource(
+            "traffic_store", TRAFFIC_PARTITION_DIR,
+            lambda path: TimeSeriesStore.from_rollup(
+                aggregate_partitions(partition_files(path), read_options(TRAFFIC_CSV), TRAFFIC_COLUMNS)),
+            pinned=True,
+        )
+    return cached_resource("traffic_store", TRAFFIC_CSV,
+                           lambda path: TimeSeriesStore(load_traffic(), TRAFFIC_COLUMNS), pinned=True)
+
+
+def load_smart_living():
+    """智能家居/社区/楼宇年度指标，以 Year 为索引"""
+    return cached_dataset("smart_living", SMART_LIVING_CSV, read_dataset)
+
+
+def load_manufacturing_trends():
+    """智能制造年度指标，以 Year(str，含 2025E 等预测年份) 为索引"""
+    return cached_dataset("manufacturing_trends", MANUFACTURING_TRENDS_CSV, read_dataset)
+
+
+def load_drone():
+    """无人机市场年度指标，以 Year 为索引"""
+    return cached_dataset("drone", DRONE_CSV, read_dataset)
+
+
+def load_food_ai():
+    """AI+食品（溯源、配送、农业、厨房）年度指标，以 Year 为索引"""
+    return cached_dataset("food_ai", FOOD_AI_CSV, read_dataset)
+
+
+def load_ai_capabilities():
+    """机器人各应用领域的技术成熟度与应用效果提升"""
+    return cached_dataset("ai_capabilities", AI_CAPABILITIES_CSV, read_dataset)
+
+
+def load_market_share():
+    """服务机器人各应用场景的市场份额(%)"""
+    return cached_dataset("market_share", MARKET_SHARE_CSV, read_dataset)
+
+
+def load_ai_adoption():
+    """服务机器人各应用场景的 AI 功能普及率(%)"""
+    return cached_dataset("ai_adoption", AI_ADOPTION_CSV, read_dataset)
+
+
+def load_unicorns():
+    """主要国家历年独角兽公司数量，以国家为索引，各年份(str)为列"""
+    return cached_dataset("unicorns", UNICORNS_CSV, read_dataset)
+
+
+def by_region(df, region):
+    """筛选某一地区的数据"""
+    return df[df['地区'] == region]
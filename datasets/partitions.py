@@ -0,0 +1,59 @@
+"""分区数据的并行汇总
+
+一个目录下每个 CSV 是一个分区（如每个区一份交通数据），结构相同。各分区在进程池（与 forecasting
+共用，见 process_pool）中分别读取并汇总为 Rollup 的累计和与计数，主进程只需把这些小表相加，再得到全市的日/月/年均值。
+
+使用进程池的脚本须把入口放在 if __name__ == "__main__": 之下，否则子进程会重新执行整个脚本。
+"""
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import process_pool
+
+from .binary_cache import read_csv
+from .rollups import Rollup
+from .timeseries import LEVELS
+
+# 分区至少有这么多个时才使用进程池，否则直接在当前进程中汇总
+PARALLEL_MIN_PARTITIONS = 2
+
+
+def partition_files(directory):
+    """目录下的全部分区文件（按文件名排序），目录不存在时返回空列表"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.lower().endswith(".csv"))
+
+
+def partition_name(path):
+    """分区名，即文件名去掉扩展名（如区名）"""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _aggregate_partition(path, options, columns):
+    """进程池中执行：读取一个分区并汇总，返回 Rollup.partials()"""
+    return Rollup(LEVELS, columns).update(read_csv(path, **options)).partials()
+
+
+def aggregate_partitions(paths, options, columns, parallel=True):
+    """并行汇总各分区并合并，返回合并后的 Rollup
+
+    options: 各分区共用的 read_csv 参数
+    """
+    if parallel and len(paths) >= PARALLEL_MIN_PARTITIONS and (os.cpu_count() or 1) > 1:
+        try:
+            executor = process_pool.get_executor()
+            futures = [executor.submit(_aggregate_partition, path, options, columns) for path in paths]
+            partials = [future.result() for future in futures]
+        except BrokenProcessPool:
+            # 子进程异常退出时放弃进程池，改为在当前进程中汇总
+            process_pool.reset_executor()
+            partials = [_aggregate_partition(path, options, columns) for path in paths]
+    else:
+        partials = [_aggregate_partition(path, options, columns) for path in paths]
+
+    rollup = Rollup(LEVELS, columns)
+    for sums, counts, rows in partials:
+        rollup.merge(sums, counts, rows)
+    return rollup
@@ -0,0 +1,13 @@
+import os
+from pathlib import Path
+
+# 设置该环境变量可改用另一个数据目录（如压测用的合成数据），须在导入 datasets 之前设置
+DATA_DIR_ENV = "AI_PLATFORM_DATA_DIR"
+
+# data/ 目录的绝对路径，默认为仓库内的 data/，避免依赖启动时的工作目录
+DATA_DIR = Path(os.environ.get(DATA_DIR_ENV) or Path(__file__).resolve().parent.parent / "data").resolve()
+
+
+def data_path(*parts):
+    """返回 data/ 目录下文件的绝对路径"""
+    return DATA_DIR.joinpath(*parts)
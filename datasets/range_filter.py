@@ -0,0 +1,103 @@
+"""基于排序索引的范围筛选
+
+为若干数值列各建一份排序索引（排序后的值 + 对应行号），为类别列的每个取值建一份位图，
+筛选时用二分查找定位每个区间，再与类别位图按位与，最后只做一次 take。
+索引在数据加载后建立一次，之后每次拖动滑块只需 O(log n) 的查找加一次向量化比较，
+不再复制整张表、也不再逐个条件生成中间 DataFrame。
+"""
+import numpy as np
+
+import profiling
+
+# 候选行少于总行数的这个比例时，直接从排序索引取行号再逐条检查，否则按整列位图计算
+_SPARSE_RATIO = 1 / 16
+
+
+class RangeFilter:
+    """对一个只读 DataFrame 做多条件范围 + 类别筛选
+
+    range_columns: 需要按闭区间筛选的数值列
+    category_columns: 需要按取值筛选的类别列
+    """
+
+    def __init__(self, df, range_columns, category_columns=()):
+        self.df = df
+        self._values = {}
+        self._sorted = {}
+        for col in range_columns:
+            values = df[col].to_numpy()
+            order = np.argsort(values, kind="stable")
+            self._values[col] = values
+            self._sorted[col] = (values[order], order)
+        self._bitmaps = {}
+        for col in category_columns:
+            codes, uniques = df[col].factorize()
+            self._bitmaps[col] = {value: codes == i for i, value in enumerate(uniques)}
+
+    def __len__(self):
+        return len(self.df)
+
+    def bounds(self, col):
+        """返回数值列的 (最小值, 最大值)，直接取自排序索引"""
+        values = self._sorted[col][0]
+        return values[0], values[-1]
+
+    def _span(self, col, low, high):
+        """闭区间 [low, high] 在排序索引中的位置 [lo, hi)"""
+        values = self._sorted[col][0]
+        return np.searchsorted(values, low, side="left"), np.searchsorted(values, high, side="right")
+
+    def _category_mask(self, categories):
+        mask = None
+        for col, selected in categories.items():
+            if not selected:
+                continue
+            bitmaps = self._bitmaps[col]
+            empty = np.zeros(len(self.df), dtype=bool)
+            col_mask = np.logical_or.reduce([bitmaps.get(value, empty) for value in selected])
+            mask = col_mask if mask is None else mask & col_mask
+        return mask
+
+    def positions(self, ranges=None, categories=None):
+        """返回满足全部条件的行号（升序）；没有任何条件生效时返回 None
+
+        ranges: {列名: (下限, 上限)}，闭区间
+        categories: {列名: 取值列表}，空列表表示不筛选该列
+        """
+        n = len(self.df)
+        spans = []
+        for col, (low, high) in (ranges or {}).items():
+            lo, hi = self._span(col, low, high)
+            if hi - lo < n:
+                spans.append((hi - lo, col, low, high, lo, hi))
+        mask = self._category_mask(categories or {})
+        if not spans:
+            return None if mask is None else np.flatnonzero(mask)
+
+        # 从命中行数最少的区间出发
+        spans.sort(key=lambda span: span[0])
+        count, col, _, _, lo, hi = spans[0]
+        if count < n * _SPARSE_RATIO:
+            rows = self._sorted[col][1][lo:hi]
+            keep = np.ones(len(rows), dtype=bool)
+            for _, other, low, high, _, _ in spans[1:]:
+                values = self._values[other][rows]
+                keep &= (values >= low) & (values <= high)
+            if mask is not None:
+                keep &= mask[rows]
+            return np.sort(rows[keep])
+
+        # 区间较宽时直接在整列上比较，避免对大量行号排序
+        for _, other, low, high, _, _ in spans:
+            values = self._values[other]
+            in_range = (values >= low) & (values <= high)
+            mask = in_range if mask is None else mask & in_range
+        return np.flatnonzero(mask)
+
+    @profiling.profiled("groupby", "range_filter.filter")
+    def filter(self, ranges=None, categories=None):
+        """返回筛选后的 DataFrame；没有条件生效时返回共享数据的浅拷贝，不复制数据"""
+        rows = self.positions(ranges, categories)
+        if rows is None or len(rows) == len(self.df):
+            return self.df.copy(deep=False)
+        return self.df.take(rows)
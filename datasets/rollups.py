@@ -0,0 +1,126 @@
+"""增量汇总
+
+按若干时间粒度（年、月、日等）维护数值列的累计和与非空计数，求和、求均值都直接由这两者得出，
+页面读取的是已经汇总好的小表，不必每次重新对全部历史数据做 groupby。
+和与计数可以直接相加，因此各分区可以分别汇总后再合并，见 merge()。
+
+数据文件只在末尾追加新行时，sync() 只汇总新增的行；文件被改写（行数减少或已汇总的最后一行
+变了）时整体重建。
+"""
+import threading
+
+import pandas as pd
+
+import profiling
+
+
+class Rollup:
+    """按多个时间粒度增量汇总的累计和与计数
+
+    levels: {粒度名: 列名 或 接收 DataFrame 返回分组键的函数}
+    columns: 需要汇总的数值列
+    """
+
+    def __init__(self, levels, columns):
+        self.levels = dict(levels)
+        self.columns = list(columns)
+        self.rows = 0
+        self._last_row = None
+        self._sums = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def _keys(self, df, level):
+        key = self.levels[level]
+        values = key(df) if callable(key) else df[key]
+        return values.rename(level)
+
+    def _reset(self):
+        self.rows = 0
+        self._last_row = None
+        self._sums = {}
+        self._counts = {}
+
+    def reset(self):
+        """清空已汇总的结果，下次 sync() 时整体重建"""
+        with self._lock:
+            self._reset()
+
+    @profiling.profiled("groupby", "rollup.update")
+    def _update(self, delta):
+        for level in self.levels:
+            grouped = delta[self.columns].groupby(self._keys(delta, level))
+            sums, counts = grouped.sum(), grouped.count()
+            if level in self._sums:
+                sums = self._sums[level].add(sums, fill_value=0)
+                counts = self._counts[level].add(counts, fill_value=0)
+            self._sums[level], self._counts[level] = sums.sort_index(), counts.sort_index()
+        self.rows += len(delta)
+        self._last_row = tuple(delta[self.columns].iloc[-1])
+
+    def update(self, delta):
+        """汇总新追加的行"""
+        if len(delta):
+            with self._lock:
+                self._update(delta)
+        return self
+
+    def partials(self):
+        """当前的累计和与计数 (sums, counts, rows)，可在进程间传递，由 merge() 合并"""
+        with self._lock:
+            return dict(self._sums), dict(self._counts), self.rows
+
+    def merge(self, sums, counts, rows):
+        """合并另一份数据（如另一分区）的 partials()，和与计数直接相加"""
+        with self._lock:
+            for level in self.levels:
+                if level not in sums:
+                    continue
+                if level in self._sums:
+                    self._sums[level] = self._sums[level].add(sums[level], fill_value=0).sort_index()
+                    self._counts[level] = self._counts[level].add(counts[level], fill_value=0).sort_index()
+                else:
+                    self._sums[level], self._counts[level] = sums[level], counts[level]
+            self.rows += rows
+            self._last_row = None
+        return self
+
+    def sync(self, df):
+        """与完整数据同步：df 只是在已汇总的数据后追加了行时只汇总新增部分，否则整体重建"""
+        with self._lock:
+            appended = (
+                self.rows <= len(df)
+                and (self.rows == 0 or tuple(df[self.columns].iloc[self.rows - 1]) == self._last_row)
+            )
+            if not appended:
+                self._reset()
+            if len(df) > self.rows:
+                self._update(df.iloc[self.rows:])
+        return self
+
+    def sums(self, level, columns=None):
+        """某一粒度下各列的和，返回以粒度名为第一列的 DataFrame"""
+        columns = self.columns if columns is None else list(columns)
+        with self._lock:
+            sums = self._sums.get(level)
+        if sums is None:
+            return pd.DataFrame(columns=[level] + columns)
+        return sums[columns].reset_index()
+
+    def counts(self, level, columns=None):
+        """某一粒度下各列的非空个数，返回以粒度名为第一列的 DataFrame"""
+        columns = self.columns if columns is None else list(columns)
+        with self._lock:
+            counts = self._counts.get(level)
+        if counts is None:
+            return pd.DataFrame(columns=[level] + columns)
+        return counts[columns].reset_index()
+
+    def means(self, level, columns=None):
+        """某一粒度下各列的均值（忽略缺失值），返回以粒度名为第一列的 DataFrame"""
+        columns = self.columns if columns is None else list(columns)
+        with self._lock:
+            sums, counts = self._sums.get(level), self._counts.get(level)
+        if sums is None:
+            return pd.DataFrame(columns=[level] + columns)
+        return (sums[columns] / counts[columns]).reset_index()
@@ -0,0 +1,202 @@
+"""各 CSV 文件的声明式结构
+
+每个文件登记列名与类型、日期列、类别列、千位分隔符等，由 CsvSchema.read_options()
+转换为 pd.read_csv 的参数，在解析时一次完成类型转换，不再在读取后逐列
+to_numeric / to_datetime / astype。
+
+未登记的文件按 pandas 默认方式读取。
+"""
+import os
+
+from .paths import DATA_DIR
+
+
+class CsvSchema:
+    """一个 CSV 文件的结构
+
+    columns: 有序的 {列名: dtype}，须与文件表头一致（names 给出时按位置重命名）
+    dates: 解析为 datetime 的列
+    categories: 转为 category 类型的列（取值重复较多的文本列，如地区、行业）
+    index_col: 作为索引的列
+    names: 为 True 时忽略文件表头，直接使用 columns 的列名
+    其余参数原样传给 pd.read_csv
+    """
+
+    def __init__(self, columns, dates=(), categories=(), index_col=None, names=False,
+                 skiprows=None, thousands=None, encoding=None, date_format=None):
+        self.columns = dict(columns)
+        self.dates = list(dates)
+        self.categories = list(categories)
+        self.index_col = index_col
+        self.names = names
+        self.skiprows = skiprows
+        self.thousands = thousands
+        self.encoding = encoding
+        self.date_format = date_format
+
+    def read_options(self):
+        """返回 pd.read_csv 的参数"""
+        dtype = {}
+        for col, col_type in self.columns.items():
+            if col in self.dates:
+                continue
+            dtype[col] = "category" if col in self.categories else col_type
+        options = {"dtype": dtype}
+        if self.dates:
+            options["parse_dates"] = self.dates
+            if self.date_format:
+                options["date_format"] = self.date_format
+        if self.names:
+            options["header"] = None
+            options["names"] = list(self.columns)
+        optional = {"index_col": self.index_col, "skiprows": self.skiprows,
+                    "thousands": self.thousands, "encoding": self.encoding}
+        options.update({k: v for k, v in optional.items() if v is not None})
+        return options
+
+    def check(self, df):
+        """检查读到的列是否与声明一致（只比较列名，不扫描数据）"""
+        found = list(df.columns)
+        if self.index_col is not None:
+            found.insert(0, df.index.name)
+        missing = [col for col in self.columns if col not in found]
+        if missing:
+            raise ValueError(f"数据文件缺少列: {', '.join(missing)}")
+        return df
+
+
+def _same(columns, dtype, **overrides):
+    """多列同一类型时的简写，overrides 指定个别列的类型"""
+    return {col: overrides.get(col, dtype) for col in columns}
+
+
+NSF_RD_COLUMNS = ['Year', 'GDP_Current', 'GDP_Constant', 'Deflator', 'RD_Current', 'RD_Constant',
+                  'RD_GDP_Total', 'RD_Perf_Business', 'RD_Perf_Federal', 'RD_Perf_HigherEd', 'RD_Perf_Other',
+                  'RD_Fund_Business', 'RD_Fund_Federal', 'RD_Fund_Other']
+
+PATENT_SHARE_COLUMN = 'AI专利占比(占全球总数百分比)'
+
+INSTALLED_COLUMN = 'Number of industrial robots installed (in thousands)'
+
+# 键为相对 data/ 的路径
+SCHEMAS = {
+    # 前 7 行为标题和多级表头；年份带 e(估计)/f(预测) 后缀，先按文本读取
+    "nsf25326-tab001.csv": CsvSchema(
+        _same(NSF_RD_COLUMNS, "float64", Year="str"),
+        names=True, skiprows=7, thousands=",",
+    ),
+    "专利教育/历年知名AI模型数量_地区对比.csv": CsvSchema(
+        {"年份": "int64", "地区": "str", "知名AI模型数量": "int64"},
+        categories=["地区"],
+    ),
+    "专利教育/全球AI专利占比_按地区.csv": CsvSchema(
+        {"年份": "int64", "地区": "str", PATENT_SHARE_COLUMN: "float64"},
+        categories=["地区"],
+    ),
+    "专利教育/china_education_funding.csv": CsvSchema(
+        _same(["指标"] + [f"{year}年" for year in range(2016, 2025)], "float64", 指标="str"),
+    ),
+    "gpu排行.csv": CsvSchema(
+        {"显卡名称": "str", "显卡数量": "int64", "每秒总token": "float64", "显卡平均token": "float64", "排名": "int64"},
+    ),
+    "pdd_data.csv": CsvSchema(
+        _same(["date", "industry_avg_conversion", "pdd_conversion", "total_gmv", "ai_contributed_gmv",
+               "year", "month", "ai_contribution_rate", "conversion_improvement"],
+              "float64", year="int64", month="int64"),
+        dates=["date"], date_format="%Y-%m-%d",
+    ),
+    "traffic_data.csv": CsvSchema(
+        _same(["date", "congestion_index", "response_time", "accident_rate", "wait_time", "reaction_time",
+               "year", "month"],
+              "float64", year="int64", month="int64"),
+        dates=["date"], date_format="%Y-%m-%d",
+    ),
+    "smart_living_data.csv": CsvSchema(
+        _same(["Year", "Home_Shipments", "Home_Voice_Share", "Home_Response_Time", "Home_Energy_Reduction",
+               "Home_Connected_Devices", "Community_Facial_Adoption", "Community_HighRise_Coverage",
+               "Community_Parking_Time", "Community_Unmanned_Orders", "Building_HVAC_Reduction",
+               "Building_PV_Efficiency_AI", "Building_PV_Efficiency_Avg", "Building_Storage_Efficiency",
+               "Building_Maint_Cost_Saving", "Trends_Security_Compliance"],
+              "float64", Year="int64", Community_Parking_Time="int64"),
+        index_col="Year",
+    ),
+    # 年份含 2025E 等预测值，保留为文本
+    "manufacturing_trends.csv": CsvSchema(
+        _same(["Year", "Market_Size_CNY_B", "Robot_Density_Auto", "Robot_Density_Electronics", "Flexible_Line_Share",
+               "Domestic_Robot_Share", "Welding_Precision", "Predictive_Maint_Accuracy", "Downtime_Reduction"],
+              "float64", Year="str", Robot_Density_Auto="int64", Robot_Density_Electronics="int64"),
+        index_col="Year", encoding="utf-8-sig",
+    ),
+    "drone_data.csv": CsvSchema(
+        _same(["Year", "Global_Market_Consumer", "Global_Market_Industrial", "Global_Market_Total",
+               "DJI_Share_Consumer", "DJI_Share_Industrial", "DJI_Share_Total", "AI_Adoption_Rate",
+               "App_Market_Agriculture", "App_Market_Surveying", "App_Market_Security", "App_Market_Logistics",
+               "App_Market_Filming", "Agri_Pesticide_Reduction", "Agri_Yield_Increase", "Survey_Time_Reduction",
+               "Security_Cost_Saving", "Logistics_Cost_Reduction"],
+              "float64", Year="int64"),
+        index_col="Year",
+    ),
+    "food_ai_data.csv": CsvSchema(
+        _same(["Year", "Traceability_Coverage", "Disease_Warning_Improvement", "Consumer_Trust_Index",
+               "AI_Dispatch_Adoption", "Avg_Delivery_Time_Reduction", "Unmanned_Delivery_Cities",
+               "Delivery_Market_Size_CNY", "Pest_Detection_Accuracy", "Water_Saving_Rate",
+               "Automated_Harvesting_Rate", "Smart_Agri_Market_Size_CNY", "Smart_Fridge_Penetration",
+               "Cooking_Robot_Sales_Growth", "Smart_Kitchen_Market_Size_CNY"],
+              "float64", Year="int64", Unmanned_Delivery_Cities="int64"),
+        index_col="Year",
+    ),
+    "ai_capabilities.csv": CsvSchema(
+        {"应用领域": "str", "技术成熟度": "float64", "应用效果提升": "float64"},
+    ),
+    "market_share.csv": CsvSchema(
+        {"应用场景": "str", "市场份额": "float64"},
+    ),
+    "ai_adoption.csv": CsvSchema(
+        {"应用场景": "str", "AI功能普及率": "float64"},
+    ),
+    "主要国家独角兽公司数量.csv": CsvSchema(
+        _same(["OUNT EXITED Locations"] + [str(year) for year in range(2000, 2025)], "int64",
+              **{"OUNT EXITED Locations": "str"}),
+        index_col="OUNT EXITED Locations",
+    ),
+    "工业机器人/工业机器人装机数量.csv": CsvSchema(
+        {"Year": "int64", INSTALLED_COLUMN: "int64", "Geographic area": "str"},
+        categories=["Geographic area"],
+    ),
+    "工业机器人/机器人应用领域.csv": CsvSchema(
+        {"Sector": "str", "Year": "int64", INSTALLED_COLUMN: "int64"},
+        categories=["Sector"],
+    ),
+    "工业机器人/中国vs全球机器人.csv": CsvSchema(
+        {"Year": "int64", INSTALLED_COLUMN: "int64", "Label": "str"},
+        categories=["Label"],
+    ),
+    "工业机器人/中国工业机器人应用领域分布_年度数据.csv": CsvSchema(
+        _same(["Year", "电气/电子(%)", "汽车制造(%)", "金属和机械(%)", "塑料化工(%)", "食品饮料(%)", "其他(%)"],
+              "float64", Year="int64"),
+    ),
+    "工业机器人/中国工业机器人社会经济影响_年度数据.csv": CsvSchema(
+        _same(["Year", "制造业生产率指数(2015=100)", "机器人相关新增岗位(万个)", "传统岗位受影响(万个)",
+               "机器人产业投资额(亿元人民币)", "国内机器人企业数量(家)"],
+              "float64", **{"Year": "int64", "机器人产业投资额(亿元人民币)": "int64", "国内机器人企业数量(家)": "int64"}),
+    ),
+}
+
+
+# 分区目录：目录下每个 CSV 都与对应的单个文件结构相同
+PARTITIONED = {
+    "traffic": "traffic_data.csv",
+}
+
+
+def schema_for(path):
+    """返回某个数据文件登记的结构，未登记时返回 None"""
+    try:
+        key = os.path.relpath(os.path.abspath(path), DATA_DIR)
+    except ValueError:
+        return None
+    key = key.replace(os.sep, "/")
+    directory = os.path.dirname(key)
+    if directory in PARTITIONED:
+        key = PARTITIONED[directory]
+    return SCHEMAS.get(key)
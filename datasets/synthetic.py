@@ -0,0 +1,230 @@
+"""压测用的合成数据
+
+按 datasets.schemas 中登记的结构，为 data/ 下每个 CSV 生成放大 factor 倍的合成版本，写入另一个
+数据目录（目录结构与 data/ 相同），用于在生产规模的数据量下测试加载函数和页面::
+
+    python -m datasets synth /tmp/scaled --factor 100
+    python -m datasets synth /tmp/scaled --factor 1000 --partitions 16 --max-rows 5000000
+    python benchmark.py --data /tmp/scaled
+
+各类文件的放大方式：
+- 有日期列的时间序列（拼多多GMV、交通）：改为逐日数据，从原起始日期开始共 行数×factor 天，
+  数值按日期沿原序列插值（超出原时间范围时往返重复）并加入噪声，year/month 由日期重新计算；
+  partitions 给出时，另在 schemas.PARTITIONED 登记的目录下生成这么多个分区（如各区的交通数据）；
+- 有类别列的表（地区、行业）：每个类别复制 factor-1 份（如“中国 #2”），即更多地区，年份列不变；
+- 以年份为键、没有类别列的表：每个年份复制 factor-1 份，年份不变，相当于同一年份有更多地区的数据，
+  年份范围保持真实；表中另有文本列时在其后加编号；
+- 其余表（显卡、应用场景等）：每行复制 factor-1 份并在名称后加编号，即更多显卡；
+  排名列（取值恰为 1..n）按新的行序重新编号。
+原数据的各行原样保留。数值列加入原列标准差 NOISE 倍的高斯噪声，原列非负时截断为非负，整数列取整。
+
+写出的文件与原文件格式一致（编码、标题行、是否有表头、日期格式），可直接用原 schema 读取。
+未登记的文件按 pandas 推断的类型处理。
+"""
+import csv
+import os
+
+import numpy as np
+import pandas as pd
+
+from .binary_cache import source_files
+from .paths import DATA_DIR
+from .schemas import PARTITIONED, SCHEMAS
+
+# 噪声标准差相对原列标准差的比例
+NOISE = 0.05
+# 被视为年份键的列名
+YEAR_COLUMNS = ("Year", "year", "年份")
+# 时间序列中由日期派生、需重新计算的列
+DATE_PARTS = ("year", "month")
+
+
+def _mirror(x, n):
+    """把位置 x 往返折叠到 [0, n-1] 内（0,1,..,n-1,n-2,..,0,1,..），超出原序列时保持连续"""
+    if n <= 1:
+        return np.zeros_like(x)
+    period = 2 * (n - 1)
+    x = np.mod(x, period)
+    return np.where(x > n - 1, period - x, x)
+
+
+def _numeric_columns(df):
+    return [col for col in df.columns
+            if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+
+
+def _is_rank(series):
+    """整数列且取值恰为 1..n（如 gpu排行.csv 的排名）"""
+    if not pd.api.types.is_integer_dtype(series):
+        return False
+    return np.array_equal(np.sort(series.to_numpy()), np.arange(1, len(series) + 1))
+
+
+def _jitter(values, original, rng):
+    """values 加入噪声，噪声大小和取值范围参照原列 original"""
+    original = np.asarray(original, dtype=float)
+    if np.isnan(original).all():
+        return values
+    spread = np.nanstd(original)
+    if not spread > 0:
+        spread = np.nanmean(np.abs(original))
+    noisy = values + rng.normal(0.0, NOISE * spread, len(values))
+    if np.nanmin(original) >= 0:
+        noisy = np.clip(noisy, 0, None)
+    return noisy
+
+
+def _cast(values, dtype):
+    """噪声后的浮点数转回原列类型"""
+    if pd.api.types.is_integer_dtype(dtype):
+        return np.rint(values).astype(dtype)
+    return values
+
+
+def scale_series(df, date_column, factor, rng):
+    """时间序列改为逐日数据，共 len(df)×factor 天（不超过 pandas 可表示的日期范围）"""
+    df = df.sort_values(date_column).reset_index(drop=True)
+    n = len(df)
+    start = df[date_column].iloc[0].normalize()
+    total = min(n * factor, (pd.Timestamp.max.normalize() - start).days)
+    dates = pd.date_range(start, periods=total, freq="D")
+
+    # 每天在原序列中的（小数）位置：按原数据的平均间隔换算，超出原范围时往返折叠
+    if n > 1:
+        step = (df[date_column].iloc[-1] - df[date_column].iloc[0]) / (n - 1)
+        position = _mirror(((dates - df[date_column].iloc[0]) / step).to_numpy(), n)
+    else:
+        position = np.zeros(total)
+
+    numeric = _numeric_columns(df)
+    out = pd.DataFrame({date_column: dates})
+    for col in df.columns:
+        if col == date_column:
+            continue
+        if col in DATE_PARTS and pd.api.types.is_integer_dtype(df[col]):
+            out[col] = getattr(dates, col).astype(df[col].dtype)
+        elif col in numeric:
+            values = np.interp(position, np.arange(n), df[col].to_numpy(dtype=float))
+            out[col] = _cast(_jitter(values, df[col], rng), df[col].dtype)
+        else:
+            out[col] = df[col].to_numpy()[np.rint(position).astype(int)]
+    return out
+
+
+def replicate(df, factor, rng, labels=(), keep=()):
+    """每行复制 factor-1 份：副本的数值加噪声，labels 列加编号，排名列重新编号，keep 列原样复制
+
+    结果按原行分组排列（原行在前，随后是它的各个副本），原有的行序因此大致保留。
+    """
+    n = len(df)
+    row = np.repeat(np.arange(n), factor)
+    copy = np.tile(np.arange(factor), n)
+    is_copy = copy > 0
+    out = df.iloc[row].reset_index(drop=True)
+    for col in _numeric_columns(df):
+        if col in keep:
+            continue
+        if _is_rank(df[col]):
+            out[col] = np.arange(1, len(out) + 1, dtype=df[col].dtype)
+            continue
+        values = out[col].to_numpy(dtype=float)
+        values = np.where(is_copy, _jitter(values, df[col], rng), values)
+        out[col] = _cast(values, df[col].dtype)
+    suffix = pd.Series(copy + 1).astype(str)
+    for col in labels:
+        text = out[col].astype(str)
+        out[col] = text.where(~is_copy, text + " #" + suffix)
+    return out
+
+
+def _year_column(df):
+    for col in YEAR_COLUMNS:
+        if col in df.columns and df[col].astype(str).str[:4].str.isdigit().all():
+            return col
+    return None
+
+
+def scale_frame(df, factor, rng, dates=(), categories=()):
+    """按文件类型选择放大方式（见模块说明），factor 为 1 时原样返回副本"""
+    if factor <= 1 or df.empty:
+        return df.copy()
+    if dates:
+        return scale_series(df, dates[0], factor, rng)
+    # 年份列在副本中保持不变
+    year = _year_column(df)
+    keep = () if year is None else (year,)
+    if categories:
+        return replicate(df, factor, rng, labels=categories, keep=keep)
+    labels = [col for col in df.columns if col not in _numeric_columns(df) and col not in keep][:1]
+    return replicate(df, factor, rng, labels=labels, keep=keep)
+
+
+def _source_options(schema):
+    """读取源文件的参数：类别列按文本读，索引列作为普通列（写回时保持原列序）"""
+    if schema is None:
+        return {}
+    options = schema.read_options()
+    options.pop("index_col", None)
+    options["dtype"] = {col: ("str" if col in schema.categories else dtype)
+                        for col, dtype in options["dtype"].items()}
+    return options
+
+
+def _preamble(path, schema):
+    """源文件中 skiprows 跳过的记录（标题、多级表头），写出时原样保留"""
+    if schema is None or not schema.skiprows:
+        return []
+    with open(path, encoding=schema.encoding or "utf-8", newline="") as f:
+        reader = csv.reader(f)
+        return [record for _, record in zip(range(schema.skiprows), reader)]
+
+
+def write_like(df, path, schema, preamble=()):
+    """按 schema 描述的格式写出 CSV，使其能被原 schema 读取"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    encoding = (schema.encoding if schema else None) or "utf-8"
+    with open(path, "w", encoding=encoding, newline="") as f:
+        if preamble:
+            csv.writer(f).writerows(preamble)
+        df.to_csv(f, index=False, header=not (schema and schema.names),
+                  date_format=schema.date_format if schema else None)
+
+
+def _schema_key(key):
+    return PARTITIONED.get(os.path.dirname(key), key)
+
+
+def synthesize(target, factor, partitions=0, seed=0, max_rows=None, source=DATA_DIR):
+    """为 source 下全部 CSV 生成放大 factor 倍的合成数据，写入 target
+
+    partitions: 为 schemas.PARTITIONED 登记的目录生成的分区数，0 表示不生成
+    max_rows: 每个文件的行数上限，放大倍数按文件分别缩小以满足上限
+    返回 [(相对路径, 行数或错误信息), ...]
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for path in source_files(source):
+        key = os.path.relpath(path, source).replace(os.sep, "/")
+        schema = SCHEMAS.get(_schema_key(key))
+        try:
+            df = pd.read_csv(path, **_source_options(schema))
+            file_factor = factor
+            if max_rows is not None and len(df):
+                file_factor = max(1, min(factor, max_rows // len(df)))
+            dates = schema.dates if schema else ()
+            categories = schema.categories if schema else ()
+            out = scale_frame(df, file_factor, rng, dates=dates, categories=categories)
+            write_like(out, os.path.join(target, key), schema, _preamble(path, schema))
+            results.append((key, len(out)))
+        except (OSError, ValueError, pd.errors.ParserError) as e:
+            results.append((key, f"失败: {e}"))
+            continue
+
+        if partitions and key in PARTITIONED.values():
+            directory = next(d for d, name in PARTITIONED.items() if name == key)
+            for index in range(1, partitions + 1):
+                part = scale_frame(df, file_factor, rng, dates=dates, categories=categories)
+                part_key = f"{directory}/{index:03d}.csv"
+                write_like(part, os.path.join(target, part_key), schema)
+                results.append((part_key, len(part)))
+    return results
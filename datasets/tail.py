@@ -0,0 +1,132 @@
+"""只追加文件的增量读取
+
+持续写入的 CSV（如 pdd_data.csv）只会在末尾追加新行。TailReader 记住已解析到的字节位置，
+刷新时只解析之后新追加的完整行，再拼接到已有结果后面，耗时与新增数据量成正比，而不是文件大小。
+最后一行尚未写完（没有换行符）时留到下次再读。
+
+文件变短，或已读部分的末尾字节变了（文件被改写而非追加）时，整体重新读取。
+
+给出 seed 时（如 datasets.binary_cache.read_csv），首次读取用它得到整个文件的解析结果，
+不必在每个新进程中都用 pandas 重新解析全文，之后只解析新追加的部分。
+"""
+import io
+import os
+import threading
+
+import pandas as pd
+
+# 记录已读部分末尾的这么多字节，用来判断文件是否被改写
+_TAIL_BYTES = 256
+# 解析新增行时不适用的参数（表头只在文件开头）
+_HEADER_OPTIONS = ("skiprows", "header", "names")
+
+
+class TailReader:
+    """对一个只追加的 CSV 做增量读取，参数与 pd.read_csv 相同
+
+    seed: 可选，无参数、返回整个文件解析结果（与 pd.read_csv(path, **options) 相同）的函数
+    """
+
+    def __init__(self, path, seed=None, **options):
+        self.path = os.fspath(path)
+        self.seed = seed
+        self.options = options
+        self.frame = None
+        self.offset = 0
+        self._tail = b""
+        self._names = None
+        self._lock = threading.Lock()
+
+    def _complete(self, data):
+        """截到最后一个换行符为止，返回完整行部分"""
+        end = data.rfind(b"\n") + 1
+        return data[:end]
+
+    def _remember(self, f, offset):
+        self.offset = offset
+        start = max(0, offset - _TAIL_BYTES)
+        f.seek(start)
+        self._tail = f.read(offset - start)
+
+    def _read_names(self, source):
+        header_options = {k: v for k, v in self.options.items() if k in _HEADER_OPTIONS + ("encoding",)}
+        self._names = list(pd.read_csv(source, nrows=0, **header_options).columns)
+
+    def _read_seed(self, f):
+        """用 seed 读取整个文件；文件末尾不是完整行或读取期间文件有变化时返回 None"""
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        f.seek(size - 1)
+        if f.read(1) != b"\n":
+            return None
+        frame = self.seed()
+        if os.fstat(f.fileno()).st_size != size:
+            return None
+        # nrows=0 时 pandas 只读取表头部分
+        self._read_names(self.path)
+        self._remember(f, size)
+        return frame
+
+    def _read_all(self, f):
+        if self.seed is not None:
+            frame = self._read_seed(f)
+            if frame is not None:
+                return frame
+            f.seek(0)
+        data = self._complete(f.read())
+        frame = pd.read_csv(io.BytesIO(data), **self.options)
+        self._read_names(io.BytesIO(data))
+        self._remember(f, len(data))
+        return frame
+
+    def _read_new(self, f):
+        f.seek(self.offset)
+        data = self._complete(f.read())
+        if not data.strip():
+            return None
+        options = {k: v for k, v in self.options.items() if k not in _HEADER_OPTIONS}
+        delta = pd.read_csv(io.BytesIO(data), header=None, names=self._names, **options)
+        self._remember(f, self.offset + len(data))
+        return delta
+
+    def _is_appended(self, f):
+        """文件是否只是在已读部分之后追加了内容"""
+        if os.fstat(f.fileno()).st_size < self.offset:
+            return False
+        f.seek(self.offset - len(self._tail))
+        return f.read(len(self._tail)) == self._tail
+
+    def _append(self, delta):
+        frame = pd.concat([self.frame, delta], ignore_index=self.options.get("index_col") is None)
+        # 两部分的类别取值不同时 concat 会退化为 object，重新转回 category
+        for col, dtype in self.frame.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype) and frame[col].dtype != dtype:
+                frame[col] = frame[col].astype("category")
+        return frame
+
+    def refresh(self):
+        """读取新追加的行，返回 (完整数据, 新增的行)；整体重新读取时新增的行即完整数据"""
+        with self._lock:
+            with open(self.path, "rb") as f:
+                if self.frame is None or not self._is_appended(f):
+                    f.seek(0)
+                    self.frame = self._read_all(f)
+                    return self.frame, self.frame
+                delta = self._read_new(f)
+            if delta is None:
+                return self.frame, self.frame.iloc[:0]
+            self.frame = self._append(delta)
+            return self.frame, delta
+
+    def reset(self):
+        """丢弃已读的结果，下次读取时整体重新读取"""
+        with self._lock:
+            self.frame = None
+            self.offset = 0
+            self._tail = b""
+            self._names = None
+
+    def read(self):
+        """读取新追加的行，返回完整数据"""
+        return self.refresh()[0]
@@ -0,0 +1,114 @@
+"""按时间索引的指标存储
+
+数据按时间排序后建立一次：
+- 按日、月、年的累计和与计数（datasets.rollups.Rollup），各粒度的均值直接查表；
+- 每列的前缀和与前缀计数，任意时间窗口（如 AI 系统上线前后）的均值只需两次二分查找。
+
+页面不再对全表做 df[df['date'].dt.year == y] 这样的布尔扫描或 groupby，
+数据量增大到分钟级传感器数据时查询开销基本不变。
+"""
+import numpy as np
+import pandas as pd
+
+from .rollups import Rollup
+
+# 汇总粒度：日、月（Period）、年
+LEVELS = {
+    "day": lambda df: df["date"].dt.normalize(),
+    "month": lambda df: df["date"].dt.to_period("M"),
+    "year": lambda df: df["date"].dt.year,
+}
+
+
+class TimeSeriesStore:
+    """一组数值指标的时间序列，时间列为 date
+
+    columns: 需要汇总、按窗口查询的数值列
+    rollup: 已汇总好的 Rollup（如多个分区合并的结果），不传时由 df 汇总
+    sums, counts: df 每行所代表的原始数据的各列之和与非空个数（DataFrame，与按 date 排序后的 df
+        逐行对应）。df 的每行是多行原始数据的汇总（如各分区同一天的均值）时给出，窗口均值按原始
+        行计算（和/个数），而不是对各行的均值再求平均；不给出时每行即一行原始数据。
+    """
+
+    def __init__(self, df, columns, rollup=None, sums=None, counts=None):
+        self.columns = list(columns)
+        self.frame = df.sort_values("date", kind="stable").reset_index(drop=True)
+        self._times = self.frame["date"].to_numpy()
+        self.rollup = rollup if rollup is not None else Rollup(LEVELS, self.columns).update(self.frame)
+        self._yearly = self.rollup.means("year").set_index("year")
+        self._prefix_sums = {}
+        self._prefix_counts = {}
+        for col in self.columns:
+            if sums is None:
+                values = self.frame[col].to_numpy(dtype=float)
+                valid = ~np.isnan(values)
+                values, valid = np.where(valid, values, 0.0), valid.astype(np.int64)
+            else:
+                values = np.nan_to_num(sums[col].to_numpy(dtype=float))
+                valid = counts[col].to_numpy(dtype=np.int64)
+            self._prefix_sums[col] = np.concatenate(([0.0], np.cumsum(values)))
+            self._prefix_counts[col] = np.concatenate(([0], np.cumsum(valid)))
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def latest_year(self):
+        """数据中最近的年份"""
+        return int(self._yearly.index.max())
+
+    def _bounds(self, start, end):
+        """[start, end) 对应的行号区间，start/end 为 None 时不限"""
+        i = 0 if start is None else int(np.searchsorted(self._times, np.datetime64(pd.Timestamp(start)), "left"))
+        j = len(self._times) if end is None else int(np.searchsorted(self._times, np.datetime64(pd.Timestamp(end)), "left"))
+        return i, max(i, j)
+
+    def window(self, start=None, end=None):
+        """时间在 [start, end) 内的原始数据（按时间排序）"""
+        i, j = self._bounds(start, end)
+        return self.frame.iloc[i:j]
+
+    def window_sum(self, column, start=None, end=None):
+        """时间在 [start, end) 内某列的和与非空个数"""
+        i, j = self._bounds(start, end)
+        sums, counts = self._prefix_sums[column], self._prefix_counts[column]
+        return sums[j] - sums[i], int(counts[j] - counts[i])
+
+    def window_mean(self, column, start=None, end=None):
+        """时间在 [start, end) 内某列的均值，窗口内没有数据时为 NaN"""
+        total, count = self.window_sum(column, start, end)
+        return total / count if count else np.nan
+
+    def before_after(self, column, date):
+        """某一时间点（如 AI 系统上线日期）之前与之后某列的均值"""
+        return self.window_mean(column, end=date), self.window_mean(column, start=date)
+
+    def year_mean(self, column, year):
+        """某一年某列的均值，没有该年数据时为 NaN"""
+        try:
+            return self._yearly.at[year, column]
+        except KeyError:
+            return np.nan
+
+    def means(self, level, columns=None):
+        """某一粒度（day/month/year）下各列的均值，返回以粒度名为第一列的 DataFrame"""
+        return self.rollup.means(level, columns)
+
+    def monthly_by_year(self, column):
+        """某列的月均值，行为月份(1-12)、列为年份"""
+        monthly = self.means("month", [column])
+        periods = pd.PeriodIndex(monthly["month"])
+        table = pd.DataFrame({"year": periods.year, "month": periods.month, column: monthly[column].to_numpy()})
+        return table.pivot(index="month", columns="year", values=column)
+
+    @classmethod
+    def from_rollup(cls, rollup):
+        """由合并后的 Rollup 构建
+
+        frame 为各日的均值（用于绘图）；年、月均值和窗口均值都由各日的和与个数计算，
+        与直接由全部原始行构建的结果一致。
+        """
+        daily = rollup.means("day").rename(columns={"day": "date"})
+        daily["year"] = daily["date"].dt.year
+        daily["month"] = daily["date"].dt.month
+        return cls(daily, rollup.columns, rollup, sums=rollup.sums("day"), counts=rollup.counts("day"))
@@ -0,0 +1,408 @@
+"""时间序列预测（ARIMA）
+
+同一条序列用同样的阶数、预测步数拟合，结果总是一样的，因此拟合结果按
+(序列哈希, order, 预测步数) 缓存：进程内缓存在内存中，同时写入 data/.cache/forecasts/，
+应用重启后直接读取，不必重新拟合。
+
+返回的预测结果为字典::
+
+    {'mean': 预测值, 'lower': 置信区间下限, 'upper': 置信区间上限, 'aic': 模型AIC, 'order': 阶数}
+
+forecast_many() 一次预测多条序列（如 各地区 × 各指标），未命中缓存的序列在进程池中并行拟合，
+返回长表（每条序列每个预测期一行）。进程池与 datasets.partitions 共用，见 process_pool；
+使用进程池的脚本须把入口放在 if __name__ == "__main__": 之下，否则子进程会重新执行整个脚本。
+
+order 传入 AUTO_ORDER ("auto") 时自动定阶：差分阶数 d 由 ADF 检验确定，(p, q) 在有限网格内
+按 AIC 选择。网格按 p+q 由小到大分轮评估，同一轮的候选在进程池中并行拟合，某一轮 AIC
+改善不足 EARLY_STOP_AIC 时提前停止。选出的阶数按序列内容缓存，之后只需拟合一次。
+"""
+import hashlib
+import json
+import os
+import threading
+import warnings
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+import datasets
+import process_pool
+import profiling
+from lazy_imports import lazy_import
+
+arima_model = lazy_import("statsmodels.tsa.arima.model")
+stattools = lazy_import("statsmodels.tsa.stattools")
+# 进程池的子进程启动时先导入 statsmodels，避免每个任务各自承担导入开销
+process_pool.preload("statsmodels.tsa.arima.model", "statsmodels.tsa.stattools")
+
+FORECAST_CACHE_DIR = os.path.join(datasets.DATA_DIR, ".cache", "forecasts")
+
+DEFAULT_ORDER = (1, 1, 1)
+# 传入 order=AUTO_ORDER 时自动定阶
+AUTO_ORDER = "auto"
+# 置信区间的置信水平
+CONFIDENCE = 0.95
+# 缓存格式版本，修改拟合或保存方式时递增，使旧缓存失效
+FORMAT_VERSION = 1
+# 待拟合的序列至少有这么多条时才使用进程池，否则直接在当前进程中拟合
+PARALLEL_MIN_SERIES = 2
+
+# 自动定阶的搜索范围（含上限）
+MAX_P = 2
+MAX_D = 1
+MAX_Q = 2
+# 某一轮的最优 AIC 比之前的最优值降低不足该值时停止搜索
+EARLY_STOP_AIC = 2.0
+# ADF 检验的显著性水平，p 值低于它时认为序列已平稳、不再差分
+ADF_SIGNIFICANCE = 0.05
+
+# forecast_many() 返回的长表的列
+FORECAST_COLUMNS = ['序列', '阶数', '期数', '年份', '预测值', '下限', '上限']
+
+_lock = threading.Lock()
+# key -> 预测结果
+_memory = {}
+# key -> 自动定阶选出的阶数
+_orders = {}
+
+
+def _values_hash(values, *extra):
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    sha1 = hashlib.sha1(values.tobytes())
+    sha1.update(repr(extra + (FORMAT_VERSION,)).encode())
+    return sha1.hexdigest()
+
+
+def series_key(values, order=DEFAULT_ORDER, steps=3):
+    """序列内容 + 阶数 + 预测步数 的哈希，作为缓存键"""
+    return _values_hash(values, tuple(order), int(steps), CONFIDENCE)
+
+
+def order_key(values, max_p=MAX_P, max_d=MAX_D, max_q=MAX_Q):
+    """序列内容 + 定阶搜索范围 的哈希，作为阶数缓存的键"""
+    return _values_hash(values, "order", max_p, max_d, max_q, EARLY_STOP_AIC, ADF_SIGNIFICANCE)
+
+
+def _read_json(name):
+    try:
+        with open(os.path.join(FORECAST_CACHE_DIR, f"{name}.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(name, record):
+    path = os.path.join(FORECAST_CACHE_DIR, f"{name}.json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(FORECAST_CACHE_DIR, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp, path)
+    except OSError:
+        # 缓存目录不可写时只是不持久化
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_disk(key):
+    record = _read_json(key)
+    if record is None:
+        return None
+    return {
+        "mean": np.array(record["mean"], dtype=float),
+        "lower": np.array(record["lower"], dtype=float),
+        "upper": np.array(record["upper"], dtype=float),
+        "aic": record["aic"],
+        "order": tuple(record["order"]),
+    }
+
+
+def _write_disk(key, result):
+    _write_json(key, {
+        "mean": result["mean"].tolist(),
+        "lower": result["lower"].tolist(),
+        "upper": result["upper"].tolist(),
+        "aic": result["aic"],
+        "order": list(result["order"]),
+    })
+
+
+def fit_forecast(values, order=DEFAULT_ORDER, steps=3):
+    """拟合 ARIMA 并预测未来 steps 期（不使用缓存）"""
+    results = arima_model.ARIMA(np.asarray(values, dtype=float), order=tuple(order)).fit()
+    forecast = results.get_forecast(steps=steps)
+    conf_int = np.asarray(forecast.conf_int(alpha=1 - CONFIDENCE))
+    return {
+        "mean": np.asarray(forecast.predicted_mean, dtype=float),
+        "lower": conf_int[:, 0],
+        "upper": conf_int[:, 1],
+        "aic": float(results.aic),
+        "order": tuple(order),
+    }
+
+
+def _fit_or_nan(values, order, steps):
+    """进程池中执行的拟合；单条序列失败（过短、奇异矩阵等）时返回全 NaN，不影响其他序列"""
+    try:
+        return fit_forecast(values, order, steps)
+    except Exception:
+        nan = np.full(steps, np.nan)
+        return {"mean": nan, "lower": nan, "upper": nan, "aic": float("nan"), "order": tuple(order)}
+
+
+def _cached(key):
+    """依次查找内存和磁盘缓存"""
+    with _lock:
+        result = _memory.get(key)
+    if result is None:
+        result = _read_disk(key)
+        if result is not None:
+            with _lock:
+                _memory[key] = result
+    return result
+
+
+def _store(key, result):
+    if np.isnan(result["aic"]):
+        return
+    _write_disk(key, result)
+    with _lock:
+        _memory[key] = result
+
+
+# ---- 自动定阶 ----
+
+def _aic(values, order):
+    """拟合一个候选阶数并返回 AIC，拟合失败时返回 inf"""
+    try:
+        with warnings.catch_warnings():
+            # 网格中的候选模型经常出现不收敛等警告，只比较 AIC 即可
+            warnings.simplefilter("ignore")
+            return float(arima_model.ARIMA(values, order=order).fit().aic)
+    except Exception:
+        return float("inf")
+
+
+def _difference_order(values, max_d):
+    """用 ADF 检验确定差分阶数：序列已平稳时不再差分"""
+    values = np.asarray(values, dtype=float)
+    for d in range(max_d):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                p_value = stattools.adfuller(values, autolag="AIC")[1]
+        except (ValueError, np.linalg.LinAlgError):
+            # 序列过短无法检验时沿用默认的一阶差分
+            return min(1, max_d)
+        if p_value < ADF_SIGNIFICANCE:
+            return d
+        values = np.diff(values)
+    return max_d
+
+
+def _search_rounds(d, max_p, max_q):
+    """按 p+q 由小到大分轮的候选阶数"""
+    return [
+        [(p, d, k - p) for p in range(max_p + 1) if 0 <= k - p <= max_q]
+        for k in range(max_p + max_q + 1)
+    ]
+
+
+def _search_order(values, max_p, max_d, max_q, evaluate):
+    """逐轮评估候选阶数，返回 (阶数, AIC)；evaluate(values, orders) 返回各候选的 AIC"""
+    values = np.asarray(values, dtype=float)
+    d = _difference_order(values, max_d)
+    best_order, best_aic = None, float("inf")
+    for orders in _search_rounds(d, max_p, max_q):
+        round_aic, round_order = min(zip(evaluate(values, orders), orders))
+        improved = round_aic < best_aic - EARLY_STOP_AIC
+        if round_aic < best_aic:
+            best_order, best_aic = round_order, round_aic
+        if not improved and best_order is not None:
+            break
+    if best_order is None or not np.isfinite(best_aic):
+        return DEFAULT_ORDER, float("nan")
+    return best_order, best_aic
+
+
+def _evaluate_serial(values, orders):
+    return [_aic(values, order) for order in orders]
+
+
+def _evaluate_parallel(values, orders):
+    if len(orders) < PARALLEL_MIN_SERIES or (os.cpu_count() or 1) < 2:
+        return _evaluate_serial(values, orders)
+    try:
+        return list(process_pool.get_executor().map(_aic, [values] * len(orders), orders))
+    except BrokenProcessPool:
+        process_pool.reset_executor()
+        return _evaluate_serial(values, orders)
+
+
+def _select_serial(values, max_p, max_d, max_q):
+    """进程池中执行：在一个子进程内完成一条序列的定阶"""
+    return _search_order(values, max_p, max_d, max_q, _evaluate_serial)
+
+
+def _cached_order(key):
+    with _lock:
+        order = _orders.get(key)
+    if order is None:
+        record = _read_json(f"order-{key}")
+        if record is not None:
+            order = tuple(record["order"])
+            with _lock:
+                _orders[key] = order
+    return order
+
+
+def _store_order(key, order, aic):
+    if not np.isfinite(aic):
+        return
+    _write_json(f"order-{key}", {"order": list(order), "aic": aic})
+    with _lock:
+        _orders[key] = tuple(order)
+
+
+@profiling.profiled("model")
+def select_order(values, max_p=MAX_P, max_d=MAX_D, max_q=MAX_Q, parallel=True):
+    """在 p<=max_p, d<=max_d, q<=max_q 的网格中按 AIC 选择阶数，结果按序列内容缓存"""
+    key = order_key(values, max_p, max_d, max_q)
+    order = _cached_order(key)
+    if order is None:
+        evaluate = _evaluate_parallel if parallel else _evaluate_serial
+        order, aic = _search_order(values, max_p, max_d, max_q, evaluate)
+        _store_order(key, order, aic)
+    return order
+
+
+def _resolve_orders(arrays, parallel):
+    """为多条序列自动定阶：多条序列未命中缓存时按序列分配到进程池，单条时按候选阶数并行"""
+    orders = {}
+    pending = {}
+    for key, values in arrays.items():
+        cache_key = order_key(values)
+        order = _cached_order(cache_key)
+        if order is None:
+            pending[key] = (cache_key, values)
+        else:
+            orders[key] = order
+
+    if parallel and len(pending) >= PARALLEL_MIN_SERIES and (os.cpu_count() or 1) > 1:
+        try:
+            executor = process_pool.get_executor()
+            futures = {key: executor.submit(_select_serial, values, MAX_P, MAX_D, MAX_Q)
+                       for key, (_, values) in pending.items()}
+            searched = {key: future.result() for key, future in futures.items()}
+        except BrokenProcessPool:
+            process_pool.reset_executor()
+            searched = {key: _select_serial(values, MAX_P, MAX_D, MAX_Q) for key, (_, values) in pending.items()}
+    else:
+        evaluate = _evaluate_parallel if parallel else _evaluate_serial
+        searched = {key: _search_order(values, MAX_P, MAX_D, MAX_Q, evaluate) for key, (_, values) in pending.items()}
+
+    for key, (order, aic) in searched.items():
+        _store_order(pending[key][0], order, aic)
+        orders[key] = tuple(order)
+    return orders
+
+
+@profiling.profiled("model")
+def forecast_arima(values, order=DEFAULT_ORDER, steps=3):
+    """ARIMA 预测，结果按 (序列哈希, order, steps) 缓存在内存和磁盘上
+
+    order 为 AUTO_ORDER 时先自动定阶。
+    """
+    if order == AUTO_ORDER:
+        order = select_order(values)
+    key = series_key(values, order, steps)
+    result = _cached(key)
+    if result is None:
+        result = fit_forecast(values, order, steps)
+        _store(key, result)
+    return result
+
+
+# ---- 批量预测 ----
+
+def _fit_pending(pending, steps, parallel):
+    """拟合未命中缓存的序列，pending: {键: (数值数组, 阶数)}"""
+    if parallel and len(pending) >= PARALLEL_MIN_SERIES and (os.cpu_count() or 1) > 1:
+        try:
+            executor = process_pool.get_executor()
+            futures = {key: executor.submit(_fit_or_nan, values, order, steps)
+                       for key, (values, order) in pending.items()}
+            return {key: future.result() for key, future in futures.items()}
+        except BrokenProcessPool:
+            # 子进程异常退出时放弃进程池，改为在当前进程中拟合
+            process_pool.reset_executor()
+    return {key: _fit_or_nan(values, order, steps) for key, (values, order) in pending.items()}
+
+
+@profiling.profiled("model")
+def forecast_many(series, order=DEFAULT_ORDER, steps=3, key_names=None, parallel=True):
+    """批量 ARIMA 预测，返回长表
+
+    series: {键: 序列}，序列为以年份为索引的 pd.Series 或数值数组
+    order: 所有序列共用的阶数，或 AUTO_ORDER 为每条序列自动定阶
+    key_names: 键为元组（如 (地区, 指标)）时，把键拆成以这些名称命名的列，代替“序列”列
+    返回列: 序列(或 key_names), 阶数, 期数(1..steps), 年份(序列索引为年份时), 预测值, 下限, 上限
+    """
+    arrays = {key: np.asarray(values, dtype=float) for key, values in series.items()}
+    if order == AUTO_ORDER:
+        orders = _resolve_orders(arrays, parallel)
+    else:
+        orders = {key: tuple(order) for key in arrays}
+
+    results = {}
+    pending = {}
+    cache_keys = {}
+    for key, array in arrays.items():
+        cache_keys[key] = series_key(array, orders[key], steps)
+        result = _cached(cache_keys[key])
+        if result is None:
+            pending[key] = (array, orders[key])
+        else:
+            results[key] = result
+
+    for key, result in _fit_pending(pending, steps, parallel).items():
+        _store(cache_keys[key], result)
+        results[key] = result
+
+    rows = []
+    for key, values in series.items():
+        result = results[key]
+        last = values.index[-1] if isinstance(values, pd.Series) and len(values) else None
+        for step in range(steps):
+            year = last + step + 1 if isinstance(last, (int, np.integer)) else np.nan
+            rows.append((key, orders[key], step + 1, year,
+                         result["mean"][step], result["lower"][step], result["upper"][step]))
+    frame = pd.DataFrame(rows, columns=FORECAST_COLUMNS)
+    if key_names:
+        keys = pd.DataFrame(frame['序列'].tolist(), columns=list(key_names))
+        frame = pd.concat([keys, frame.drop(columns='序列')], axis=1)
+    return frame
+
+
+def series_by_group(df, group_column, value_columns, time_column):
+    """把长表拆成 {(分组, 指标): 以时间为索引的序列}，供 forecast_many() 使用"""
+    series = {}
+    for group, part in df.sort_values(time_column).groupby(group_column, observed=True):
+        part = part.set_index(time_column)
+        for column in value_columns:
+            values = part[column].dropna()
+            if len(values):
+                series[(group, column)] = values
+    return series
+
+
+def clear_forecast_cache(disk=False):
+    """清空内存中的预测与定阶缓存；disk=True 时同时删除磁盘缓存"""
+    with _lock:
+        _memory.clear()
+        _orders.clear()
+    if disk and os.path.isdir(FORECAST_CACHE_DIR):
+        for name in os.listdir(FORECAST_CACHE_DIR):
+            os.remove(os.path.join(FORECAST_CACHE_DIR, name))
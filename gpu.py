@@ -2,140 +2,150 @@ import pandas as pd
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
-# 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.2rem;
-        color: #000000;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-        font-family: 'SimHei', sans-serif;
-    }
-    .sub-header {
-        font-size: 1.5rem;
-        color: #000000;
-        margin-top: 1.5rem;
-        margin-bottom: 1rem;
-        border-bottom: 2px solid #3498db;
-        padding-bottom: 0.3rem;
-        font-family: 'SimHei', sans-serif;
-    }
-    .card {
-        background-color: #f8f9fa;
-        border-radius: 8px;
-        padding: 1.2rem;
-        box-shadow: 0 3px 5px rgba(0, 0, 0, 0.08);
-        margin-bottom: 1rem;
-        height: 100%;
-    }
-    .highlight {
-        background-color: #e8f4f8;
-        padding: 0.8rem;
-        border-left: 4px solid #3498db;
-        margin-bottom: 1rem;
-        border-radius: 4px;
-    }
-    .stButton>button {
-        background-color: #3498db;
-        color: white;
-        font-weight: bold;
-    }
-    .footer {
-        text-align: center;
-        margin-top: 2rem;
-        color: #7f8c8d;
-        font-size: 0.8rem;
-    }
-    .metric-container {
-        display: flex;
-        justify-content: space-between;
-        align-items: stretch;
-        margin-bottom: 0.8rem;
-        gap: 8px;
-    }
-    .metric-value {
-        font-size: 1.6rem;
-        font-weight: bold;
-        color: #3498db;
-    }
-    .metric-label {
-        font-size: 0.8rem;
-        color: #7f8c8d;
-    }
-    .metric-card {
-        flex: 1;
-        border-radius: 6px;
-        padding: 0.6rem;
-        text-align: center;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        transition: transform 0.3s ease;
-    }
-    .metric-card:hover {
-        transform: translateY(-3px);
-    }
-    /* 选项卡样式 */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 55px;
-        padding-top: 12px;
-        white-space: pre-wrap;
-        font-size: 17px;
-        font-weight: 500;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: rgba(52, 152, 219, 0.1);
-        border-radius: 5px 5px 0 0;
-    }
-    /* 筛选区域样式 */
-    .filter-section {
-        background-color: #f8f9fa;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-        border: 1px solid #e9ecef;
-    }
-    /* 表格样式 */
-    .dataframe-container {
-        padding: 0.5rem;
-        border-radius: 8px;
-        background-color: #ffffff;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-    /* 平衡列宽 */
-    .equal-width {
-        width: 100%;
-    }
-</style>
-""", unsafe_allow_html=True)
+import charts
+import datasets
+import lazy_tabs
 
-# 标题
-st.markdown("<h1 class='main-header'>GPU性能分析平台</h1>", unsafe_allow_html=True)
+# 自定义CSS样式
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 2.2rem;
+            color: #000000;
+            text-align: center;
+            margin-bottom: 1rem;
+            font-weight: bold;
+            font-family: 'SimHei', sans-serif;
+        }
+        .sub-header {
+            font-size: 1.5rem;
+            color: #000000;
+            margin-top: 1.5rem;
+            margin-bottom: 1rem;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 0.3rem;
+            font-family: 'SimHei', sans-serif;
+        }
+        .card {
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            padding: 1.2rem;
+            box-shadow: 0 3px 5px rgba(0, 0, 0, 0.08);
+            margin-bottom: 1rem;
+            height: 100%;
+        }
+        .highlight {
+            background-color: #e8f4f8;
+            padding: 0.8rem;
+            border-left: 4px solid #3498db;
+            margin-bottom: 1rem;
+            border-radius: 4px;
+        }
+        .stButton>button {
+            background-color: #3498db;
+            color: white;
+            font-weight: bold;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 2rem;
+            color: #7f8c8d;
+            font-size: 0.8rem;
+        }
+        .metric-container {
+            display: flex;
+            justify-content: space-between;
+            align-items: stretch;
+            margin-bottom: 0.8rem;
+            gap: 8px;
+        }
+        .metric-value {
+            font-size: 1.6rem;
+            font-weight: bold;
+            color: #3498db;
+        }
+        .metric-label {
+            font-size: 0.8rem;
+            color: #7f8c8d;
+        }
+        .metric-card {
+            flex: 1;
+            border-radius: 6px;
+            padding: 0.6rem;
+            text-align: center;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+            transition: transform 0.3s ease;
+        }
+        .metric-card:hover {
+            transform: translateY(-3px);
+        }
+        /* 选项卡样式 */
+        .stTabs [data-baseweb="tab-list"] {
+            gap: 2px;
+        }
+        .stTabs [data-baseweb="tab"] {
+            height: 55px;
+            padding-top: 12px;
+            white-space: pre-wrap;
+            font-size: 17px;
+            font-weight: 500;
+        }
+        .stTabs [aria-selected="true"] {
+            background-color: rgba(52, 152, 219, 0.1);
+            border-radius: 5px 5px 0 0;
+        }
+        /* 筛选区域样式 */
+        .filter-section {
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            padding: 1rem;
+            margin-top: 2rem;
+            margin-bottom: 1rem;
+            border: 1px solid #e9ecef;
+        }
+        /* 表格样式 */
+        .dataframe-container {
+            padding: 0.5rem;
+            border-radius: 8px;
+            background-color: #ffffff;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+        }
+        /* 平衡列宽 */
+        .equal-width {
+            width: 100%;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
 # 加载数据
-@st.cache_data
 def load_data():
     try:
-        df = pd.read_csv("data\gpu排行.csv")
-        return df
+        return datasets.load_gpu_ranking()
     except Exception as e:
         st.error(f"加载数据出错: {e}")
         return None
 
+# 加载筛选索引（与数据一起缓存，只在数据文件变化时重建）
+def load_filter():
+    try:
+        return datasets.load_gpu_filter()
+    except Exception as e:
+        st.error(f"构建筛选索引出错: {e}")
+        return None
+
 def main():
+    load_css()
+    # 标题
+    st.markdown("<h1 class='main-header'>GPU性能分析平台</h1>", unsafe_allow_html=True)
+
     # 加载数据
     df = load_data()
+    gpu_filter = load_filter() if df is not None else None
 
-    if df is not None:
+    if gpu_filter is not None:
         total_gpus = len(df)
         
         # === 定义筛选控件 (UI放在底部，但状态读取需要在过滤前) ===
@@ -146,8 +156,8 @@ def main():
         # === 筛选逻辑 (放在使用 filtered_df 之前) ===
         st.sidebar.markdown("<h3 style='color: #3498db; font-size: 1.3rem; margin-bottom: 1rem;'>数据筛选</h3>", unsafe_allow_html=True) # Move title to sidebar
 
-        # 提取制造商 (放在侧边栏)
-        manufacturers = sorted(df['显卡名称'].apply(lambda x: x.split()[0] if ' ' in x else x).unique())
+        # 制造商列表 (放在侧边栏)，制造商已在加载数据时解析为分类列
+        manufacturers = list(df['制造商'].cat.categories)
         selected_manufacturers = st.sidebar.multiselect(
             "选择制造商：",
             manufacturers,
@@ -155,7 +165,7 @@ def main():
         )
         
         # 性能范围滑块 (放在侧边栏)
-        min_token, max_token = float(df['显卡平均token'].min()), float(df['显卡平均token'].max())
+        min_token, max_token = (float(v) for v in gpu_filter.bounds('显卡平均token'))
         token_range = st.sidebar.slider(
             "性能范围 (token/s):",
             min_value=min_token, max_value=max_token, value=(min_token, max_token),
@@ -163,7 +173,7 @@ def main():
         )
         
         # 显卡数量范围 (放在侧边栏)
-        min_cards, max_cards = int(df['显卡数量'].min()), int(df['显卡数量'].max())
+        min_cards, max_cards = (int(v) for v in gpu_filter.bounds('显卡数量'))
         card_count_range = st.sidebar.slider(
             "显卡数量范围:",
             min_value=min_cards, max_value=max_cards, 
@@ -176,23 +186,15 @@ def main():
             min_value=1, max_value=total_gpus, value=(1, 50)
         )
 
-        # 应用筛选
-        filtered_df = df.copy()
-        if selected_manufacturers:
-            mask = filtered_df['显卡名称'].apply(lambda x: any(m in x for m in selected_manufacturers))
-            filtered_df = filtered_df[mask]
-        filtered_df = filtered_df[
-            (filtered_df['显卡平均token'] >= token_range[0]) & 
-            (filtered_df['显卡平均token'] <= token_range[1])
-        ]
-        filtered_df = filtered_df[
-            (filtered_df['显卡数量'] >= card_count_range[0]) & 
-            (filtered_df['显卡数量'] <= card_count_range[1])
-        ]
-        filtered_df = filtered_df[
-            (filtered_df['排名'] >= rank_range[0]) & 
-            (filtered_df['排名'] <= rank_range[1])
-        ]
+        # 应用筛选：排序索引上二分查找各区间，与制造商位图求交后一次性取行
+        filtered_df = gpu_filter.filter(
+            ranges={
+                '显卡平均token': token_range,
+                '显卡数量': card_count_range,
+                '排名': rank_range,
+            },
+            categories={'制造商': selected_manufacturers},
+        )
        
         st.markdown("<h2 class='sub-header'>性能排行榜</h2>", unsafe_allow_html=True)
         
@@ -211,134 +213,139 @@ def main():
         # 创建选项卡
         if len(filtered_df) > 0:
             st.markdown("<div style='margin-top: 1.5rem;'></div>", unsafe_allow_html=True)
-            tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+            active_tab = lazy_tabs.tabs([
                 "📊 性能排行", 
                 "🏢 厂商对比",
                 "📈 系列分析", 
                 "⚖️ 多维对比", 
                 "🧠 AI框架",
                 "📈 市场分析"
-            ])
+            ], key="gpu_tab")
             
-            with tab1:
+            if active_tab == 0:
                 # 对数据进行排序
                 performance_df = filtered_df.sort_values('显卡平均token', ascending=False).head(20)
                 
                 # 创建横向条形图
-                fig = px.bar(
-                    performance_df,
-                    y='显卡名称',
-                    x='显卡平均token',
-                    orientation='h',
-                    title='GPU性能排行 (每秒处理token数)',
-                    labels={'显卡平均token': '每秒处理token数', '显卡名称': 'GPU型号'},
-                    color='显卡平均token',
-                    color_continuous_scale='Blues',
-                    text='显卡平均token'
-                )
-                
-                fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-                fig.update_layout(
-                    height=600,  # 调整高度，使图表更平衡
-                    margin=dict(l=10, r=10, t=50, b=10),  # 调整边距
-                    xaxis_title="每秒处理token数",
-                    yaxis_title="GPU型号",
-                    font=dict(size=12),
-                    plot_bgcolor='rgba(240,240,240,0.6)',
-                    yaxis={'categoryorder': 'total ascending'}
-                )
+                def performance_figure():
+                    fig = px.bar(
+                        performance_df,
+                        y='显卡名称',
+                        x='显卡平均token',
+                        orientation='h',
+                        title='GPU性能排行 (每秒处理token数)',
+                        labels={'显卡平均token': '每秒处理token数', '显卡名称': 'GPU型号'},
+                        color='显卡平均token',
+                        color_continuous_scale='Blues',
+                        text='显卡平均token'
+                    )
                 
-                st.plotly_chart(fig, use_container_width=True, key="gpu_trend")
+                    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+                    fig.update_layout(
+                        height=600,  # 调整高度，使图表更平衡
+                        margin=dict(l=10, r=10, t=50, b=10),  # 调整边距
+                        xaxis_title="每秒处理token数",
+                        yaxis_title="GPU型号",
+                        font=dict(size=12),
+                        plot_bgcolor='rgba(240,240,240,0.6)',
+                        yaxis={'categoryorder': 'total ascending'}
+                    )
+                    return fig
+
+                charts.cached_chart("gpu_trend", performance_figure, data=performance_df, use_container_width=True)
                 
                 # 显示性能分布
                 st.markdown("<h3 style='font-size: 1.3rem; color: #3498db; margin-top: 1.5rem;'>性能分布</h3>", unsafe_allow_html=True)
                 
                 # 创建直方图
-                fig = px.histogram(
-                    filtered_df,
-                    x='显卡平均token',
-                    nbins=30,
-                    title='GPU性能分布',
-                    labels={'显卡平均token': '每秒处理token数', 'count': '显卡数量'},
-                    color_discrete_sequence=['#3498db'],
-                    opacity=0.7
-                )
-                
-                fig.update_layout(
-                    height=350,
-                    margin=dict(l=10, r=10, t=50, b=10),
-                    xaxis_title="每秒处理token数",
-                    yaxis_title="显卡数量",
-                    font=dict(size=12),
-                    plot_bgcolor='rgba(240,240,240,0.6)'
-                )
+                def distribution_figure():
+                    fig = px.histogram(
+                        filtered_df,
+                        x='显卡平均token',
+                        nbins=30,
+                        title='GPU性能分布',
+                        labels={'显卡平均token': '每秒处理token数', 'count': '显卡数量'},
+                        color_discrete_sequence=['#3498db'],
+                        opacity=0.7
+                    )
                 
-                st.plotly_chart(fig, use_container_width=True, key="gpu_distribution")
+                    fig.update_layout(
+                        height=350,
+                        margin=dict(l=10, r=10, t=50, b=10),
+                        xaxis_title="每秒处理token数",
+                        yaxis_title="显卡数量",
+                        font=dict(size=12),
+                        plot_bgcolor='rgba(240,240,240,0.6)'
+                    )
+                    return fig
+
+                charts.cached_chart("gpu_distribution", distribution_figure, data=filtered_df['显卡平均token'], use_container_width=True)
             
-            with tab2:
+            if active_tab == 1:
                 st.markdown("<h3 style='font-size: 1.3rem; color: #3498db;'>厂商性能对比</h3>", unsafe_allow_html=True)
                 
-                # 提取制造商
-                filtered_df['制造商'] = filtered_df['显卡名称'].apply(lambda x: x.split()[0] if ' ' in x else x)
-                
                 # 按制造商分组计算平均性能
-                manufacturer_perf = filtered_df.groupby('制造商')['显卡平均token'].mean().reset_index()
+                manufacturer_perf = filtered_df.groupby('制造商', observed=True)['显卡平均token'].mean().reset_index()
                 manufacturer_perf = manufacturer_perf.sort_values('显卡平均token', ascending=False)
                 
                 # 统计各制造商的显卡数量
-                manufacturer_count = filtered_df.groupby('制造商').size().reset_index(name='数量')
+                manufacturer_count = filtered_df.groupby('制造商', observed=True).size().reset_index(name='数量')
                 
                 # 使用两列布局
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     # 厂商平均性能
-                    fig = px.bar(
-                        manufacturer_perf,
-                        x='制造商',
-                        y='显卡平均token',
-                        title='各厂商GPU平均性能对比',
-                        labels={'显卡平均token': '平均每秒处理token数', '制造商': '制造商'},
-                        color='显卡平均token',
-                        color_continuous_scale='Teal',
-                        text='显卡平均token'
-                    )
+                    def manufacturer_performance_figure():
+                        fig = px.bar(
+                            manufacturer_perf,
+                            x='制造商',
+                            y='显卡平均token',
+                            title='各厂商GPU平均性能对比',
+                            labels={'显卡平均token': '平均每秒处理token数', '制造商': '制造商'},
+                            color='显卡平均token',
+                            color_continuous_scale='Teal',
+                            text='显卡平均token'
+                        )
                     
-                    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-                    fig.update_layout(
-                        height=400,
-                        margin=dict(l=10, r=10, t=50, b=10),
-                        xaxis_title="制造商",
-                        yaxis_title="平均每秒处理token数",
-                        font=dict(size=12),
-                        plot_bgcolor='rgba(240,240,240,0.6)'
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True, key="manufacturer_performance")
+                        fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+                        fig.update_layout(
+                            height=400,
+                            margin=dict(l=10, r=10, t=50, b=10),
+                            xaxis_title="制造商",
+                            yaxis_title="平均每秒处理token数",
+                            font=dict(size=12),
+                            plot_bgcolor='rgba(240,240,240,0.6)'
+                        )
+                        return fig
+
+                    charts.cached_chart("manufacturer_performance", manufacturer_performance_figure, data=manufacturer_perf, use_container_width=True)
                 
                 with col2:
                     # 厂商占比饼图
-                    fig = px.pie(
-                        manufacturer_count,
-                        values='数量',
-                        names='制造商',
-                        title='各厂商GPU数量占比',
-                        hole=0.4,
-                        color_discrete_sequence=px.colors.qualitative.Pastel
-                    )
+                    def manufacturer_share_figure():
+                        fig = px.pie(
+                            manufacturer_count,
+                            values='数量',
+                            names='制造商',
+                            title='各厂商GPU数量占比',
+                            hole=0.4,
+                            color_discrete_sequence=px.colors.qualitative.Pastel
+                        )
                     
-                    fig.update_layout(
-                        height=400,
-                        margin=dict(l=10, r=10, t=50, b=10),
-                        font=dict(size=12)
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True, key="manufacturer_share")
+                        fig.update_layout(
+                            height=400,
+                            margin=dict(l=10, r=10, t=50, b=10),
+                            font=dict(size=12)
+                        )
+                        return fig
+
+                    charts.cached_chart("manufacturer_share", manufacturer_share_figure, data=manufacturer_count, use_container_width=True)
                 
                 # 显示各厂商最强GPU
                 st.markdown("<h3 style='font-size: 1.3rem; color: #3498db; margin-top: 1rem;'>各厂商性能最强GPU</h3>", unsafe_allow_html=True)
                 
-                top_by_manufacturer = filtered_df.loc[filtered_df.groupby('制造商')['显卡平均token'].idxmax()]
+                top_by_manufacturer = filtered_df.loc[filtered_df.groupby('制造商', observed=True)['显卡平均token'].idxmax()]
                 top_by_manufacturer = top_by_manufacturer.sort_values('显卡平均token', ascending=False)
                 
                 # 使用多列布局展示各厂商最强GPU
@@ -354,139 +361,100 @@ def main():
                         </div>
                         """, unsafe_allow_html=True)
             
-            with tab3:
+            if active_tab == 2:
                 st.markdown("<h3 class='sub-header'>显卡系列分析</h3>", unsafe_allow_html=True)
                 
-                # 提取NVIDIA系列信息（如GeForce、Tesla等）
-                nvidia_df = filtered_df[filtered_df['显卡名称'].str.contains('NVIDIA')]
-                
-                # 提取系列名称
-                def extract_series(name):
-                    parts = name.split()
-                    if len(parts) > 1:
-                        if parts[1] == 'GeForce':
-                            return 'GeForce'
-                        elif parts[1] == 'Tesla':
-                            return 'Tesla'
-                        elif parts[1] == 'Quadro':
-                            return 'Quadro'
-                        elif parts[1] == 'TITAN':
-                            return 'TITAN'
-                        elif parts[1] == 'RTX' and 'Quadro' not in name:
-                            return 'RTX Professional'
-                        elif parts[1] == 'A' and len(parts[1]) <= 2:
-                            return 'A Series'
-                        elif parts[1] == 'H' and len(parts[1]) <= 2:
-                            return 'H Series'
-                        elif 'Jetson' in name:
-                            return 'Jetson'
-                        else:
-                            return 'Other'
-                    return 'Other'
-                
-                nvidia_df['系列'] = nvidia_df['显卡名称'].apply(extract_series)
+                # NVIDIA系列信息（如GeForce、Tesla等）已在加载数据时解析为“系列”列
+                nvidia_df = filtered_df[filtered_df['制造商'] == 'NVIDIA']
                 
                 # 按系列分组计算平均性能
-                series_perf = nvidia_df.groupby('系列')['显卡平均token'].mean().reset_index()
+                series_perf = nvidia_df.groupby('系列', observed=True)['显卡平均token'].mean().reset_index()
                 series_perf = series_perf.sort_values('显卡平均token', ascending=False)
                 
                 # 统计各系列的显卡数量
-                series_count = nvidia_df.groupby('系列').size().reset_index(name='数量')
+                series_count = nvidia_df.groupby('系列', observed=True).size().reset_index(name='数量')
                 
                 # NVIDIA系列平均性能
-                fig = px.bar(
-                    series_perf,
-                    x='系列',
-                    y='显卡平均token',
-                    title='NVIDIA各系列GPU平均性能对比',
-                    labels={'显卡平均token': '平均每秒处理token数', '系列': '系列'},
-                    color='显卡平均token',
-                    color_continuous_scale='Greens',
-                    text='显卡平均token'
-                )
-                
-                fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-                fig.update_layout(
-                    height=500,
-                    xaxis_title="系列",
-                    yaxis_title="平均每秒处理token数",
-                    font=dict(size=12),
-                    plot_bgcolor='rgba(240,240,240,0.8)'
-                )
+                def series_performance_figure():
+                    fig = px.bar(
+                        series_perf,
+                        x='系列',
+                        y='显卡平均token',
+                        title='NVIDIA各系列GPU平均性能对比',
+                        labels={'显卡平均token': '平均每秒处理token数', '系列': '系列'},
+                        color='显卡平均token',
+                        color_continuous_scale='Greens',
+                        text='显卡平均token'
+                    )
                 
+                    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+                    fig.update_layout(
+                        height=500,
+                        xaxis_title="系列",
+                        yaxis_title="平均每秒处理token数",
+                        font=dict(size=12),
+                        plot_bgcolor='rgba(240,240,240,0.8)'
+                    )
+                    return fig
+
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    st.plotly_chart(fig, use_container_width=True, key="series_performance")
+                    charts.cached_chart("series_performance", series_performance_figure, data=series_perf, use_container_width=True)
                 
                 with col2:
                     # 系列占比饼图
-                    fig = px.pie(
-                        series_count,
-                        values='数量',
-                        names='系列',
-                        title='NVIDIA各系列GPU数量占比',
-                        color_discrete_sequence=px.colors.qualitative.Safe
-                    )
-                    
-                    fig.update_layout(
-                        height=500,
-                        font=dict(size=12)
-                    )
+                    def series_share_figure():
+                        fig = px.pie(
+                            series_count,
+                            values='数量',
+                            names='系列',
+                            title='NVIDIA各系列GPU数量占比',
+                            color_discrete_sequence=px.colors.qualitative.Safe
+                        )
                     
-                    st.plotly_chart(fig, use_container_width=True, key="series_share")
-                
-                # 提取GeForce系列的代数信息（如RTX 3000, RTX 4000等）
-                geforce_df = nvidia_df[nvidia_df['显卡名称'].str.contains('GeForce')]
-                
-                # 提取代数信息
-                def extract_generation(name):
-                    if 'RTX 5' in name:
-                        return 'RTX 5000'
-                    elif 'RTX 4' in name:
-                        return 'RTX 4000'
-                    elif 'RTX 3' in name:
-                        return 'RTX 3000'
-                    elif 'RTX 2' in name:
-                        return 'RTX 2000'
-                    elif 'GTX 16' in name:
-                        return 'GTX 1600'
-                    elif 'GTX 10' in name:
-                        return 'GTX 1000'
-                    else:
-                        return 'Other'
+                        fig.update_layout(
+                            height=500,
+                            font=dict(size=12)
+                        )
+                        return fig
+
+                    charts.cached_chart("series_share", series_share_figure, data=series_count, use_container_width=True)
+                
+                # GeForce系列的代数信息（如RTX 3000, RTX 4000等）同样在加载数据时解析为“代数”列
+                geforce_df = nvidia_df[nvidia_df['系列'] == 'GeForce']
                 
                 if not geforce_df.empty:
-                    geforce_df['代数'] = geforce_df['显卡名称'].apply(extract_generation)
-                    
                     # 按代数分组计算平均性能
-                    gen_perf = geforce_df.groupby('代数')['显卡平均token'].mean().reset_index()
+                    gen_perf = geforce_df.groupby('代数', observed=True)['显卡平均token'].mean().reset_index()
                     gen_perf = gen_perf.sort_values('显卡平均token', ascending=False)
                     
                     # GeForce各代性能对比
-                    fig = px.bar(
-                        gen_perf,
-                        x='代数',
-                        y='显卡平均token',
-                        title='GeForce各代GPU平均性能对比',
-                        labels={'显卡平均token': '平均每秒处理token数', '代数': '代数'},
-                        color='显卡平均token',
-                        color_continuous_scale='Plasma',
-                        text='显卡平均token'
-                    )
+                    def geforce_performance_figure():
+                        fig = px.bar(
+                            gen_perf,
+                            x='代数',
+                            y='显卡平均token',
+                            title='GeForce各代GPU平均性能对比',
+                            labels={'显卡平均token': '平均每秒处理token数', '代数': '代数'},
+                            color='显卡平均token',
+                            color_continuous_scale='Plasma',
+                            text='显卡平均token'
+                        )
                     
-                    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
-                    fig.update_layout(
-                        height=500,
-                        xaxis_title="代数",
-                        yaxis_title="平均每秒处理token数",
-                        font=dict(size=12),
-                        plot_bgcolor='rgba(240,240,240,0.8)'
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True, key="geforce_performance")
+                        fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+                        fig.update_layout(
+                            height=500,
+                            xaxis_title="代数",
+                            yaxis_title="平均每秒处理token数",
+                            font=dict(size=12),
+                            plot_bgcolor='rgba(240,240,240,0.8)'
+                        )
+                        return fig
+
+                    charts.cached_chart("geforce_performance", geforce_performance_figure, data=gen_perf, use_container_width=True)
             
-            with tab4:
+            if active_tab == 3:
                 st.markdown("<h3 class='sub-header'>AI开发框架分析</h3>", unsafe_allow_html=True)
                 
                 # AI框架市场份额数据
@@ -497,27 +465,29 @@ def main():
                 df_framework = pd.DataFrame(framework_data)
                 
                 # 创建饼图
-                fig = px.pie(
-                    df_framework,
-                    values='Share',
-                    names='Framework',
-                    title='AI开发框架市场份额分布',
-                    hole=0.4,
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                
-                fig.update_traces(textinfo='percent+label')
-                fig.update_layout(
-                    height=500,
-                    font=dict(size=12),
-                    title_x=0.5,
-                    annotations=[dict(text='市场份额', x=0.5, y=0.5, font_size=20, showarrow=False)]
-                )
+                def framework_share_figure():
+                    fig = px.pie(
+                        df_framework,
+                        values='Share',
+                        names='Framework',
+                        title='AI开发框架市场份额分布',
+                        hole=0.4,
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
                 
+                    fig.update_traces(textinfo='percent+label')
+                    fig.update_layout(
+                        height=500,
+                        font=dict(size=12),
+                        title_x=0.5,
+                        annotations=[dict(text='市场份额', x=0.5, y=0.5, font_size=20, showarrow=False)]
+                    )
+                    return fig
+
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    st.plotly_chart(fig, use_container_width=True, key="framework_share")
+                    charts.cached_chart("framework_share", framework_share_figure, data=df_framework, use_container_width=True)
                 
                 with col2:
                     st.markdown("""
@@ -538,7 +508,7 @@ def main():
                     </div>
                     """, unsafe_allow_html=True)
             
-            with tab5:
+            if active_tab == 4:
                 st.markdown("<h3 class='sub-header'>数据中心GPU市场分析</h3>", unsafe_allow_html=True)
                 
                 # 数据中心GPU市场份额数据
@@ -551,48 +521,50 @@ def main():
                 df_market = pd.DataFrame(market_data)
                 
                 # 创建折线图
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=df_market['Year'],
-                    y=df_market['NVIDIA'],
-                    name='NVIDIA',
-                    line=dict(color='#76b900', width=3),
-                    mode='lines+markers'
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=df_market['Year'],
-                    y=df_market['AMD'],
-                    name='AMD',
-                    line=dict(color='#ed1c24', width=3),
-                    mode='lines+markers'
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=df_market['Year'],
-                    y=df_market['Intel'],
-                    name='Intel',
-                    line=dict(color='#0071c5', width=3),
-                    mode='lines+markers'
-                ))
-                
-                fig.update_layout(
-                    title='数据中心GPU市场份额趋势 (2017-2024)',
-                    xaxis_title='年份',
-                    yaxis_title='市场份额 (%)',
-                    height=500,
-                    hovermode='x unified',
-                    yaxis=dict(range=[0, 100]),
-                    legend=dict(
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="left",
-                        x=0.01
-                    )
-                )
+                def market_share_figure():
+                    fig = go.Figure()
+                
+                    fig.add_trace(go.Scatter(
+                        x=df_market['Year'],
+                        y=df_market['NVIDIA'],
+                        name='NVIDIA',
+                        line=dict(color='#76b900', width=3),
+                        mode='lines+markers'
+                    ))
+                
+                    fig.add_trace(go.Scatter(
+                        x=df_market['Year'],
+                        y=df_market['AMD'],
+                        name='AMD',
+                        line=dict(color='#ed1c24', width=3),
+                        mode='lines+markers'
+                    ))
+                
+                    fig.add_trace(go.Scatter(
+                        x=df_market['Year'],
+                        y=df_market['Intel'],
+                        name='Intel',
+                        line=dict(color='#0071c5', width=3),
+                        mode='lines+markers'
+                    ))
                 
-                st.plotly_chart(fig, use_container_width=True, key="market_share_trend")
+                    fig.update_layout(
+                        title='数据中心GPU市场份额趋势 (2017-2024)',
+                        xaxis_title='年份',
+                        yaxis_title='市场份额 (%)',
+                        height=500,
+                        hovermode='x unified',
+                        yaxis=dict(range=[0, 100]),
+                        legend=dict(
+                            yanchor="top",
+                            y=0.99,
+                            xanchor="left",
+                            x=0.01
+                        )
+                    )
+                    return fig
+
+                charts.cached_chart("market_share_trend", market_share_figure, data=df_market, use_container_width=True)
                 
                 # 市场分析说明
                 st.markdown("""
@@ -628,7 +600,7 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
             
-            with tab6:
+            if active_tab == 5:
                 st.markdown("<h3 class='sub-header'>多维对比</h3>", unsafe_allow_html=True)
                 
                 # 多选特定显卡进行对比
@@ -645,59 +617,69 @@ def main():
                     
                     # 创建雷达图
                     categories = ['性能', '排名', '显卡数量']
+                    # 归一化用的全表最大值，直接取自筛选索引的排序结果
+                    max_token, max_rank, max_cards = (
+                        gpu_filter.bounds(col)[1] for col in ('显卡平均token', '排名', '显卡数量'))
                     
-                    fig = go.Figure()
+                    def multi_comparison_figure():
+                        fig = go.Figure()
                     
-                    for _, row in comparison_df.iterrows():
-                        # 归一化数据
-                        performance = row['显卡平均token'] / df['显卡平均token'].max()
-                        rank_inv = 1 - ((row['排名'] - 1) / (df['排名'].max() - 1))  # 排名越低，值越高
-                        count = row['显卡数量'] / df['显卡数量'].max()
+                        for _, row in comparison_df.iterrows():
+                            # 归一化数据
+                            performance = row['显卡平均token'] / max_token
+                            rank_inv = 1 - ((row['排名'] - 1) / (max_rank - 1))  # 排名越低，值越高
+                            count = row['显卡数量'] / max_cards
                         
-                        fig.add_trace(go.Scatterpolar(
-                            r=[performance, rank_inv, count],
-                            theta=categories,
-                            fill='toself',
-                            name=row['显卡名称']
-                        ))
-                    
-                    fig.update_layout(
-                        polar=dict(
-                            radialaxis=dict(
-                                visible=True,
-                                range=[0, 1]
-                            )
-                        ),
-                        title="GPU多维度比较",
-                        height=600,
-                        showlegend=True
-                    )
+                            fig.add_trace(go.Scatterpolar(
+                                r=[performance, rank_inv, count],
+                                theta=categories,
+                                fill='toself',
+                                name=row['显卡名称']
+                            ))
                     
-                    st.plotly_chart(fig, use_container_width=True, key="multi_comparison")
+                        fig.update_layout(
+                            polar=dict(
+                                radialaxis=dict(
+                                    visible=True,
+                                    range=[0, 1]
+                                )
+                            ),
+                            title="GPU多维度比较",
+                            height=600,
+                            showlegend=True
+                        )
+                        return fig
+
+                    # 雷达图按全表最大值归一化，这些最大值也是图表依赖的数据
+                    charts.cached_chart("multi_comparison", multi_comparison_figure,
+                                        data=(comparison_df, (max_token, max_rank, max_cards)),
+                                        use_container_width=True)
                     
                     # 创建并排条形图
-                    fig = go.Figure()
+                    def direct_comparison_figure():
+                        fig = go.Figure()
                     
-                    fig.add_trace(go.Bar(
-                        x=comparison_df['显卡名称'],
-                        y=comparison_df['显卡平均token'],
-                        name='每秒处理token数',
-                        marker_color='#3498db',
-                        text=comparison_df['显卡平均token'].apply(lambda x: f"{x:.2f}")
-                    ))
-                    
-                    fig.update_traces(textposition='outside')
-                    fig.update_layout(
-                        title="性能直接对比",
-                        xaxis_title="GPU型号",
-                        yaxis_title="每秒处理token数",
-                        height=500,
-                        font=dict(size=12),
-                        plot_bgcolor='rgba(240,240,240,0.8)',
-                        xaxis={'categoryorder': 'total descending'}
-                    )
+                        fig.add_trace(go.Bar(
+                            x=comparison_df['显卡名称'],
+                            y=comparison_df['显卡平均token'],
+                            name='每秒处理token数',
+                            marker_color='#3498db',
+                            text=comparison_df['显卡平均token'].apply(lambda x: f"{x:.2f}")
+                        ))
                     
-                    st.plotly_chart(fig, use_container_width=True, key="direct_comparison")
+                        fig.update_traces(textposition='outside')
+                        fig.update_layout(
+                            title="性能直接对比",
+                            xaxis_title="GPU型号",
+                            yaxis_title="每秒处理token数",
+                            height=500,
+                            font=dict(size=12),
+                            plot_bgcolor='rgba(240,240,240,0.8)',
+                            xaxis={'categoryorder': 'total descending'}
+                        )
+                        return fig
+
+                    charts.cached_chart("direct_comparison", direct_comparison_figure, data=comparison_df, use_container_width=True)
                     
                     # 显示详细对比表格
                     st.markdown("<h4 style='color: #3498db;'>详细对比</h4>", unsafe_allow_html=True)
@@ -11,7 +11,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+import sys
 
+# 在仓库根目录或 hejin/ 目录下运行时均可导入共享数据层 datasets
+for _root in (Path.cwd(), Path.cwd().parent):
+    if (_root / "datasets").is_dir():
+        sys.path.insert(0, str(_root))
+        break
+import datasets
 
 # --- 配置 ---
 # 设置绘图风格和中文字体
@@ -37,20 +44,12 @@ def load_drone_data(file_path='data/drone_data.csv'):
         print(f"错误：找不到数据文件 - {data_file}")
         return None
     try:
-        try:
-            data = pd.read_csv(data_file, index_col='Year', encoding='utf-8')
-        except UnicodeDecodeError:
-            data = pd.read_csv(data_file, index_col='Year', encoding='gbk')
+        # 年份索引和各列的数值类型由 datasets.schemas 中登记的结构在解析时确定
+        data = datasets.read_dataset(data_file)
         print(f"成功从 '{data_file}' 加载数据。")
-        data.index = pd.to_numeric(data.index, errors='coerce')
         data = data.dropna(axis=0, how='all')
-        data = data[data.index.notna()]
-        data.index = data.index.astype(int)
         data = data.sort_index()
         print("数据信息:\n", data.info())
-        # 将所有列尝试转为数值，非数值转为 NaN
-        for col in data.columns:
-            data[col] = pd.to_numeric(data[col], errors='coerce')
         return data
     except Exception as e:
         print(f"加载数据时出错: {e}")
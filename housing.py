@@ -1,105 +1,106 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-import os
+
+import charts
+import datasets
+import lazy_tabs
 
 # --- 自定义CSS样式 ---
-st.markdown("""
-<style>
-    /* 主题颜色 */
-    :root {
-        --primary-color: #007bff; /* 蓝色 */
-        --secondary-color: #6c757d; /* 灰色 */
-        --background-color: #f8f9fa;
-        --card-background-color: #ffffff;
-        --text-color: #343a40;
-        --metric-value-color: #0056b3; /* 深蓝色 */
-    }
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        /* 主题颜色 */
+        :root {
+            --primary-color: #007bff; /* 蓝色 */
+            --secondary-color: #6c757d; /* 灰色 */
+            --background-color: #f8f9fa;
+            --card-background-color: #ffffff;
+            --text-color: #343a40;
+            --metric-value-color: #0056b3; /* 深蓝色 */
+        }
 
-    .main-header {
-        font-size: 2.5rem;
-        color: var(--primary-color);
-        text-align: center;
-        margin-bottom: 1.5rem;
-        font-weight: bold;
-        text-shadow: 1px 1px 2px #eee;
-    }
-    .metric-card {
-        background-color: var(--card-background-color);
-        border-radius: 8px;
-        padding: 1.2rem;
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.05);
-        text-align: center;
-        border-top: 4px solid var(--primary-color);
-        height: 100%; /* 卡片等高 */
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    .metric-value {
-        font-size: 2.0rem; /* 稍微调小一点 */
-        font-weight: 600; /* 加粗 */
-        color: var(--metric-value-color);
-        margin-bottom: 0.5rem; /* 值和标签间距 */
-    }
-    .metric-label {
-        font-size: 0.9rem; /* 稍微调小一点 */
-        color: var(--secondary-color);
-        line-height: 1.3; /* 标签行高 */
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 20px;
-        border-bottom: 2px solid #dee2e6; /* 标签栏下划线 */
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: transparent; /* 透明背景 */
-        border-radius: 4px 4px 0px 0px;
-        padding: 10px 20px;
-        border: none; /* 移除默认边框 */
-        border-bottom: 4px solid transparent; /* 底部边框，用于选中效果 */
-        transition: border-bottom 0.3s ease; /* 平滑过渡 */
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: transparent; /* 选中时也透明 */
-        color: var(--primary-color); /* 选中时文字颜色 */
-        border-bottom: 4px solid var(--primary-color); /* 选中时底部边框 */
-    }
-    h3 { /* 子标题样式 */
-        color: var(--primary-color);
-        border-bottom: 2px solid #e9ecef;
-        padding-bottom: 5px;
-        margin-top: 1.5rem;
-        margin-bottom: 1rem;
-    }
-    ul { /* 列表样式 */
-        list-style: none;
-        padding-left: 0;
-    }
-    li::before { /* 自定义列表项符号 */
-        content: "🔹"; /* 使用蓝色菱形 */
-        color: var(--primary-color);
-        display: inline-block;
-        width: 1em;
-        margin-left: -1em;
-        margin-right: 0.5em;
-    }
-</style>
-""", unsafe_allow_html=True)
+        .main-header {
+            font-size: 2.5rem;
+            color: var(--primary-color);
+            text-align: center;
+            margin-bottom: 1.5rem;
+            font-weight: bold;
+            text-shadow: 1px 1px 2px #eee;
+        }
+        .metric-card {
+            background-color: var(--card-background-color);
+            border-radius: 8px;
+            padding: 1.2rem;
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.05);
+            text-align: center;
+            border-top: 4px solid var(--primary-color);
+            height: 100%; /* 卡片等高 */
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }
+        .metric-value {
+            font-size: 2.0rem; /* 稍微调小一点 */
+            font-weight: 600; /* 加粗 */
+            color: var(--metric-value-color);
+            margin-bottom: 0.5rem; /* 值和标签间距 */
+        }
+        .metric-label {
+            font-size: 0.9rem; /* 稍微调小一点 */
+            color: var(--secondary-color);
+            line-height: 1.3; /* 标签行高 */
+        }
+        .stTabs [data-baseweb="tab-list"] {
+            gap: 20px;
+            border-bottom: 2px solid #dee2e6; /* 标签栏下划线 */
+        }
+        .stTabs [data-baseweb="tab"] {
+            height: 50px;
+            white-space: pre-wrap;
+            background-color: transparent; /* 透明背景 */
+            border-radius: 4px 4px 0px 0px;
+            padding: 10px 20px;
+            border: none; /* 移除默认边框 */
+            border-bottom: 4px solid transparent; /* 底部边框，用于选中效果 */
+            transition: border-bottom 0.3s ease; /* 平滑过渡 */
+        }
+        .stTabs [aria-selected="true"] {
+            background-color: transparent; /* 选中时也透明 */
+            color: var(--primary-color); /* 选中时文字颜色 */
+            border-bottom: 4px solid var(--primary-color); /* 选中时底部边框 */
+        }
+        h3 { /* 子标题样式 */
+            color: var(--primary-color);
+            border-bottom: 2px solid #e9ecef;
+            padding-bottom: 5px;
+            margin-top: 1.5rem;
+            margin-bottom: 1rem;
+        }
+        ul { /* 列表样式 */
+            list-style: none;
+            padding-left: 0;
+        }
+        li::before { /* 自定义列表项符号 */
+            content: "🔹"; /* 使用蓝色菱形 */
+            color: var(--primary-color);
+            display: inline-block;
+            width: 1em;
+            margin-left: -1em;
+            margin-right: 0.5em;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
-@st.cache_data
 def load_smart_living_data():
     try:
-        data = pd.read_csv('data/smart_living_data.csv', index_col='Year')
-        return data
+        return datasets.load_smart_living()
     except FileNotFoundError:
         st.error("找不到数据文件：data/smart_living_data.csv")
         return None
 
 def main():
+    load_css()
     # 立即加载数据
     df_trends = load_smart_living_data()
     if df_trends is None:
@@ -188,15 +189,15 @@ def main():
     st.markdown("---")
 
     # --- 创建选项卡 ---
-    tab_home, tab_community, tab_building, tab_trends = st.tabs([
+    active_tab = lazy_tabs.tabs([
         "🏠 **智能家居生态**",
         "🏘️ **智慧社区管理**",
         "🏢 **建筑节能优化**",
         "�� **趋势与政策**"
-    ])
+    ], key="housing_tab")
 
     # --- Tab 1: 智能家居生态 ---
-    with tab_home:
+    if active_tab == 0:
         st.header("智能家居生态系统：全场景联动与用户习惯学习")
         ecosystem_data = data['home_ecosystem']
 
@@ -219,12 +220,12 @@ def main():
             fig_shipments = go.Figure()
             fig_shipments.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Home_Shipments'], mode='lines+markers', name='设备出货量 (亿台)', line=dict(color='royalblue')))
             fig_shipments.update_layout(title='智能家居设备出货量增长趋势', yaxis_title='亿台', hovermode="x unified")
-            st.plotly_chart(fig_shipments, use_container_width=True, key="smart_home_trend")
+            charts.plotly_chart(fig_shipments, use_container_width=True, key="smart_home_trend")
         with cols_chart_home1[1]:
             fig_voice = go.Figure()
             fig_voice.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Home_Voice_Share'], mode='lines+markers', name='AI语音设备占比 (%)', line=dict(color='mediumseagreen')))
             fig_voice.update_layout(title='AI语音控制设备占比趋势', yaxis_title='%', yaxis_range=[0, 100], hovermode="x unified")
-            st.plotly_chart(fig_voice, use_container_width=True, key="adoption_rate")
+            charts.plotly_chart(fig_voice, use_container_width=True, key="adoption_rate")
 
         st.subheader("用户体验与效率提升")
         cols_chart_home2 = st.columns(2)
@@ -232,12 +233,12 @@ def main():
             fig_resp_time = go.Figure()
             fig_resp_time.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Home_Response_Time'], mode='lines+markers', name='平均响应时间 (秒)', line=dict(color='firebrick')))
             fig_resp_time.update_layout(title='设备平均响应时间变化', yaxis_title='秒', hovermode="x unified")
-            st.plotly_chart(fig_resp_time, use_container_width=True, key="response_time")
+            charts.plotly_chart(fig_resp_time, use_container_width=True, key="response_time")
         with cols_chart_home2[1]:
             fig_conn_dev = go.Figure()
             fig_conn_dev.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Home_Connected_Devices'], mode='lines+markers', name='户均连接设备数', line=dict(color='darkorange')))
             fig_conn_dev.update_layout(title='户均智能设备连接数增长', yaxis_title='台', hovermode="x unified")
-            st.plotly_chart(fig_conn_dev, use_container_width=True, key="connected_devices")
+            charts.plotly_chart(fig_conn_dev, use_container_width=True, key="connected_devices")
 
         st.markdown("---")
         st.subheader("典型生态案例：小米AIoT")
@@ -281,7 +282,7 @@ def main():
 
 
     # --- Tab 2: 智慧社区管理 ---
-    with tab_community:
+    if active_tab == 1:
         st.header("智慧社区管理：AI驱动的安全与效率升级")
         community_data = data['community_management']
 
@@ -295,12 +296,12 @@ def main():
             fig_facial = go.Figure()
             fig_facial.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Community_Facial_Adoption'], mode='lines+markers', name='人脸识别门禁普及率 (%)', line=dict(color='purple')))
             fig_facial.update_layout(title='新建小区人脸识别门禁普及率趋势', yaxis_title='%', yaxis_range=[0, 100], hovermode="x unified")
-            st.plotly_chart(fig_facial, use_container_width=True, key="facial_adoption")
+            charts.plotly_chart(fig_facial, use_container_width=True, key="facial_adoption")
         with cols_chart_comm1[1]:
             fig_highrise = go.Figure()
             fig_highrise.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Community_HighRise_Coverage'], mode='lines+markers', name='高空抛物监测覆盖率 (%)', line=dict(color='teal')))
             fig_highrise.update_layout(title='高空抛物监测覆盖率增长', yaxis_title='%', yaxis_range=[0, 100], hovermode="x unified")
-            st.plotly_chart(fig_highrise, use_container_width=True, key="high_rise_coverage")
+            charts.plotly_chart(fig_highrise, use_container_width=True, key="high_rise_coverage")
 
         st.subheader("AI安防：精准识别与主动预警")
         cols_sec = st.columns(3)
@@ -324,18 +325,18 @@ def main():
             fig_parking = go.Figure()
             fig_parking.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Community_Parking_Time'], mode='lines+markers', name='AI引导平均寻位时间 (秒)', line=dict(color='darkgoldenrod')))
             fig_parking.update_layout(title='AI引导下停车场寻位时间变化', yaxis_title='秒', hovermode="x unified")
-            st.plotly_chart(fig_parking, use_container_width=True, key="parking_time")
+            charts.plotly_chart(fig_parking, use_container_width=True, key="parking_time")
         with cols_chart_comm2[1]:
             fig_delivery = go.Figure()
             fig_delivery.add_trace(go.Bar(x=df_trends.index, y=df_trends['Community_Unmanned_Orders'], name='无人配送日单量 (百万单)', marker_color='lightcoral'))
             fig_delivery.update_layout(title='社区无人配送日均订单量增长', yaxis_title='百万单', hovermode="x unified")
-            st.plotly_chart(fig_delivery, use_container_width=True, key="unmanned_orders")
+            charts.plotly_chart(fig_delivery, use_container_width=True, key="unmanned_orders")
 
         st.markdown(f"*   **夜间服务**: 无人配送使夜间服务覆盖率扩大至 `{community_data['unmanned_delivery_night_coverage']}` (例如菜鸟驿站智能柜等)。")
 
 
     # --- Tab 3: 建筑节能优化 ---
-    with tab_building:
+    if active_tab == 2:
         st.header("建筑节能：AI优化与可再生能源整合")
         building_data = data['building_energy']
 
@@ -349,12 +350,12 @@ def main():
             fig_hvac = go.Figure()
             fig_hvac.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Building_HVAC_Reduction'], mode='lines+markers', name='空调能耗降低 (%)', line=dict(color='deepskyblue')))
             fig_hvac.update_layout(title='智能楼宇空调能耗降低趋势', yaxis_title='%', hovermode="x unified")
-            st.plotly_chart(fig_hvac, use_container_width=True, key="hvac_reduction")
+            charts.plotly_chart(fig_hvac, use_container_width=True, key="hvac_reduction")
         with cols_chart_bldg1[1]:
             fig_maint = go.Figure()
             fig_maint.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Building_Maint_Cost_Saving'], mode='lines+markers', name='预测性维护成本节省 (%)', line=dict(color='darkviolet')))
             fig_maint.update_layout(title='预测性维护成本节省趋势', yaxis_title='%', hovermode="x unified")
-            st.plotly_chart(fig_maint, use_container_width=True, key="maintenance_cost")
+            charts.plotly_chart(fig_maint, use_container_width=True, key="maintenance_cost")
 
         st.markdown("---")
         st.subheader("可再生能源效率优化")
@@ -364,12 +365,12 @@ def main():
             fig_pv.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Building_PV_Efficiency_AI'], mode='lines+markers', name='AI优化光伏效率', line=dict(color='limegreen')))
             fig_pv.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Building_PV_Efficiency_Avg'], mode='lines', name='行业平均光伏效率', line=dict(color='gray', dash='dash')))
             fig_pv.update_layout(title='光伏发电效率对比', yaxis_title='%', hovermode="x unified", legend=dict(yanchor="bottom", y=0.01, xanchor="left", x=0.01))
-            st.plotly_chart(fig_pv, use_container_width=True, key="pv_efficiency")
+            charts.plotly_chart(fig_pv, use_container_width=True, key="pv_efficiency")
         with cols_chart_bldg2[1]:
             fig_storage = go.Figure()
             fig_storage.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Building_Storage_Efficiency'], mode='lines+markers', name='储能系统效率 (%)', line=dict(color='tomato')))
             fig_storage.update_layout(title='AI优化储能系统充放电效率趋势', yaxis_title='%', hovermode="x unified")
-            st.plotly_chart(fig_storage, use_container_width=True, key="storage_efficiency")
+            charts.plotly_chart(fig_storage, use_container_width=True, key="storage_efficiency")
 
         st.markdown(f"""
         *   **发电与收益 (华为"零碳社区"案例):**
@@ -379,7 +380,7 @@ def main():
 
 
     # --- Tab 4: 趋势与政策 ---
-    with tab_trends:
+    if active_tab == 3:
         st.header("技术趋势与政策环境")
         trends_data = data['trends_policy']
 
@@ -436,7 +437,7 @@ def main():
         fig_compliance = go.Figure()
         fig_compliance.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Trends_Security_Compliance'], mode='lines+markers', name='数据安全合规产品占比 (%)', line=dict(color='rgb(111, 66, 193)'))) # 紫色
         fig_compliance.update_layout(title='数据安全合规产品占比提升趋势 (目标90%)', yaxis_title='%', yaxis_range=[0, 100], hovermode="x unified")
-        st.plotly_chart(fig_compliance, use_container_width=True, key="compliance_trend")
+        charts.plotly_chart(fig_compliance, use_container_width=True, key="compliance_trend")
 
       
 if __name__ == "__main__":
@@ -1,72 +1,74 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-import os
+
+import charts
+import datasets
+import lazy_tabs
 
 # 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #0056b3; /* 深蓝色 */
-        text-align: center;
-        margin-bottom: 1.5rem;
-        font-weight: bold;
-        text-shadow: 1px 1px 2px #eee;
-    }
-    .metric-card {
-        background-color: #f8f9fa;
-        border-radius: 8px;
-        padding: 1.2rem;
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.05);
-        text-align: center;
-        border-top: 4px solid #007bff; /* 蓝色 */
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    .metric-value {
-        font-size: 2.0rem;
-        font-weight: 600;
-        color: #0056b3;
-        margin-bottom: 0.5rem;
-    }
-    .metric-label {
-        font-size: 0.9rem;
-        color: #6c757d;
-        line-height: 1.3;
-    }
-     .stTabs [data-baseweb="tab-list"] {
-        gap: 20px;
-        border-bottom: 2px solid #dee2e6;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: transparent;
-        border-radius: 4px 4px 0px 0px;
-        padding: 10px 20px;
-        border: none;
-        border-bottom: 4px solid transparent;
-        transition: border-bottom 0.3s ease;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: transparent;
-        color: #007bff;
-        border-bottom: 4px solid #007bff;
-    }
-    h3 {
-        color: #0056b3;
-        border-bottom: 2px solid #e9ecef;
-        padding-bottom: 5px;
-        margin-top: 1.5rem;
-        margin-bottom: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 2.5rem;
+            color: #0056b3; /* 深蓝色 */
+            text-align: center;
+            margin-bottom: 1.5rem;
+            font-weight: bold;
+            text-shadow: 1px 1px 2px #eee;
+        }
+        .metric-card {
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            padding: 1.2rem;
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.05);
+            text-align: center;
+            border-top: 4px solid #007bff; /* 蓝色 */
+            height: 100%;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }
+        .metric-value {
+            font-size: 2.0rem;
+            font-weight: 600;
+            color: #0056b3;
+            margin-bottom: 0.5rem;
+        }
+        .metric-label {
+            font-size: 0.9rem;
+            color: #6c757d;
+            line-height: 1.3;
+        }
+         .stTabs [data-baseweb="tab-list"] {
+            gap: 20px;
+            border-bottom: 2px solid #dee2e6;
+        }
+        .stTabs [data-baseweb="tab"] {
+            height: 50px;
+            white-space: pre-wrap;
+            background-color: transparent;
+            border-radius: 4px 4px 0px 0px;
+            padding: 10px 20px;
+            border: none;
+            border-bottom: 4px solid transparent;
+            transition: border-bottom 0.3s ease;
+        }
+        .stTabs [aria-selected="true"] {
+            background-color: transparent;
+            color: #007bff;
+            border-bottom: 4px solid #007bff;
+        }
+        h3 {
+            color: #0056b3;
+            border-bottom: 2px solid #e9ecef;
+            padding-bottom: 5px;
+            margin-top: 1.5rem;
+            margin-bottom: 1rem;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
 # 静态数据字典 (从文本提取的关键指标)
 data_points = {
@@ -113,11 +115,11 @@ data_points = {
 }
 
 def main():
+    load_css()
     # 从CSV文件加载数据
-    data_file_path = 'data/manufacturing_trends.csv'
-    if os.path.exists(data_file_path):
-        df_trends = pd.read_csv(data_file_path, index_col='Year', encoding='utf-8-sig')
-    else:
+    try:
+        df_trends = datasets.load_manufacturing_trends()
+    except FileNotFoundError:
         st.error("数据文件未找到，请确保 'data/manufacturing_trends.csv' 存在。")
         st.stop()
 
@@ -163,15 +165,15 @@ def main():
     st.markdown("---")
 
     # --- 创建选项卡 ---
-    tab_auto, tab_elec, tab_general, tab_impact = st.tabs([
+    active_tab = lazy_tabs.tabs([
         "🚗 **汽车制造**",
         "📱 **电子制造**",
         "🏭 **通用工业**",
         "📈 **技术突破与产业影响**"
-    ])
+    ], key="industry_tab")
 
     # --- Tab 1: 汽车制造 ---
-    with tab_auto:
+    if active_tab == 0:
         st.header("汽车制造：迈向全流程自动化与柔性生产")
         auto_data = data_points['auto']
 
@@ -201,10 +203,10 @@ def main():
         fig_precision = go.Figure()
         fig_precision.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Welding_Precision'], mode='lines+markers', name='定位精度 (mm)', line=dict(color='royalblue')))
         fig_precision.update_layout(title='AI驱动焊接定位精度提升趋势 (模拟)', yaxis_title='毫米 (mm)', hovermode="x unified", yaxis_range=[0, 0.11])
-        st.plotly_chart(fig_precision, use_container_width=True, key="welding_precision")
+        charts.plotly_chart(fig_precision, use_container_width=True, key="welding_precision")
 
     # --- Tab 2: 电子制造 ---
-    with tab_elec:
+    if active_tab == 1:
         st.header("电子制造：高精度柔性生产与效率优化")
         elec_data = data_points['electronics']
 
@@ -228,7 +230,7 @@ def main():
             st.metric(label="刀具磨损监测准确率", value=elec_data['tool_wear_accuracy'])
 
     # --- Tab 3: 通用工业 ---
-    with tab_general:
+    if active_tab == 2:
         st.header("通用工业：AI赋能复杂与危险场景")
         general_data = data_points['general']
 
@@ -276,7 +278,7 @@ def main():
             st.metric(label="年避免经济损失", value=general_data['economic_loss_avoidance_yearly'])
 
     # --- Tab 4: 技术突破与产业影响 ---
-    with tab_impact:
+    if active_tab == 3:
         st.header("技术突破与产业影响：塑造制造未来")
         general_data = data_points['general']
         battery_case = data_points['battery_case']
@@ -295,12 +297,12 @@ def main():
             fig_pred_acc = go.Figure()
             fig_pred_acc.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Predictive_Maint_Accuracy'], mode='lines+markers', name='预测准确率 (%)', line=dict(color='mediumseagreen')))
             fig_pred_acc.update_layout(title='预测性维护准确率提升趋势', yaxis_title='%', hovermode="x unified", yaxis_range=[65, 100])
-            st.plotly_chart(fig_pred_acc, use_container_width=True, key="predictive_maint_accuracy")
+            charts.plotly_chart(fig_pred_acc, use_container_width=True, key="predictive_maint_accuracy")
         with cols_pred[1]:
             fig_downtime = go.Figure()
             fig_downtime.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Downtime_Reduction'], mode='lines+markers', name='停机时间减少率 (%)', line=dict(color='tomato')))
             fig_downtime.update_layout(title='设备停机时间减少趋势', yaxis_title='%', hovermode="x unified")
-            st.plotly_chart(fig_downtime, use_container_width=True, key="downtime_reduction")
+            charts.plotly_chart(fig_downtime, use_container_width=True, key="downtime_reduction")
 
         st.markdown("---")
         st.subheader("市场规模与渗透率")
@@ -309,13 +311,13 @@ def main():
             fig_market_size = go.Figure()
             fig_market_size.add_trace(go.Bar(x=df_trends.index, y=df_trends['Market_Size_CNY_B'], name='市场规模 (十亿)', marker_color='cornflowerblue'))
             fig_market_size.update_layout(title='中国工业机器人市场规模 (十亿元)', yaxis_title='十亿元', hovermode="x unified")
-            st.plotly_chart(fig_market_size, use_container_width=True, key="market_size")
+            charts.plotly_chart(fig_market_size, use_container_width=True, key="market_size")
         with cols_market[1]:
             fig_density = go.Figure()
             fig_density.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Robot_Density_Auto'], mode='lines+markers', name='汽车行业', line=dict(color='#1f77b4')))
             fig_density.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Robot_Density_Electronics'], mode='lines+markers', name='电子行业', line=dict(color='#ff7f0e')))
             fig_density.update_layout(title='重点行业机器人密度增长 (台/万人)', yaxis_title='台/万人', hovermode="x unified")
-            st.plotly_chart(fig_density, use_container_width=True, key="robot_density")
+            charts.plotly_chart(fig_density, use_container_width=True, key="robot_density")
 
         st.markdown(f"*   **机器人密度**: 2023年汽车、电子行业机器人密度分别达 `{df_trends.loc[year_2023,'Robot_Density_Auto']}` 台/万人和 `{df_trends.loc[year_2023,'Robot_Density_Electronics']}` 台/万人，较2015年增长约3倍。")
 
@@ -326,12 +328,12 @@ def main():
             fig_flex_share = go.Figure()
             fig_flex_share.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Flexible_Line_Share'], mode='lines+markers', name='柔性产线占比 (%)', line=dict(color='purple')))
             fig_flex_share.update_layout(title='AI驱动柔性生产线占比趋势', yaxis_title='%', hovermode="x unified", yaxis_range=[0, 50])
-            st.plotly_chart(fig_flex_share, use_container_width=True, key="flexible_line_share")
+            charts.plotly_chart(fig_flex_share, use_container_width=True, key="flexible_line_share")
         with cols_trends[1]:
             fig_domestic_share = go.Figure()
             fig_domestic_share.add_trace(go.Scatter(x=df_trends.index, y=df_trends['Domestic_Robot_Share'], mode='lines+markers', name='国产化率 (%)', line=dict(color='green')))
             fig_domestic_share.update_layout(title='工业机器人国产化率提升趋势', yaxis_title='%', hovermode="x unified", yaxis_range=[35, 80])
-            st.plotly_chart(fig_domestic_share, use_container_width=True, key="domestic_robot_share")
+            charts.plotly_chart(fig_domestic_share, use_container_width=True, key="domestic_robot_share")
 
         st.markdown("---")
         st.subheader("案例：新能源电池智能制造")
@@ -0,0 +1,133 @@
+"""延迟导入
+
+statsmodels / scipy / matplotlib 等科学计算库导入开销很大，而各页面往往只有某个
+选项卡或某项分析才会用到。lazy_import() 返回一个代理模块，首次访问其属性时才真正
+导入，并把导入耗时记入 IMPORT_TIMINGS，启用性能诊断时显示在侧边栏的面板中（见 profiling）。
+
+命令行用法（统计各页面模块的导入开销）::
+
+    python lazy_imports.py              # 统计 main.py 菜单中的全部页面
+    python lazy_imports.py gpu pdd      # 只统计指定模块
+"""
+import ast
+import importlib
+import subprocess
+import sys
+import threading
+import time
+import types
+
+# 已真正导入的延迟模块及其耗时（秒）
+IMPORT_TIMINGS = {}
+
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """首次访问属性时才导入的代理模块"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    IMPORT_TIMINGS.setdefault(self.__name__, time.perf_counter() - start)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name):
+    """返回延迟导入的模块；若模块已被导入则直接返回真实模块"""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def is_loaded(module):
+    """代理模块是否已经真正导入"""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_module"] is not None
+    return True
+
+
+def measure_import_cost(module_name, python=sys.executable):
+    """在独立子进程中用 -X importtime 测量导入某个模块的开销
+
+    返回 (总耗时秒数, [(顶层包名, 累计耗时秒数), ...])，后者按耗时降序排列。
+    """
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise ImportError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else module_name)
+
+    # importtime 按后序输出：模块自身一行出现在其全部依赖之后，缩进表示嵌套深度
+    packages = {}
+    pending = {}
+    total = 0
+    for line in proc.stderr.splitlines():
+        # 格式: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        cumulative = int(cumulative.strip())
+        if depth == 1:
+            top = name.split(".")[0]
+            pending[top] = pending.get(top, 0) + cumulative
+        elif depth == 0:
+            if name == module_name:
+                total = cumulative
+                packages = pending
+            pending = {}
+    ranked = sorted(((k, v / 1e6) for k, v in packages.items() if k != module_name),
+                    key=lambda item: item[1], reverse=True)
+    return total / 1e6, ranked
+
+
+def import_cost_report(module_names, top=5):
+    """生成各模块导入开销的文本报告"""
+    lines = [f"{'模块':<16}{'导入耗时':>10}  主要依赖"]
+    for name in module_names:
+        try:
+            total, ranked = measure_import_cost(name)
+        except ImportError as e:
+            lines.append(f"{name:<16}{'失败':>10}  {e}")
+            continue
+        deps = ", ".join(f"{pkg} {secs * 1000:.0f}ms" for pkg, secs in ranked[:top])
+        lines.append(f"{name:<16}{total * 1000:>8.0f}ms  {deps}")
+    return "\n".join(lines)
+
+
+def _menu_modules():
+    """从 main.py 中读取 MENU_STRUCTURE 的页面模块名（不执行 main.py）"""
+    with open("main.py", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "MENU_STRUCTURE" for t in node.targets):
+            menu = ast.literal_eval(node.value)
+            return [m for content in menu.values() for m in content["items"].values()]
+    return []
+
+
+if __name__ == "__main__":
+    print(import_cost_report(sys.argv[1:] or _menu_modules()))
@@ -0,0 +1,57 @@
+"""按需渲染的选项卡
+
+st.tabs 只在浏览器端切换显示，每次重跑都会执行全部选项卡的内容，隐藏选项卡里的
+模型拟合、分组汇总和图表也都要计算一遍。tabs() 用一组横向单选按钮（样式与选项卡一致）
+代替，返回当前选中的选项卡序号，页面只执行该选项卡的内容::
+
+    active_tab = lazy_tabs.tabs(["📊 概览", "📈 趋势"], key="example_tab")
+    if active_tab == 0:
+        ...
+    if active_tab == 1:
+        ...
+
+切换选项卡会触发一次重跑，只计算新选中的选项卡；选中状态保存在 session_state 中。
+"""
+import streamlit as st
+
+_CSS = """
+<style>
+    div[role="radiogroup"][aria-label="lazy-tabs"] {
+        gap: 0.5rem;
+        border-bottom: 1px solid rgba(49, 51, 63, 0.2);
+        margin-bottom: 1rem;
+    }
+    div[role="radiogroup"][aria-label="lazy-tabs"] > label {
+        padding: 0.5rem 0.75rem;
+        margin-right: 0;
+        border-bottom: 2px solid transparent;
+    }
+    div[role="radiogroup"][aria-label="lazy-tabs"] > label > div:first-child {
+        display: none;
+    }
+    div[role="radiogroup"][aria-label="lazy-tabs"] > label:has(input:checked) {
+        border-bottom-color: #ff4b4b;
+        color: #ff4b4b;
+    }
+</style>
+"""
+
+
+def tabs(labels, key):
+    """显示选项卡栏并返回当前选中的选项卡序号（从 0 开始）
+
+    key: 保存选中状态的 session_state 键，同一页面内须唯一
+    """
+    labels = list(labels)
+    st.markdown(_CSS, unsafe_allow_html=True)
+    if st.session_state.get(key, 0) >= len(labels):
+        # 选项卡数量变少（如某个选项卡的数据不可用）时回到第一个
+        st.session_state[key] = 0
+    return st.radio(
+        "lazy-tabs",
+        range(len(labels)),
+        format_func=labels.__getitem__,
+        horizontal=True,
+        label_visibility="collapsed",
+        key=key,
+    )
@@ -1,8 +1,9 @@
 import streamlit as st
-import importlib
-import sys
 from pathlib import Path
 
+import profiling
+from page_registry import PageRegistry
+
 # 设置页面配置
 st.set_page_config(
     page_title="AI应用分析平台",
@@ -115,16 +116,18 @@ for category, content in MENU_STRUCTURE.items():
                 args=(category, page, module_name)
             )
 
+# 页面注册表在进程内只创建一次，各页面模块只导入一次
+@st.cache_resource
+def get_page_registry():
+    return PageRegistry(MENU_STRUCTURE)
+
 # 加载选中的模块
 if st.session_state.current_module:
     try:
         st.session_state.is_sub_module = True
-        if st.session_state.current_module not in sys.modules:
-            module = importlib.import_module(st.session_state.current_module)
-        else:
-            module = sys.modules[st.session_state.current_module]
-            importlib.reload(module)
-        if hasattr(module, 'main'):
-            module.main()
+        with profiling.page_run(st.session_state.current_module):
+            get_page_registry().render(st.session_state.current_module)
     except Exception as e:
-        st.error(f"加载模块 {st.session_state.current_module} 时发生错误: {str(e)}") 
\ No newline at end of file
+        st.error(f"加载模块 {st.session_state.current_module} 时发生错误: {str(e)}")
+    # 设置 AI_PLATFORM_PROFILE=1 时在侧边栏显示本次运行的耗时明细
+    profiling.render_panel(st.session_state.current_module) 
\ No newline at end of file
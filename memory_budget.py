@@ -0,0 +1,175 @@
+"""进程内缓存的内存预算
+
+数据集（datasets.cache）、由数据集构建的索引对象和图表（charts）都存放在这里的同一个 LRU 中，
+每个条目记录估算的字节数，按“池”（dataset / resource / figure ...）分别统计。总大小超过
+预算时淘汰最久未使用的条目；池也可以有自己的上限（如图表缓存的 FIGURE_CACHE_MAX_BYTES）。
+被淘汰的条目下次访问时重新构建（数据集从二进制缓存读取，代价很小）。
+放入时标记为 pinned 的条目（各会话长期共享的大数据集）计入总大小，但不会被淘汰：
+会话手里还有它的视图时淘汰并不能释放内存，重新加载反而会多出一份。
+
+数据集和索引对象在各会话间共享、原样返回，不像 st.cache_data 那样每次访问反序列化出一份新的拷贝；
+数据集在放入前已设为只读（见 datasets.cache）。图表以 JSON 形式存放，每次访问重建（见 charts）。
+
+预算默认为 DEFAULT_BUDGET_MB，可用环境变量 AI_PLATFORM_CACHE_MB 修改。用法::
+
+    value = memory_budget.get("figure", key)
+    if value is None:
+        value = memory_budget.put("figure", key, build())
+"""
+import collections
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+BUDGET_ENV = "AI_PLATFORM_CACHE_MB"
+DEFAULT_BUDGET_MB = 1024
+# sizeof() 估算普通对象时递归的最大深度
+_MAX_DEPTH = 4
+
+_lock = threading.RLock()
+# (池, 键) -> (对象, 字节数, 是否常驻)，最近使用的在最后
+_entries = collections.OrderedDict()
+# 池 -> 字节数
+_pool_bytes = collections.Counter()
+# 池 -> 被淘汰的条目数
+_evictions = collections.Counter()
+_total = 0
+
+
+def budget_bytes():
+    """全局预算（字节）"""
+    try:
+        megabytes = float(os.environ.get(BUDGET_ENV) or DEFAULT_BUDGET_MB)
+    except ValueError:
+        megabytes = DEFAULT_BUDGET_MB
+    return int(megabytes * 1024 * 1024)
+
+
+def _pandas_bytes(value):
+    """DataFrame / Series / Index 的 memory_usage(deep=True)
+
+    pandas 3 之前，对只读的 object 数组做 deep 统计会报错（buffer source array is read-only）。
+    只读的都是 datasets.cache 冻结的缓存数据集（或索引对象中引用的它们），字符串已在数据集
+    自身的条目中按冻结前的大小计入，这里只统计数组本身。
+    """
+    try:
+        usage = value.memory_usage(deep=True)
+    except ValueError:
+        usage = value.memory_usage(deep=False)
+    return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+
+
+def sizeof(value, _depth=0):
+    """对象占用内存的估算值（字节）：DataFrame 按 memory_usage(deep=True)，其他对象递归统计"""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        return _pandas_bytes(value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if _depth >= _MAX_DEPTH:
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k, _depth + 1) + sizeof(v, _depth + 1)
+                                          for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(sizeof(v, _depth + 1) for v in value)
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return sys.getsizeof(value) + sizeof(vars(value), _depth + 1)
+    return sys.getsizeof(value)
+
+
+def _remove(entry_key):
+    global _total
+    _, size, _ = _entries.pop(entry_key)
+    _pool_bytes[entry_key[0]] -= size
+    _total -= size
+
+
+def _evict(limit, pool=None):
+    """淘汰最久未使用的条目，直到（池 pool 的或全局的）总大小不超过 limit"""
+    while True:
+        used = _pool_bytes[pool] if pool is not None else _total
+        if used <= limit:
+            return
+        victim = next((k for k, (_, _, pinned) in _entries.items()
+                       if not pinned and (pool is None or k[0] == pool)), None)
+        if victim is None:
+            return
+        _remove(victim)
+        _evictions[victim[0]] += 1
+
+
+def get(pool, key):
+    """取出缓存的对象并标记为最近使用，不存在时返回 None"""
+    with _lock:
+        entry = _entries.get((pool, key))
+        if entry is None:
+            return None
+        _entries.move_to_end((pool, key))
+        return entry[0]
+
+
+def put(pool, key, value, nbytes=None, pool_max_bytes=None, pinned=False):
+    """放入对象并按预算淘汰，返回 value
+
+    nbytes: 对象大小，不给出时由 sizeof() 估算
+    pool_max_bytes: 该池自己的上限；单个对象超过上限（或全局预算）时不缓存
+    pinned: 常驻，不会被淘汰，也不受上述大小限制
+    """
+    global _total
+    size = sizeof(value) if nbytes is None else nbytes
+    limit = budget_bytes()
+    with _lock:
+        if (pool, key) in _entries:
+            _remove((pool, key))
+        too_large = size > limit or (pool_max_bytes is not None and size > pool_max_bytes)
+        if too_large and not pinned:
+            return value
+        _entries[(pool, key)] = (value, size, pinned)
+        _pool_bytes[pool] += size
+        _total += size
+        if pool_max_bytes is not None:
+            _evict(pool_max_bytes, pool)
+        _evict(limit)
+    return value
+
+
+def discard(pool, key):
+    """删除一个条目（不存在时忽略）"""
+    with _lock:
+        if (pool, key) in _entries:
+            _remove((pool, key))
+
+
+def clear(pool=None):
+    """清空某个池，pool 为 None 时清空全部"""
+    with _lock:
+        for entry_key in [k for k in _entries if pool is None or k[0] == pool]:
+            _remove(entry_key)
+
+
+def items(pool):
+    """某个池中的全部 (键, 对象, 字节数)，最久未使用的在前；不改变使用顺序"""
+    with _lock:
+        return [(key, value, size) for (p, key), (value, size, _) in _entries.items() if p == pool]
+
+
+def info():
+    """预算与各池的使用情况
+
+    {'budget', 'bytes', 'pinned_bytes', 'pools': {池: {'entries', 'bytes', 'evictions'}}}
+    """
+    with _lock:
+        counts = collections.Counter(pool for pool, _ in _entries)
+        pools = {pool: {"entries": counts[pool], "bytes": _pool_bytes[pool], "evictions": _evictions[pool]}
+                 for pool in sorted(set(counts) | set(_evictions))}
+        pinned = sum(size for _, size, is_pinned in _entries.values() if is_pinned)
+        return {"budget": budget_bytes(), "bytes": _total, "pinned_bytes": pinned, "pools": pools}
+
+
+def entries():
+    """全部条目 [(池, 键, 字节数, 是否常驻)]，最久未使用的在前"""
+    with _lock:
+        return [(pool, key, size, pinned) for (pool, key), (_, size, pinned) in _entries.items()]
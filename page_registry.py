@@ -0,0 +1,77 @@
+import importlib
+import os
+import sys
+import threading
+
+# 开发模式开关：设置环境变量 AI_PLATFORM_DEV=1 后，页面文件修改会触发重新加载
+DEV_MODE_ENV = "AI_PLATFORM_DEV"
+
+
+def is_dev_mode():
+    """是否处于开发模式"""
+    return os.environ.get(DEV_MODE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class PageRegistry:
+    """页面注册表
+
+    每个 MENU_STRUCTURE 中的页面模块只导入一次，并缓存其 main() 作为渲染函数。
+    页面模块导入时不应渲染任何内容，所有输出（包括 load_css()）都放在 main() 中。
+    Streamlit 每次重跑时只调用该函数，不再 reload 模块；
+    只有在开发模式下检测到页面文件被修改时才会重新加载。
+    """
+
+    def __init__(self, menu_structure):
+        self._pages = {}
+        for category, content in menu_structure.items():
+            for page, module_name in content["items"].items():
+                self._pages[module_name] = (category, page)
+        self._renderers = {}
+        self._paths = {}
+        self._mtimes = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, module_name):
+        return module_name in self._pages
+
+    @property
+    def module_names(self):
+        return list(self._pages)
+
+    def get(self, module_name):
+        """返回页面的渲染函数，必要时导入（或在开发模式下重新加载）模块"""
+        if module_name not in self._pages:
+            raise KeyError(f"未注册的页面模块: {module_name}")
+        with self._lock:
+            if module_name not in self._renderers or (is_dev_mode() and self._is_stale(module_name)):
+                self._load(module_name)
+            return self._renderers[module_name]
+
+    def render(self, module_name):
+        self.get(module_name)()
+
+    def _is_stale(self, module_name):
+        path = self._paths.get(module_name)
+        return path is not None and _file_mtime(path) != self._mtimes.get(module_name)
+
+    def _load(self, module_name):
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        elif module_name in self._renderers:
+            # 仅在已加载过且文件发生变化时才会走到这里
+            module = importlib.reload(module)
+        if not callable(getattr(module, "main", None)):
+            raise AttributeError(f"页面模块 {module_name} 缺少 main() 入口")
+
+        path = getattr(module, "__file__", None)
+        self._renderers[module_name] = module.main
+        self._paths[module_name] = path
+        self._mtimes[module_name] = _file_mtime(path) if path else None
@@ -4,27 +4,23 @@ from scipy import stats
 import matplotlib.pyplot as plt
 import seaborn as sns
 import warnings
+
+import correlation
+import datasets
+
 warnings.filterwarnings('ignore')
 
 # 设置中文字体，确保图表能正确显示中文
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
 
-# 读取数据
-education_funding = pd.read_csv('data/专利教育/china_education_funding.csv')
-ai_models = pd.read_csv('data/专利教育/历年知名AI模型数量_地区对比.csv')
-ai_patents = pd.read_csv('data/专利教育/全球AI专利占比_按地区.csv')
-
-# 数据预处理 - 教育经费
-education_funding_melted = pd.melt(education_funding, 
-                                 id_vars=['指标'], 
-                                 var_name='年份', 
-                                 value_name='经费')
-education_funding_melted['年份'] = education_funding_melted['年份'].str.replace('年', '').astype(int)
-education_funding_melted['经费'] = education_funding_melted['经费'].astype(float)
+# 读取数据（加载与清洗逻辑与页面共用，见 datasets）
+education_funding_melted = datasets.load_education_funding()
+ai_models = datasets.load_ai_models()
+ai_patents = datasets.load_ai_patents()
 
 # 数据预处理 - AI模型数量
-ai_models_china = ai_models[ai_models['地区'] == '中国']
+ai_models_china = datasets.by_region(ai_models, '中国')
 
 def get_correlation_strength(correlation):
     """根据相关系数判断相关强度"""
@@ -45,7 +41,7 @@ def format_number(number):
 def plot_heatmap(data, columns, title, filename):
     """绘制并保存相关性热力图"""
     plt.figure(figsize=(10, 8))
-    corr_matrix = data[columns].corr(method='spearman')
+    corr_matrix = correlation.spearman(data, columns)['corr']
     sns.heatmap(corr_matrix, 
                 annot=True, 
                 cmap='coolwarm', 
@@ -100,8 +96,8 @@ def analyze_correlations():
                              right_on='年份',
                              how='inner')
     
-    spearman_corr_model, p_value_model = stats.spearmanr(merged_models['经费'], 
-                                                         merged_models['知名AI模型数量'])
+    spearman_corr_model, p_value_model = correlation.pair(
+        correlation.spearman(merged_models, ['经费', '知名AI模型数量']), '经费', '知名AI模型数量')
     
     print("1. 教育经费与AI模型数量相关性：")
     print(f"   - 相关系数: {spearman_corr_model:.3f}")
@@ -116,7 +112,7 @@ def analyze_correlations():
                  'spearman_models_correlation.png')
 
     # --- 教育经费与AI专利占比 --- 
-    china_patents = ai_patents[ai_patents['地区'] == '中国']
+    china_patents = datasets.by_region(ai_patents, '中国')
     if not china_patents.empty:
         merged_patents = pd.merge(education_funding_melted,
                                 china_patents,
@@ -125,8 +121,8 @@ def analyze_correlations():
                                 how='inner')
         if not merged_patents.empty:
             patent_column_name = 'AI专利占比(占全球总数百分比)'
-            spearman_corr_patent, p_value_patent = stats.spearmanr(merged_patents['经费'],
-                                                                  merged_patents[patent_column_name])
+            spearman_corr_patent, p_value_patent = correlation.pair(
+                correlation.spearman(merged_patents, ['经费', patent_column_name]), '经费', patent_column_name)
             
             print("\n2. 教育经费与AI专利占比相关性：")
             print(f"   - 相关系数: {spearman_corr_patent:.3f}")
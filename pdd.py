@@ -6,56 +6,62 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import random
 import os
-from scipy import stats
-import plotly.figure_factory as ff
+
+import charts
+import correlation
+import datasets
+import lazy_tabs
+from lazy_imports import lazy_import
+
+# scipy 和 figure_factory 只在专利与教育分析选项卡用到，延迟导入
+stats = lazy_import("scipy.stats")
+ff = lazy_import("plotly.figure_factory")
 
 # 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #000000;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-        font-family: 'SimHei', sans-serif;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        color: #000000;
-        margin-top: 2rem;
-        border-bottom: 2px solid #FF6B6B;
-        padding-bottom: 0.5rem;
-        font-family: 'SimHei', sans-serif;
-    }
-    .metric-card {
-        background-color: white;
-        border-radius: 10px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        text-align: center;
-    }
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #FF6B6B;
-    }
-    .metric-label {
-        font-size: 1rem;
-        color: #666;
-    }
-</style>
-""", unsafe_allow_html=True)
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 2.5rem;
+            color: #000000;
+            text-align: center;
+            margin-bottom: 1rem;
+            font-weight: bold;
+            font-family: 'SimHei', sans-serif;
+        }
+        .sub-header {
+            font-size: 1.8rem;
+            color: #000000;
+            margin-top: 2rem;
+            border-bottom: 2px solid #FF6B6B;
+            padding-bottom: 0.5rem;
+            font-family: 'SimHei', sans-serif;
+        }
+        .metric-card {
+            background-color: white;
+            border-radius: 10px;
+            padding: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            text-align: center;
+        }
+        .metric-value {
+            font-size: 2.5rem;
+            font-weight: bold;
+            color: #FF6B6B;
+        }
+        .metric-label {
+            font-size: 1rem;
+            color: #666;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
 # 替换generate_data函数为load_data函数
-@st.cache_data
 def load_data():
-    """从CSV文件加载数据"""
+    """从CSV文件加载数据（date 列已转换为 datetime）"""
     try:
-        df = pd.read_csv('data/pdd_data.csv')
-        # 将date列转换为datetime类型
-        df['date'] = pd.to_datetime(df['date'])
-        return df
+        return datasets.load_pdd_gmv()
     except Exception as e:
         st.error(f"读取数据文件失败: {e}")
         return None
@@ -64,39 +70,25 @@ def load_data():
 # if not os.path.exists('data'):
 #     os.makedirs('data')
 
-# 加载数据
-df = load_data()
-
-@st.cache_data
 def load_education_funding():
     try:
-        df = pd.read_csv('data/专利教育/china_education_funding.csv')
-        df_melted = pd.melt(df, id_vars=['指标'], var_name='年份', value_name='经费')
-        df_melted['年份'] = df_melted['年份'].str.replace('年', '').astype(int)
-        df_melted['经费'] = df_melted['经费'].astype(float)
-        return df_melted
+        return datasets.load_education_funding()
     except Exception as e:
         st.error(f"读取教育经费数据失败: {e}")
         return None
 
-@st.cache_data
 def load_ai_models():
     try:
-        df = pd.read_csv('data/专利教育/历年知名AI模型数量_地区对比.csv')
         # 筛选中国数据
-        df_china = df[df['地区'] == '中国'].copy()
-        return df_china
+        return datasets.by_region(datasets.load_ai_models(), '中国')
     except Exception as e:
         st.error(f"读取AI模型数据失败: {e}")
         return None
 
-@st.cache_data
 def load_ai_patents():
     try:
-        df = pd.read_csv('data/专利教育/全球AI专利占比_按地区.csv')
         # 筛选中国数据
-        df_china = df[df['地区'] == '中国'].copy()
-        return df_china
+        return datasets.by_region(datasets.load_ai_patents(), '中国')
     except Exception as e:
         st.error(f"读取AI专利数据失败: {e}")
         return None
@@ -115,6 +107,10 @@ def format_number(number):
         return str(number)
 
 def main():
+    load_css()
+    charts.full_resolution_toggle()
+    # 加载数据
+    df = load_data()
     if df is not None:
         # 标题
         st.markdown("<h1 class='main-header'>中国AI产业应用与教育投入的关联分析</h1>", unsafe_allow_html=True)
@@ -128,9 +124,9 @@ def main():
         if show_patent_tab:
             tab_titles.append("🎓 专利与教育分析")
 
-        tabs = st.tabs(tab_titles)
+        active_tab = lazy_tabs.tabs(tab_titles, key="pdd_tab")
 
-        with tabs[0]:
+        if active_tab == 0:
             st.markdown("<h2 class='sub-header'>转化率对比分析</h2>", unsafe_allow_html=True)
             
             # 转化率趋势对比
@@ -159,7 +155,7 @@ def main():
                 yaxis_tickformat='.0%'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="conversion_trend")
+            charts.plotly_chart(fig, use_container_width=True, key="conversion_trend")
             
             # 转化率提升分析
             improvement = (df['pdd_conversion'] - df['industry_avg_conversion']) / df['industry_avg_conversion'] * 100
@@ -174,9 +170,9 @@ def main():
             )
             
             fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True, key="conversion_improvement")
+            charts.plotly_chart(fig, use_container_width=True, key="conversion_improvement")
 
-        with tabs[1]:
+        if active_tab == 1:
             st.markdown("<h2 class='sub-header'>GMV增长趋势</h2>", unsafe_allow_html=True)
             
             # GMV趋势分析
@@ -205,13 +201,11 @@ def main():
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="gmv_trend")
+            charts.plotly_chart(fig, use_container_width=True, key="gmv_trend")
             
-            # 按年度统计
-            yearly_data = df.groupby('year').agg({
-                'total_gmv': 'sum',
-                'ai_contributed_gmv': 'sum'
-            }).reset_index()
+            # 按年度统计（读取增量维护的汇总结果，不再对全部历史数据做 groupby）
+            rollups = datasets.load_pdd_rollups()
+            yearly_data = rollups.sums('year', ['total_gmv', 'ai_contributed_gmv'])
             
             yearly_data['ai_contribution_rate'] = yearly_data['ai_contributed_gmv'] / yearly_data['total_gmv'] * 100
             
@@ -227,7 +221,7 @@ def main():
                     labels={'value': 'GMV (亿元)', 'year': '年份', 'variable': '类型'},
                     color_discrete_sequence=['#FF6B6B', '#FFB6B6']
                 )
-                st.plotly_chart(fig, use_container_width=True, key="yearly_gmv")
+                charts.plotly_chart(fig, use_container_width=True, key="yearly_gmv")
             
             with col2:
                 fig = px.line(
@@ -239,17 +233,14 @@ def main():
                     markers=True
                 )
                 fig.update_traces(line_color='#FF6B6B')
-                st.plotly_chart(fig, use_container_width=True, key="ai_contribution_rate")
+                charts.plotly_chart(fig, use_container_width=True, key="ai_contribution_rate")
 
-        with tabs[2]:
+        if active_tab == 2:
             st.markdown("<h2 class='sub-header'>AI对电商的影响分析</h2>", unsafe_allow_html=True)
             
             # AI效果分析
-            monthly_avg = df.groupby('month').agg({
-                'pdd_conversion': 'mean',
-                'industry_avg_conversion': 'mean',
-                'ai_contributed_gmv': 'mean'
-            }).reset_index()
+            monthly_avg = datasets.load_pdd_rollups().means(
+                'month', ['pdd_conversion', 'industry_avg_conversion', 'ai_contributed_gmv'])
             
             col1, col2 = st.columns(2)
             
@@ -280,7 +271,7 @@ def main():
                     yaxis_tickformat='.0%'
                 )
                 
-                st.plotly_chart(fig, use_container_width=True, key="monthly_conversion")
+                charts.plotly_chart(fig, use_container_width=True, key="monthly_conversion")
             
             with col2:
                 # AI贡献GMV的月度模式
@@ -293,7 +284,7 @@ def main():
                     markers=True
                 )
                 fig.update_traces(line_color='#FF6B6B')
-                st.plotly_chart(fig, use_container_width=True, key="monthly_ai_gmv")
+                charts.plotly_chart(fig, use_container_width=True, key="monthly_ai_gmv")
 
             # 结论分析
             st.markdown("<h2 class='sub-header'>分析结论</h2>", unsafe_allow_html=True)
@@ -323,9 +314,8 @@ def main():
             </div>
             """, unsafe_allow_html=True)
 
-    # --- 新增：专利与教育分析标签页 ---
-    if show_patent_tab:
-        with tabs[-1]:
+        # --- 新增：专利与教育分析标签页 ---
+        if show_patent_tab and active_tab == len(tab_titles) - 1:
             st.markdown("<h2 class='sub-header'>教育投入与AI发展分析</h2>", unsafe_allow_html=True)
 
             try:
@@ -346,12 +336,13 @@ def main():
 
                 with col_corr1:
                     st.markdown("#### 教育经费 vs AI模型数量")
-                    spearman_corr_model, p_value_model = stats.spearmanr(merged_models['经费'], merged_models['知名AI模型数量'])
+                    spearman_model = correlation.spearman(merged_models, ['经费', '知名AI模型数量'])
+                    spearman_corr_model, p_value_model = correlation.pair(spearman_model, '经费', '知名AI模型数量')
                     st.metric(label="相关系数", value=f"{spearman_corr_model:.3f}", delta=get_correlation_strength(spearman_corr_model))
                     st.caption(f"P值: {p_value_model:.3f} ({'显著' if p_value_model < 0.05 else '不显著'})")
 
                     # 绘制热力图 (Plotly)
-                    corr_matrix_model = merged_models[['经费', '知名AI模型数量']].corr(method='spearman')
+                    corr_matrix_model = spearman_model['corr']
                     fig_heatmap_model = ff.create_annotated_heatmap(
                         z=corr_matrix_model.values,
                         x=corr_matrix_model.columns.tolist(),
@@ -363,17 +354,18 @@ def main():
                         showscale=True
                     )
                     fig_heatmap_model.update_layout(title_text='相关性热力图', title_x=0.5)
-                    st.plotly_chart(fig_heatmap_model, use_container_width=True)
+                    charts.plotly_chart(fig_heatmap_model, use_container_width=True)
 
 
                 with col_corr2:
                     st.markdown("#### 教育经费 vs AI专利占比")
-                    spearman_corr_patent, p_value_patent = stats.spearmanr(merged_patents['经费'], merged_patents[patent_column_name])
+                    spearman_patent = correlation.spearman(merged_patents, ['经费', patent_column_name])
+                    spearman_corr_patent, p_value_patent = correlation.pair(spearman_patent, '经费', patent_column_name)
                     st.metric(label="相关系数", value=f"{spearman_corr_patent:.3f}", delta=get_correlation_strength(spearman_corr_patent))
                     st.caption(f"P值: {p_value_patent:.3f} ({'显著' if p_value_patent < 0.05 else '不显著'})")
 
                      # 绘制热力图 (Plotly)
-                    corr_matrix_patent = merged_patents[['经费', patent_column_name]].corr(method='spearman')
+                    corr_matrix_patent = spearman_patent['corr']
                     fig_heatmap_patent = ff.create_annotated_heatmap(
                         z=corr_matrix_patent.values,
                         x=corr_matrix_patent.columns.tolist(),
@@ -385,7 +377,7 @@ def main():
                         showscale=True
                     )
                     fig_heatmap_patent.update_layout(title_text='相关性热力图', title_x=0.5)
-                    st.plotly_chart(fig_heatmap_patent, use_container_width=True)
+                    charts.plotly_chart(fig_heatmap_patent, use_container_width=True)
 
 
                 # --- 回归分析 ---
@@ -406,7 +398,7 @@ def main():
                     yaxis_title='AI模型数量',
                     legend_title="图例"
                 )
-                st.plotly_chart(fig_reg, use_container_width=True)
+                charts.plotly_chart(fig_reg, use_container_width=True)
 
                 st.markdown("#### 回归分析结果:")
                 reg_results_md = f"""
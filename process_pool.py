@@ -0,0 +1,54 @@
+"""进程内共享的进程池
+
+forecasting（并行拟合、定阶）与 datasets.partitions（分区汇总）共用同一个进程池，首次使用时创建，
+退出时关闭。Streamlit 服务是多线程的，用 fork 创建子进程时，若其他会话的线程正持有某个锁
+（如 binary_cache 的锁），子进程中该锁永远不会被释放而死锁；因此子进程以 forkserver
+（不支持时 spawn）方式启动，从干净的解释器开始，不继承父进程的线程和锁状态。
+
+子进程需要导入、较慢的模块用 preload() 登记，进程池创建时由每个子进程先导入一次，
+避免每个任务各自承担导入开销。提交的函数须定义在模块顶层（子进程按名称导入）。
+使用进程池的脚本须把入口放在 if __name__ == "__main__": 之下。
+"""
+import atexit
+import importlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+_lock = threading.Lock()
+_executor = None
+# 子进程启动时先导入的模块
+_preload = []
+
+
+def preload(*module_names):
+    """登记子进程启动时先导入的模块（对之后创建的进程池生效）"""
+    with _lock:
+        _preload.extend(name for name in module_names if name not in _preload)
+
+
+def _initialize(module_names):
+    for name in module_names:
+        importlib.import_module(name)
+
+
+def get_executor():
+    """进程内共享的进程池"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context(START_METHOD),
+                                            initializer=_initialize, initargs=(tuple(_preload),))
+            atexit.register(_executor.shutdown)
+        return _executor
+
+
+def reset_executor():
+    """放弃当前进程池（如子进程异常退出后），下次使用时重新创建"""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,194 @@
+"""页面性能诊断
+
+设置环境变量 AI_PLATFORM_PROFILE=1 后启用：每次页面重跑记录一次运行，包括页面总耗时
+以及其中各数据加载、分组汇总、模型拟合和图表输出的耗时。结果
+- 显示在侧边栏底部的“性能诊断”面板中（render_panel()），同时显示各缓存占用的内存（memory_budget）
+  和已导入的延迟模块的导入耗时（lazy_imports.IMPORT_TIMINGS）；
+- 追加写入数据目录（datasets.paths.DATA_DIR）下 .cache/profile/ 中的 runs.jsonl（每次运行一行）和 timings.csv（每项耗时一行），
+  便于跟踪回归。
+
+未启用时 timed() 只做一次判断，几乎没有开销。用法::
+
+    with profiling.timed("forecast:美国指标", "model"):
+        ...
+
+    @profiling.profiled("loader")
+    def load_something(): ...
+"""
+import collections
+import contextlib
+import csv
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+
+PROFILE_ENV = "AI_PLATFORM_PROFILE"
+# 内存中保留的最近运行记录数
+MAX_RUNS = 200
+# 耗时类别
+CATEGORIES = ("loader", "groupby", "model", "chart", "other")
+
+_lock = threading.Lock()
+_local = threading.local()
+_runs = collections.deque(maxlen=MAX_RUNS)
+
+
+def is_enabled():
+    """是否启用性能诊断"""
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class Run:
+    """一次页面重跑的耗时记录"""
+
+    def __init__(self, page):
+        self.page = page
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = time.time()
+        self.total = None
+        # (名称, 类别, 耗时秒数)
+        self.timings = []
+
+    def to_dict(self):
+        return {
+            "run_id": self.run_id,
+            "page": self.page,
+            "started": self.started,
+            "total": self.total,
+            "timings": [{"name": n, "category": c, "seconds": s} for n, c, s in self.timings],
+        }
+
+
+def profile_dir():
+    """日志目录，与二进制缓存、预测缓存一样位于数据目录（可由 AI_PLATFORM_DATA_DIR 指定）的 .cache 下"""
+    # datasets 在导入时用到 profiling，这里在使用时再导入，避免循环导入
+    from datasets.paths import DATA_DIR
+    return os.path.join(DATA_DIR, ".cache", "profile")
+
+
+def current_run():
+    """当前线程正在记录的运行，未启用或不在页面运行中时为 None"""
+    return getattr(_local, "run", None)
+
+
+@contextlib.contextmanager
+def page_run(page):
+    """记录一次页面运行（main.py 在渲染页面时使用）"""
+    if not is_enabled():
+        yield None
+        return
+    run = Run(page)
+    previous, _local.run = current_run(), run
+    start = time.perf_counter()
+    try:
+        yield run
+    finally:
+        run.total = time.perf_counter() - start
+        _local.run = previous
+        with _lock:
+            _runs.append(run)
+        _write_log(run)
+
+
+@contextlib.contextmanager
+def timed(name, category="other"):
+    """记录代码块的耗时到当前运行中"""
+    run = current_run()
+    if run is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.timings.append((name, category, time.perf_counter() - start))
+
+
+def profiled(category="other", name=None):
+    """记录函数耗时的装饰器，名称默认为 模块.函数名"""
+    def decorator(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(label, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def recent_runs(page=None):
+    """最近的运行记录（旧的在前），page 给出时只返回该页面的"""
+    with _lock:
+        runs = list(_runs)
+    return [run for run in runs if page is None or run.page == page]
+
+
+def _write_log(run):
+    directory = profile_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with _lock:
+            with open(os.path.join(directory, "runs.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(run.to_dict(), ensure_ascii=False) + "\n")
+            csv_path = os.path.join(directory, "timings.csv")
+            new_file = not os.path.exists(csv_path)
+            with open(csv_path, "a", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(["run_id", "page", "started", "name", "category", "seconds"])
+                writer.writerow([run.run_id, run.page, run.started, "total", "page", run.total])
+                for name, category, seconds in run.timings:
+                    writer.writerow([run.run_id, run.page, run.started, name, category, seconds])
+    except OSError:
+        # 日志目录不可写时只是不写日志
+        pass
+
+
+def summarize(run):
+    """按名称汇总一次运行中的耗时：[(名称, 类别, 次数, 总秒数)]，按总耗时降序"""
+    totals = {}
+    for name, category, seconds in run.timings:
+        count, total = totals.get((name, category), (0, 0.0))
+        totals[(name, category)] = (count + 1, total + seconds)
+    rows = [(name, category, count, total) for (name, category), (count, total) in totals.items()]
+    return sorted(rows, key=lambda row: row[3], reverse=True)
+
+
+def render_panel(page):
+    """在侧边栏底部显示该页面最近一次运行的耗时明细与历史总耗时（仅在启用时显示）"""
+    if not is_enabled():
+        return
+    import pandas as pd
+    import streamlit as st
+
+    import lazy_imports
+    import memory_budget
+
+    runs = recent_runs(page)
+    with st.sidebar.expander("🔧 性能诊断", expanded=False):
+        if not runs:
+            st.caption("暂无记录")
+            return
+        last = runs[-1]
+        st.caption(f"上次运行 {last.total * 1000:.0f} ms（{last.run_id}）")
+        detail = pd.DataFrame(summarize(last), columns=["名称", "类别", "次数", "秒"])
+        st.dataframe(detail.round(4), use_container_width=True, hide_index=True)
+        history = pd.DataFrame({"运行": range(1, len(runs) + 1), "总耗时(秒)": [run.total for run in runs]})
+        st.line_chart(history, x="运行", y="总耗时(秒)", height=150)
+        usage = memory_budget.info()
+        st.caption(f"缓存内存 {usage['bytes'] / 2 ** 20:.1f} / {usage['budget'] / 2 ** 20:.0f} MB"
+                   f"（常驻 {usage['pinned_bytes'] / 2 ** 20:.1f} MB）")
+        pools = pd.DataFrame([(pool, p["entries"], p["bytes"] / 2 ** 20, p["evictions"])
+                              for pool, p in usage["pools"].items()],
+                             columns=["缓存", "条目", "MB", "淘汰"])
+        st.dataframe(pools.round(2), use_container_width=True, hide_index=True)
+        imports = sorted(dict(lazy_imports.IMPORT_TIMINGS).items(), key=lambda item: item[1], reverse=True)
+        if imports:
+            st.caption("延迟导入的模块（首次使用时的导入耗时）")
+            imports = pd.DataFrame(imports, columns=["模块", "秒"])
+            st.dataframe(imports.round(3), use_container_width=True, hide_index=True)
+        st.caption(f"日志：{profile_dir()}")
@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import warnings
+
+import datasets
 warnings.filterwarnings('ignore')
 
 # 设置中文字体
@@ -13,22 +15,22 @@ plt.rcParams['axes.unicode_minus'] = False
 # 读取数据
 def load_data():
     # 读取工业机器人装机数量数据
-    robot_installation = pd.read_csv('data/工业机器人/工业机器人装机数量.csv')
+    robot_installation = datasets.read_dataset(datasets.data_path('工业机器人', '工业机器人装机数量.csv'))
     
     # 读取机器人应用领域数据
-    robot_application = pd.read_csv('data/工业机器人/机器人应用领域.csv')
+    robot_application = datasets.read_dataset(datasets.data_path('工业机器人', '机器人应用领域.csv'))
     
     # 读取中国工业机器人部署与密度数据
-    china_deployment = pd.read_csv('data/工业机器人/中国工业机器人部署与密度_年度数据.csv')
+    china_deployment = datasets.read_dataset(datasets.data_path('工业机器人', '中国工业机器人部署与密度_年度数据.csv'))
     
     # 读取中国工业机器人社会经济影响数据
-    china_impact = pd.read_csv('data/工业机器人/中国工业机器人社会经济影响_年度数据.csv')
+    china_impact = datasets.read_dataset(datasets.data_path('工业机器人', '中国工业机器人社会经济影响_年度数据.csv'))
     
     # 读取中国工业机器人应用领域分布数据
-    china_distribution = pd.read_csv('data/工业机器人/中国工业机器人应用领域分布_年度数据.csv')
+    china_distribution = datasets.read_dataset(datasets.data_path('工业机器人', '中国工业机器人应用领域分布_年度数据.csv'))
     
     # 读取中国vs全球机器人数据
-    china_vs_global = pd.read_csv('data/工业机器人/中国vs全球机器人.csv')
+    china_vs_global = datasets.read_dataset(datasets.data_path('工业机器人', '中国vs全球机器人.csv'))
     
     return (robot_installation, robot_application, china_deployment, 
             china_impact, china_distribution, china_vs_global)
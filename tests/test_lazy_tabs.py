@@ -0,0 +1,37 @@
+"""main.py 菜单中的每个页面：逐个选项卡运行，确认每个选项卡单独执行时都不报错
+
+lazy_tabs 只执行选中的选项卡，一个选项卡里定义、另一个选项卡里使用的变量会在单独选中后者时
+出现 UnboundLocalError；st.tabs 每次执行全部选项卡，不会暴露这类问题。
+没有 lazy_tabs 选项卡栏的页面只检查默认的一次运行。
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import benchmark  # noqa: E402
+
+RUN_TIMEOUT = 600
+
+
+def _check(app, *context):
+    assert not app.exception, (*context, [e.message for e in app.exception])
+    assert not app.error, (*context, [e.value for e in app.error])
+
+
+@pytest.mark.parametrize("module_name", benchmark.menu_modules())
+def test_every_tab_runs(module_name):
+    app = AppTest.from_string(benchmark._script(module_name), default_timeout=RUN_TIMEOUT).run()
+    _check(app, module_name)
+    for key, count in benchmark._lazy_tab_keys(app):
+        for index in range(count):
+            app.radio(key=key).set_value(index)
+            app.run()
+            _check(app, module_name, key, index)
+        app.radio(key=key).set_value(0)
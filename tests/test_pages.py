@@ -0,0 +1,25 @@
+"""冒烟测试：main.py 菜单中的每个页面都能完整渲染，没有异常，也没有 st.error 输出
+
+页面的全部图表都经 charts.plotly_chart() 输出，饼图、柱状图等各类轨迹都会走一遍降采样与 WebGL 转换。
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import benchmark  # noqa: E402
+
+RUN_TIMEOUT = 600
+
+
+@pytest.mark.parametrize("module_name", benchmark.menu_modules())
+def test_page_renders(module_name):
+    app = AppTest.from_string(benchmark._script(module_name), default_timeout=RUN_TIMEOUT).run()
+    assert not app.exception, [e.message for e in app.exception]
+    assert not app.error, [e.value for e in app.error]
@@ -7,51 +7,58 @@ from plotly.subplots import make_subplots
 import random
 import os
 
+import charts
+import datasets
+
+# AI 信号控制系统上线日期，之前为传统系统
+AI_IMPLEMENTATION_DATE = '2023-01-01'
+
 # 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #000000;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-        font-family: 'SimHei', sans-serif;
-    }
-    .metric-card {
-        background-color: white;
-        border-radius: 10px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        text-align: center;
-    }
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #4CAF50;
-    }
-    .metric-label {
-        font-size: 1rem;
-        color: #666;
-    }
-</style>
-""", unsafe_allow_html=True)
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 2.5rem;
+            color: #000000;
+            text-align: center;
+            margin-bottom: 1rem;
+            font-weight: bold;
+            font-family: 'SimHei', sans-serif;
+        }
+        .metric-card {
+            background-color: white;
+            border-radius: 10px;
+            padding: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            text-align: center;
+        }
+        .metric-value {
+            font-size: 2.5rem;
+            font-weight: bold;
+            color: #4CAF50;
+        }
+        .metric-label {
+            font-size: 1rem;
+            color: #666;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
-@st.cache_data
 def load_traffic_data():
-    """从CSV文件加载交通数据"""
+    """加载交通数据的时间索引存储（按区分区时为各区合并后的全市数据）"""
     try:
-        df = pd.read_csv('data/traffic_data.csv')
-        # 将date列转换为datetime类型
-        df['date'] = pd.to_datetime(df['date'])
-        return df
+        return datasets.load_traffic_store()
     except Exception as e:
         st.error(f"读取数据文件失败: {e}")
         return None
 
 def main():
-    # 加载数据
-    df = load_traffic_data()
+    load_css()
+    charts.full_resolution_toggle()
+    # 加载数据：按年/月均值与时间窗口查询都走预先汇总的时间索引存储，不再逐年布尔扫描全表
+    store = load_traffic_data()
+    df = store.frame if store is not None else None
 
     if df is not None:
         # 标题
@@ -97,7 +104,7 @@ def main():
             fig.update_traces(line_color='#4CAF50')
             
             # 使用数值型日期添加垂直线
-            ai_implementation_date = '2023-01-01'
+            ai_implementation_date = AI_IMPLEMENTATION_DATE
             upgrade_dates = ['2023-06-01', '2024-04-01', '2025-02-01']
             
             fig.add_vline(x=ai_implementation_date, 
@@ -122,15 +129,15 @@ def main():
                                  yref='paper',
                                  yanchor='top')
             
-            st.plotly_chart(fig, use_container_width=True, key="traffic_trend")
+            charts.plotly_chart(fig, use_container_width=True, key="traffic_trend")
             
             # Calculate reduction using the latest available year
-            latest_year = df['date'].dt.year.max()
+            latest_year = store.latest_year
             # Define the year for comparison (e.g., the year before AI implementation)
             comparison_year = 2023 # Or choose another relevant year like 2022
             
-            comparison_year_avg = df[df['date'].dt.year == comparison_year]['congestion_index'].mean()
-            latest_year_avg = df[df['date'].dt.year == latest_year]['congestion_index'].mean()
+            comparison_year_avg = store.year_mean('congestion_index', comparison_year)
+            latest_year_avg = store.year_mean('congestion_index', latest_year)
             
             if pd.notna(comparison_year_avg) and pd.notna(latest_year_avg) and comparison_year_avg != 0:
                 reduction = (comparison_year_avg - latest_year_avg) / comparison_year_avg * 100
@@ -139,7 +146,7 @@ def main():
                 st.info(f"无法计算拥堵指数降幅（{comparison_year}年或{latest_year}年数据不足）。")
             
             # 按年度统计平均拥堵指数
-            yearly_congestion = df.groupby('year')['congestion_index'].mean().reset_index()
+            yearly_congestion = store.means('year', ['congestion_index'])
             fig = px.bar(yearly_congestion,
                          x='year',
                          y='congestion_index',
@@ -157,7 +164,7 @@ def main():
                               showarrow=False,
                               font=dict(size=14))
             
-            st.plotly_chart(fig, use_container_width=True, key="yearly_congestion")
+            charts.plotly_chart(fig, use_container_width=True, key="yearly_congestion")
 
         with tab2:
             # 响应时间趋势
@@ -179,26 +186,26 @@ def main():
                               xref='paper')
             
             # 添加AI实施标记线
-            fig.add_vline(x='2023-01-01', 
+            fig.add_vline(x=AI_IMPLEMENTATION_DATE, 
                           line_dash="dash", 
                           line_color="red")
-            fig.add_annotation(x='2023-01-01',
+            fig.add_annotation(x=AI_IMPLEMENTATION_DATE,
                               y=1,
                               text="AI系统实施",
                               showarrow=False,
                               yref='paper',
                               yanchor='bottom')
             
-            st.plotly_chart(fig, use_container_width=True, key="response_time_trend")
+            charts.plotly_chart(fig, use_container_width=True, key="response_time_trend")
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # Calculate reduction using the latest available year
-                latest_year = df['date'].dt.year.max()
+                latest_year = store.latest_year
                 traditional_year = 2022 # Year for traditional system comparison
-                traditional_avg_response = df[df['date'].dt.year == traditional_year]['response_time'].mean()
-                latest_avg_response = df[df['date'].dt.year == latest_year]['response_time'].mean()
+                traditional_avg_response = store.year_mean('response_time', traditional_year)
+                latest_avg_response = store.year_mean('response_time', latest_year)
                 
                 if pd.notna(traditional_avg_response) and pd.notna(latest_avg_response):
                     response_reduction_val = traditional_avg_response - latest_avg_response
@@ -215,9 +222,9 @@ def main():
                 fig.update_traces(line_color='#FF5722')
                 
                 # 添加AI实施标记线
-                fig.add_vline(x='2023-01-01', line_dash="dash", line_color="red")
+                fig.add_vline(x=AI_IMPLEMENTATION_DATE, line_dash="dash", line_color="red")
                 
-                st.plotly_chart(fig, use_container_width=True, key="accident_rate_trend")
+                charts.plotly_chart(fig, use_container_width=True, key="accident_rate_trend")
             
             with col2:
                 # 反应时间分析
@@ -229,14 +236,14 @@ def main():
                 fig.update_traces(line_color='purple')
                 
                 # 添加AI实施标记线
-                fig.add_vline(x='2023-01-01', line_dash="dash", line_color="red")
+                fig.add_vline(x=AI_IMPLEMENTATION_DATE, line_dash="dash", line_color="red")
                 
-                st.plotly_chart(fig, use_container_width=True, key="reaction_time_trend")
+                charts.plotly_chart(fig, use_container_width=True, key="reaction_time_trend")
                 
                 # 计算平均反应时间改善百分比
-                reaction_improvement = ((df[df['date'].dt.year == 2022]['reaction_time'].mean() - 
-                                        df[df['date'].dt.year == 2025]['reaction_time'].mean()) / 
-                                       df[df['date'].dt.year == 2022]['reaction_time'].mean() * 100)
+                reaction_improvement = ((store.year_mean('reaction_time', 2022) -
+                                        store.year_mean('reaction_time', 2025)) /
+                                       store.year_mean('reaction_time', 2022) * 100)
                 
                 st.info(f"交通拥堵事件反应时间降低了{reaction_improvement:.1f}%，AI系统能更快速识别和响应拥堵情况。")
 
@@ -253,21 +260,20 @@ def main():
                 fig.update_traces(line_color='#009688')
                 
                 # 添加AI实施标记线
-                fig.add_vline(x='2023-01-01', line_dash="dash", line_color="red")
+                fig.add_vline(x=AI_IMPLEMENTATION_DATE, line_dash="dash", line_color="red")
                 
-                st.plotly_chart(fig, use_container_width=True, key="wait_time_trend")
+                charts.plotly_chart(fig, use_container_width=True, key="wait_time_trend")
                 
                 # 计算红绿灯等待时间改善
-                wait_reduction = ((df[df['date'].dt.year == 2022]['wait_time'].mean() - 
-                                  df[df['date'].dt.year == 2025]['wait_time'].mean()) / 
-                                 df[df['date'].dt.year == 2022]['wait_time'].mean() * 100)
+                wait_reduction = ((store.year_mean('wait_time', 2022) -
+                                  store.year_mean('wait_time', 2025)) /
+                                 store.year_mean('wait_time', 2022) * 100)
                 
                 st.info(f"红绿灯等待时间降低了{wait_reduction:.1f}%，AI系统能根据实时交通流量智能调整信号灯配时。")
             
             with col2:
                 # 按月份分析效率提升
-                monthly_avg = df.groupby(['year', 'month'])['wait_time'].mean().reset_index()
-                monthly_avg = monthly_avg.pivot(index='month', columns='year', values='wait_time')
+                monthly_avg = store.monthly_by_year('wait_time')
                 
                 fig = px.line(monthly_avg, 
                               x=monthly_avg.index, 
@@ -276,7 +282,7 @@ def main():
                               labels={'value': '等待时间（秒）', 'month': '月份'},
                               color_discrete_sequence=px.colors.qualitative.Bold)
                 
-                st.plotly_chart(fig, use_container_width=True, key="monthly_wait_time")
+                charts.plotly_chart(fig, use_container_width=True, key="monthly_wait_time")
                 
                 # 季节性拥堵处理能力对比
                 seasonal_analysis = """
@@ -291,33 +297,32 @@ def main():
             st.subheader("AI交通系统核心优势")
             
             # Determine the latest available year in the data
-            latest_year = df['date'].dt.year.max()
+            latest_year = store.latest_year
             # Define the year for the traditional system comparison
             traditional_year = 2022 # Keep this as 2022 based on original logic
+            metrics = ['congestion_index', 'response_time', 'accident_rate', 'wait_time', 'reaction_time']
+            traditional = {col: store.year_mean(col, traditional_year) for col in metrics}
+            latest = {col: store.year_mean(col, latest_year) for col in metrics}
             
             # 创建关键指标比较表格
             ai_advantage_data = {
                 "指标": ["平均拥堵指数", "事故响应时间", "交通事故率", "红绿灯等待时间", "拥堵反应时间"],
                 f"传统系统 ({traditional_year})": [ # Use f-string for year
-                    f"{df[df['date'].dt.year == traditional_year]['congestion_index'].mean():.2f}",
-                    f"{df[df['date'].dt.year == traditional_year]['response_time'].mean():.2f}分钟",
-                    f"{df[df['date'].dt.year == traditional_year]['accident_rate'].mean():.2f}",
-                    f"{df[df['date'].dt.year == traditional_year]['wait_time'].mean():.1f}秒",
-                    f"{df[df['date'].dt.year == traditional_year]['reaction_time'].mean():.2f}小时"
+                    f"{traditional['congestion_index']:.2f}",
+                    f"{traditional['response_time']:.2f}分钟",
+                    f"{traditional['accident_rate']:.2f}",
+                    f"{traditional['wait_time']:.1f}秒",
+                    f"{traditional['reaction_time']:.2f}小时"
                 ],
                 f"AI系统 ({latest_year})": [ # Use latest_year and f-string
-                    f"{df[df['date'].dt.year == latest_year]['congestion_index'].mean():.2f}",
-                    f"{df[df['date'].dt.year == latest_year]['response_time'].mean():.2f}分钟",
-                    f"{df[df['date'].dt.year == latest_year]['accident_rate'].mean():.2f}",
-                    f"{df[df['date'].dt.year == latest_year]['wait_time'].mean():.1f}秒",
-                    f"{df[df['date'].dt.year == latest_year]['reaction_time'].mean():.2f}小时"
+                    f"{latest['congestion_index']:.2f}",
+                    f"{latest['response_time']:.2f}分钟",
+                    f"{latest['accident_rate']:.2f}",
+                    f"{latest['wait_time']:.1f}秒",
+                    f"{latest['reaction_time']:.2f}小时"
                 ],
                 "改善幅度": [
-                    f"{(df[df['date'].dt.year == traditional_year]['congestion_index'].mean() - df[df['date'].dt.year == latest_year]['congestion_index'].mean()) / df[df['date'].dt.year == traditional_year]['congestion_index'].mean() * 100:.1f}%",
-                    f"{(df[df['date'].dt.year == traditional_year]['response_time'].mean() - df[df['date'].dt.year == latest_year]['response_time'].mean()) / df[df['date'].dt.year == traditional_year]['response_time'].mean() * 100:.1f}%",
-                    f"{(df[df['date'].dt.year == traditional_year]['accident_rate'].mean() - df[df['date'].dt.year == latest_year]['accident_rate'].mean()) / df[df['date'].dt.year == traditional_year]['accident_rate'].mean() * 100:.1f}%",
-                    f"{(df[df['date'].dt.year == traditional_year]['wait_time'].mean() - df[df['date'].dt.year == latest_year]['wait_time'].mean()) / df[df['date'].dt.year == traditional_year]['wait_time'].mean() * 100:.1f}%",
-                    f"{(df[df['date'].dt.year == traditional_year]['reaction_time'].mean() - df[df['date'].dt.year == latest_year]['reaction_time'].mean()) / df[df['date'].dt.year == traditional_year]['reaction_time'].mean() * 100:.1f}%"
+                    f"{(traditional[col] - latest[col]) / traditional[col] * 100:.1f}%" for col in metrics
                 ]
             }
             
@@ -332,9 +337,10 @@ def main():
                 st.markdown("#### AI系统在突发事件处理上的优势")
                 
                 # 提取季度数据（模拟大型活动或突发事件）
-                quarterly_data = df[df['date'].dt.month % 4 == 0]
-                quarterly_data_traditional = quarterly_data[quarterly_data['date'].dt.year < 2023]
-                quarterly_data_ai = quarterly_data[quarterly_data['date'].dt.year >= 2023]
+                before_ai = store.window(end=AI_IMPLEMENTATION_DATE)
+                after_ai = store.window(start=AI_IMPLEMENTATION_DATE)
+                quarterly_data_traditional = before_ai[before_ai['date'].dt.month % 4 == 0]
+                quarterly_data_ai = after_ai[after_ai['date'].dt.month % 4 == 0]
                 
                 fig = go.Figure()
                 fig.add_trace(go.Box(y=quarterly_data_traditional['congestion_index'], 
@@ -346,7 +352,7 @@ def main():
                                   yaxis_title='拥堵指数',
                                   boxmode='group')
                 
-                st.plotly_chart(fig, use_container_width=True, key="quarterly_congestion")
+                charts.plotly_chart(fig, use_container_width=True, key="quarterly_congestion")
             
             with col2:
                 # 恶劣天气应对能力
@@ -355,10 +361,8 @@ def main():
                 # 模拟恶劣天气数据（假设weather_factor > 1.05代表恶劣天气）
                 # 这里我们直接通过congestion_index的高值来模拟
                 bad_weather_threshold = df['congestion_index'].quantile(0.75)
-                bad_weather_data = df[df['congestion_index'] > bad_weather_threshold]
-                
-                bad_weather_traditional = bad_weather_data[bad_weather_data['date'].dt.year < 2023]
-                bad_weather_ai = bad_weather_data[bad_weather_data['date'].dt.year >= 2023]
+                bad_weather_traditional = before_ai[before_ai['congestion_index'] > bad_weather_threshold]
+                bad_weather_ai = after_ai[after_ai['congestion_index'] > bad_weather_threshold]
                 
                 bad_weather_compare = pd.DataFrame({
                     '系统类型': ['传统系统'] * len(bad_weather_traditional) + ['AI系统'] * len(bad_weather_ai),
@@ -373,13 +377,13 @@ def main():
                                 title='恶劣条件下系统表现对比',
                                 color_discrete_map={'传统系统': 'red', 'AI系统': 'green'})
                 
-                st.plotly_chart(fig, use_container_width=True, key="bad_weather_comparison")
+                charts.plotly_chart(fig, use_container_width=True, key="bad_weather_comparison")
 
       
 
     
     else:
-        st.error("无法加载数据，请确保data/traffic_data.csv文件存在")
+        st.error("无法加载数据，请确保data/traffic_data.csv文件或data/traffic/目录存在")
 
 if __name__ == "__main__":
     main()
@@ -4,152 +4,138 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
-from statsmodels.tsa.arima.model import ARIMA
-from scipy import stats
 
-# 自定义CSS样式
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #000000;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: bold;
-        font-family: 'SimHei', sans-serif;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        color: #000000;
-        margin-top: 2rem;
-        border-bottom: 2px solid #3498db;
-        padding-bottom: 0.5rem;
-        font-family: 'SimHei', sans-serif;
-    }
-    .card {
-        background-color: #f8f9fa;
-        border-radius: 10px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1.5rem;
-    }
-    .highlight {
-        background-color: #e8f4f8;
-        padding: 1rem;
-        border-left: 4px solid #3498db;
-        margin-bottom: 1rem;
-    }
-    .metric-container {
-        display: flex;
-        justify-content: space-around;
-        align-items: center;
-        text-align: center;
-        padding: 0.5rem;
-        border-radius: 10px;
-        background: rgba(52, 152, 219, 0.05);
-        margin-bottom: 0.8rem;
-    }
-    .metric-value {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #3498db;
-    }
-    .metric-label {
-        font-size: 0.9rem;
-        color: #7f8c8d;
-    }
-    .metric-card {
-        border-radius: 8px;
-        padding: 0.8rem;
-        text-align: center;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        margin-right: 0.5rem;
-        transition: transform 0.3s ease;
-        width: 100%;
-    }
-    .metric-card:hover {
-        transform: translateY(-3px);
-    }
-    .footer {
-        text-align: center;
-        margin-top: 3rem;
-        color: #7f8c8d;
-        font-size: 0.8rem;
-    }
-    /* 增大选项卡样式 */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        padding-top: 10px;
-        white-space: pre-wrap;
-        font-size: 16px;
-        font-weight: 500;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: rgba(52, 152, 219, 0.2);
-        border-radius: 5px 5px 0 0;
-    }
-    /* 控制面板样式 */
-    .control-panel {
-        background-color: #f8f9fa;
-        border-radius: 10px;
-        padding: 1rem;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        margin: 1rem 0;
-    }
-    .control-title {
-        font-size: 1.2rem;
-        font-weight: bold;
-        color: #3498db;
-        margin-bottom: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+import charts
+import correlation
+import datasets
+import forecasting
+import lazy_tabs
 
-# 标题
-st.markdown("<h1 class='main-header'>美国研发投入与经济增长分析</h1>", unsafe_allow_html=True)
+# 自定义CSS样式
+def load_css():
+    """注入页面自定义CSS样式"""
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 2.5rem;
+            color: #000000;
+            text-align: center;
+            margin-bottom: 1rem;
+            font-weight: bold;
+            font-family: 'SimHei', sans-serif;
+        }
+        .sub-header {
+            font-size: 1.8rem;
+            color: #000000;
+            margin-top: 2rem;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 0.5rem;
+            font-family: 'SimHei', sans-serif;
+        }
+        .card {
+            background-color: #f8f9fa;
+            border-radius: 10px;
+            padding: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            margin-bottom: 1.5rem;
+        }
+        .highlight {
+            background-color: #e8f4f8;
+            padding: 1rem;
+            border-left: 4px solid #3498db;
+            margin-bottom: 1rem;
+        }
+        .metric-container {
+            display: flex;
+            justify-content: space-around;
+            align-items: center;
+            text-align: center;
+            padding: 0.5rem;
+            border-radius: 10px;
+            background: rgba(52, 152, 219, 0.05);
+            margin-bottom: 0.8rem;
+        }
+        .metric-value {
+            font-size: 2rem;
+            font-weight: bold;
+            color: #3498db;
+        }
+        .metric-label {
+            font-size: 0.9rem;
+            color: #7f8c8d;
+        }
+        .metric-card {
+            border-radius: 8px;
+            padding: 0.8rem;
+            text-align: center;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+            margin-right: 0.5rem;
+            transition: transform 0.3s ease;
+            width: 100%;
+        }
+        .metric-card:hover {
+            transform: translateY(-3px);
+        }
+        .footer {
+            text-align: center;
+            margin-top: 3rem;
+            color: #7f8c8d;
+            font-size: 0.8rem;
+        }
+        /* 增大选项卡样式 */
+        .stTabs [data-baseweb="tab-list"] {
+            gap: 2px;
+        }
+        .stTabs [data-baseweb="tab"] {
+            height: 50px;
+            padding-top: 10px;
+            white-space: pre-wrap;
+            font-size: 16px;
+            font-weight: 500;
+        }
+        .stTabs [aria-selected="true"] {
+            background-color: rgba(52, 152, 219, 0.2);
+            border-radius: 5px 5px 0 0;
+        }
+        /* 控制面板样式 */
+        .control-panel {
+            background-color: #f8f9fa;
+            border-radius: 10px;
+            padding: 1rem;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+            margin: 1rem 0;
+        }
+        .control-title {
+            font-size: 1.2rem;
+            font-weight: bold;
+            color: #3498db;
+            margin-bottom: 0.5rem;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
-# 加载数据
-@st.cache_data
+# 加载数据（解析与清洗由 datasets 统一完成，进程内只做一次）
 def load_data():
     try:
-        # 由于CSV文件前几行包含标题信息，需要跳过
-        df = pd.read_csv("data/nsf25326-tab001.csv", skiprows=3)
-        # 更改列名，使其更简洁
-        df.columns = ['Year', 'GDP_Current', 'GDP_Constant', 'Deflator', 'RD_Current', 'RD_Constant', 
-                      'RD_GDP_Total', 'RD_Perf_Business', 'RD_Perf_Federal', 'RD_Perf_HigherEd', 'RD_Perf_Other',
-                      'RD_Fund_Business', 'RD_Fund_Federal', 'RD_Fund_Other']
-        
-        # 清理数据
-        df = df.dropna(subset=['Year'])  # 删除没有年份的行
-        df['Year'] = df['Year'].str.replace('[a-zA-Z]', '', regex=True).astype(int)  # 去除年份后的字母（如e, f）
-        
-        # 清理和转换货币列中的逗号
-        for col in df.columns:
-            if col != 'Year' and col != 'Deflator':
-                df[col] = df[col].astype(str).str.replace(',', '').astype(float)
-        
-        return df
+        return datasets.load_nsf_rd()
     except Exception as e:
         st.error(f"加载数据出错: {e}")
         return None
 
 # 在load_data函数后添加新的数据加载函数
-@st.cache_data
 def load_ai_data():
     try:
-        ai_models = pd.read_csv('data/专利教育/历年知名AI模型数量_地区对比.csv')
-        patents = pd.read_csv('data/专利教育/全球AI专利占比_按地区.csv')
-        return ai_models, patents
+        return datasets.load_ai_models(), datasets.load_ai_patents()
     except Exception as e:
         st.error(f"加载AI数据出错: {e}")
         return None, None
 
 def main():
+    load_css()
+    charts.full_resolution_toggle()
+    # 标题
+    st.markdown("<h1 class='main-header'>美国研发投入与经济增长分析</h1>", unsafe_allow_html=True)
+
     # 将原有的主要代码移到main函数中
     df = load_data()
     if df is not None:
@@ -184,7 +170,8 @@ def main():
         """, unsafe_allow_html=True)
         
         # 创建展示选项卡 (调大)
-        tabs = st.tabs(["📈 总体趋势", "🔄 研发与GDP关系", "🏢 执行部门分析", "💰 资金来源分析", "🤖 AI创新分析"])
+        active_tab = lazy_tabs.tabs(["📈 总体趋势", "🔄 研发与GDP关系", "🏢 执行部门分析", "💰 资金来源分析", "🤖 AI创新分析"],
+                                    key="us_investment_tab")
         
         # 控制面板 (从侧边栏移至此处)
         st.markdown("<div class='control-panel'><div class='control-title'>分析控制面板</div>", unsafe_allow_html=True)
@@ -207,8 +194,18 @@ def main():
         
         # 按照选择筛选数据
         filtered_df = df[(df['Year'] >= selected_years[0]) & (df['Year'] <= selected_years[1])]
+
+        # 准备绘图数据（“总体趋势”和“研发与GDP关系”选项卡共用）
+        if data_type == "当前美元":
+            gdp_col = 'GDP_Current'
+            rd_col = 'RD_Current'
+            y_title = "十亿美元 (当前值)"
+        else:
+            gdp_col = 'GDP_Constant'
+            rd_col = 'RD_Constant'
+            y_title = "十亿美元 (2017年不变值)"
         
-        with tabs[0]:  # 总体趋势
+        if active_tab == 0:  # 总体趋势
             st.markdown("<h3 class='sub-header'>美国GDP和研发投入趋势</h3>", unsafe_allow_html=True)
             
             chart_type = st.radio(
@@ -217,16 +214,6 @@ def main():
                 horizontal=True
             )
             
-            # 准备绘图数据
-            if data_type == "当前美元":
-                gdp_col = 'GDP_Current'
-                rd_col = 'RD_Current'
-                y_title = "十亿美元 (当前值)"
-            else:
-                gdp_col = 'GDP_Constant'
-                rd_col = 'RD_Constant'
-                y_title = "十亿美元 (2017年不变值)"
-            
             # 创建双Y轴图表
             fig = make_subplots(specs=[[{"secondary_y": True}]])
             
@@ -321,7 +308,7 @@ def main():
             fig.update_xaxes(title_text="年份")
             
             # 显示图表
-            st.plotly_chart(fig, use_container_width=True, key="investment_trend")
+            charts.plotly_chart(fig, use_container_width=True, key="investment_trend")
             
             # 研发投入年增长率
             st.markdown("<h3 class='sub-header'>研发投入年增长率</h3>", unsafe_allow_html=True)
@@ -346,9 +333,9 @@ def main():
                 plot_bgcolor='rgba(240,240,240,0.8)'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="rd_growth")
+            charts.plotly_chart(fig, use_container_width=True, key="rd_growth")
         
-        with tabs[1]:  # 研发与GDP关系
+        if active_tab == 1:  # 研发与GDP关系
             st.markdown("<h3 class='sub-header'>研发投入占GDP比例变化</h3>", unsafe_allow_html=True)
             
             # 创建研发占GDP比例折线图
@@ -368,7 +355,7 @@ def main():
                 plot_bgcolor='rgba(240,240,240,0.8)'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="rd_gdp_ratio")
+            charts.plotly_chart(fig, use_container_width=True, key="rd_gdp_ratio")
             
             # 创建研发与GDP散点图(相关性)
             st.markdown("<h3 class='sub-header'>研发投入与GDP相关性</h3>", unsafe_allow_html=True)
@@ -390,9 +377,9 @@ def main():
                 plot_bgcolor='rgba(240,240,240,0.8)'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="rd_gdp_correlation")
+            charts.plotly_chart(fig, use_container_width=True, key="rd_gdp_correlation")
         
-        with tabs[2]:  # 执行部门分析
+        if active_tab == 2:  # 执行部门分析
             st.markdown("<h3 class='sub-header'>研发执行部门分析</h3>", unsafe_allow_html=True)
             
             # 创建执行部门研发占GDP比例堆叠面积图
@@ -444,7 +431,7 @@ def main():
                 plot_bgcolor='rgba(240,240,240,0.8)'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="sector_distribution")
+            charts.plotly_chart(fig, use_container_width=True, key="sector_distribution")
             
             # 各部门执行占比变化
             st.markdown("<h3 class='sub-header'>研发执行部门占比变化</h3>", unsafe_allow_html=True)
@@ -500,11 +487,11 @@ def main():
                         )
                         
                         with pie_cols[i % len(pie_cols)]:
-                            st.plotly_chart(fig, use_container_width=True, key=f"sector_distribution_{year}")
+                            charts.plotly_chart(fig, use_container_width=True, key=f"sector_distribution_{year}")
             else:
                 st.warning("请选择至少一个年份进行对比。")
         
-        with tabs[3]:  # 资金来源分析
+        if active_tab == 3:  # 资金来源分析
             st.markdown("<h3 class='sub-header'>研发资金来源分析</h3>", unsafe_allow_html=True)
             
             # 创建资金来源研发占GDP比例堆叠面积图
@@ -547,7 +534,7 @@ def main():
                 plot_bgcolor='rgba(240,240,240,0.8)'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="fund_distribution")
+            charts.plotly_chart(fig, use_container_width=True, key="fund_distribution")
             
             # 联邦与企业资金占比对比
             st.markdown("<h3 class='sub-header'>联邦与企业研发资金占比对比</h3>", unsafe_allow_html=True)
@@ -580,10 +567,10 @@ def main():
                 plot_bgcolor='rgba(240,240,240,0.8)'
             )
             
-            st.plotly_chart(fig, use_container_width=True, key="fund_ratio")
+            charts.plotly_chart(fig, use_container_width=True, key="fund_ratio")
         
         # 添加新的AI创新分析选项卡
-        with tabs[4]:  # AI创新分析
+        if active_tab == 4:  # AI创新分析
             st.markdown("<h3 class='sub-header'>AI创新与研发投入分析</h3>", unsafe_allow_html=True)
             
             # 加载AI相关数据
@@ -591,22 +578,14 @@ def main():
             
             if ai_models is not None and patents is not None:
                 # 处理数据
-                ai_models_us = ai_models[ai_models['地区'] == '美国'].copy()
-                patents_us = patents[patents['地区'] == '美国'].copy()
+                ai_models_us = datasets.by_region(ai_models, '美国')
+                patents_us = datasets.by_region(patents, '美国')
                 
                 # 合并数据
                 us_data = pd.DataFrame()
                 us_data['Year'] = filtered_df['Year']
                 us_data['R&D投入占GDP比例'] = filtered_df['RD_GDP_Total']
                 
-                # 处理AI模型数据
-                ai_models_us['年份'] = pd.to_numeric(ai_models_us['年份'], errors='coerce')
-                ai_models_us['知名AI模型数量'] = pd.to_numeric(ai_models_us['知名AI模型数量'], errors='coerce')
-                
-                # 处理专利数据
-                patents_us['年份'] = pd.to_numeric(patents_us['年份'], errors='coerce')
-                patents_us['AI专利占比(占全球总数百分比)'] = pd.to_numeric(patents_us['AI专利占比(占全球总数百分比)'], errors='coerce')
-                
                 # 合并AI数据
                 us_data = us_data.merge(ai_models_us[['年份', '知名AI模型数量']], 
                                       left_on='Year', right_on='年份', how='left')
@@ -622,8 +601,9 @@ def main():
                 us_data = us_data.drop(['年份_x', '年份_y'], axis=1, errors='ignore')
                 us_data = us_data.dropna()
                 
-                # 创建相关性热力图
-                correlation_matrix = us_data[['R&D投入占GDP比例', 'AI模型数量', 'AI专利占比']].corr(method='spearman')
+                # 创建相关性热力图（相关系数与p值一次算出并缓存，下方的详细相关性分析直接复用）
+                spearman_result = correlation.spearman(us_data, ['R&D投入占GDP比例', 'AI模型数量', 'AI专利占比'])
+                correlation_matrix = spearman_result['corr']
                 
                 fig = px.imshow(
                     correlation_matrix,
@@ -638,25 +618,26 @@ def main():
                 fig.update_traces(text=correlation_matrix.round(3), texttemplate="%{text}")
                 fig.update_layout(height=500)
                 
-                st.plotly_chart(fig, use_container_width=True)
+                charts.plotly_chart(fig, use_container_width=True)
                 
                 # 时间序列预测
                 st.markdown("<h3 class='sub-header'>时间序列预测分析</h3>", unsafe_allow_html=True)
                 
-                def fit_arima_and_forecast(data, column, periods=3):
-                    model = ARIMA(data[column].values, order=(1,1,1))
-                    results = model.fit()
-                    forecast = results.forecast(steps=periods)
-                    return forecast
-                
-                # 对各指标进行预测
+                # 对各指标进行预测：三个指标并行拟合，结果按序列内容缓存，筛选年份不变时不会重新拟合
+                # 阶数搜索要为每个指标拟合一组候选模型，首次计算较慢，默认关闭
+                auto_order = st.checkbox("自动选择ARIMA阶数（按AIC）", value=False,
+                                         help="默认所有指标使用 ARIMA(1,1,1)；勾选后按 AIC 为每个指标搜索阶数（首次较慢，结果会缓存）")
+                indicators = ['R&D投入占GDP比例', 'AI模型数量', 'AI专利占比']
+                forecast_df = forecasting.forecast_many(
+                    {column: us_data[column].values for column in indicators},
+                    order=forecasting.AUTO_ORDER if auto_order else (1, 1, 1), steps=3
+                )
                 future_years = pd.DataFrame({'Year': range(2024, 2027)})
                 predictions = pd.DataFrame()
                 predictions['Year'] = future_years['Year']
                 
-                for column in ['R&D投入占GDP比例', 'AI模型数量', 'AI专利占比']:
-                    forecast = fit_arima_and_forecast(us_data, column)
-                    predictions[f'{column}_预测'] = forecast
+                for column in indicators:
+                    predictions[f'{column}_预测'] = forecast_df.loc[forecast_df['序列'] == column, '预测值'].to_numpy()
                 
                 # 绘制时间序列预测图
                 fig = go.Figure()
@@ -689,25 +670,24 @@ def main():
                     legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                charts.plotly_chart(fig, use_container_width=True)
                 
                 # 显示预测结果表格
                 st.markdown("<h3 class='sub-header'>未来三年预测结果</h3>", unsafe_allow_html=True)
                 st.dataframe(predictions.round(3), use_container_width=True)
+                chosen_orders = forecast_df.drop_duplicates('序列').set_index('序列')['阶数']
+                st.caption("使用的模型：" + "，".join(f"{column} ARIMA{chosen_orders[column]}" for column in indicators))
                 
                 # 显示详细的相关性分析
                 st.markdown("<h3 class='sub-header'>详细相关性分析</h3>", unsafe_allow_html=True)
                 
-                for var1 in ['R&D投入占GDP比例', 'AI模型数量', 'AI专利占比']:
-                    for var2 in ['R&D投入占GDP比例', 'AI模型数量', 'AI专利占比']:
-                        if var1 != var2:
-                            correlation, p_value = stats.spearmanr(us_data[var1], us_data[var2])
-                            st.markdown(f"""
-                            <div class="highlight">
-                                <p><strong>{var1}</strong> 与 <strong>{var2}</strong> 的斯皮尔曼相关系数: {correlation:.3f}</p>
-                                <p>p值: {p_value:.3f}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                for var1, var2, corr_value, p_value in correlation.pairs(spearman_result):
+                    st.markdown(f"""
+                    <div class="highlight">
+                        <p><strong>{var1}</strong> 与 <strong>{var2}</strong> 的斯皮尔曼相关系数: {corr_value:.3f}</p>
+                        <p>p值: {p_value:.3f}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
             
             else:
                 st.error("无法加载AI相关数据文件，请确保数据文件在正确的位置。")